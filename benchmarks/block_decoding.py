@@ -0,0 +1,220 @@
+"""
+Block decoding benchmark
+
+Compares decoding blocks through the era discriminated :data:`Block` union with a plain union
+that pydantic has to try member by member, with a :class:`LazyBlock` decoding the header only,
+with a :class:`HeaderRollForward` reading the header from the raw frame, and with a
+:class:`BlockFilter` screening the raw frame for an address, then a stake credential, it does not hold.
+Stake credentials also decode the addresses of the frame, so their screen is the slower one.
+The union and lazy timings start from parsed JSON, the header only and filter timings from the raw frame.
+
+Usage: python -m benchmarks.block_decoding [frames.jsonl]
+
+The optional file holds recorded ``RequestNext`` frames, one per line. Without it a synthetic
+Babbage block is used.
+"""
+import json
+import sys
+import timeit
+from typing import Any, Dict, List, Union
+
+from pydantic import TypeAdapter
+
+from pyogmios_client.models import (
+    Allegra,
+    Alonzo,
+    Babbage,
+    Block,
+    Byron,
+    Mary,
+    Shelley,
+)
+from pyogmios_client.models.header_model import HeaderRollForward
+from pyogmios_client.models.lazy_block_model import LazyBlock
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.block_filter import (
+    BlockFilter,
+)
+
+PlainBlock = Union[Babbage, Alonzo, Mary, Allegra, Shelley, Byron]
+
+
+def synthetic_block(transactions: int = 200) -> Dict[str, Any]:
+    """
+    Build a Babbage block.
+    :param transactions: The number of transactions in the block
+    :return: The raw block
+    """
+    address = "addr_test1vz09v9yfxguvlp0zsnrpa3tdtm7el8xufp3m5lsm7qxzclgmzkket"
+    body = [
+        {
+            "id": f"{index:064x}",
+            "inputSource": "inputs",
+            "body": {
+                "inputs": [{"txId": f"{index + 1:064x}", "index": 0}],
+                "references": [],
+                "collaterals": [],
+                "collateralReturn": None,
+                "totalCollateral": None,
+                "outputs": [
+                    {
+                        "address": address,
+                        "value": {"coins": 1000000, "assets": {}},
+                        "datumHash": None,
+                        "datum": None,
+                        "script": None,
+                    }
+                ],
+                "certificates": [],
+                "withdrawals": {},
+                "fee": 170000,
+                "validityInterval": {"invalidBefore": None, "invalidHereafter": None},
+                "update": None,
+                "mint": {"coins": 0, "assets": {}},
+                "network": None,
+                "scriptIntegrityHash": None,
+                "requiredExtraSignatures": [],
+            },
+            "witness": {
+                "signatures": {},
+                "scripts": {},
+                "bootstrap": [],
+                "datums": {},
+                "redeemers": {},
+            },
+            "metadata": None,
+            "raw": "84a400" * 50,
+        }
+        for index in range(transactions)
+    ]
+    return {
+        "babbage": {
+            "body": body,
+            "headerHash": "ab" * 32,
+            "header": {
+                "blockHeight": 1,
+                "slot": 1,
+                "prevHash": "cd" * 32,
+                "issuerVk": "8b0960d234bda67d52432c5d1a26aca2bfb5b9a09f966d9592a7bf0c728a1ecd",
+                "issuerVrf": "8oyOB8fTDPHv2rW5JJJRqEK/Ssr3lfJ01Ma+k4bP6Mw=",
+                "blockSize": 1024,
+                "blockHash": "ef" * 32,
+                "opCert": {
+                    "count": 1,
+                    "sigma": "c5a0ca",
+                    "kesPeriod": 200,
+                    "hotVk": "vIvzz1nzwdpaDa8yVdOZ3/cnfhFsMbbo+hyAYPXxtXI=",
+                },
+                "protocolVersion": {"major": 8, "minor": 0},
+                "signature": "c7gw",
+                "vrfInput": {"proof": "a0b1", "output": "c2d3"},
+            },
+        }
+    }
+
+
+def recorded_blocks(path: str) -> List[Dict[str, Any]]:
+    """
+    Read the blocks of recorded RequestNext frames.
+    :param path: The path of the frames, one per line
+    :return: The raw blocks
+    """
+    blocks = []
+    with open(path) as frames:
+        for frame in frames:
+            result = json.loads(frame).get("result", {})
+            if "RollForward" in result:
+                blocks.append(result["RollForward"]["block"])
+    return blocks
+
+
+def run(blocks: List[Dict[str, Any]], repeat: int = 5) -> Dict[str, float]:
+    """
+    Time the decoding of the blocks with each union.
+    :param blocks: The raw blocks
+    :param repeat: The number of timed runs, the best one is kept
+    :return: The seconds per block of each union
+    """
+    timings = {}
+    for name, union in (("plain union", PlainBlock), ("discriminated", Block)):
+        adapter = TypeAdapter(union)
+        best = min(
+            timeit.repeat(
+                lambda: [adapter.validate_python(block) for block in blocks],
+                number=1,
+                repeat=repeat,
+            )
+        )
+        timings[name] = best / len(blocks)
+    best = min(
+        timeit.repeat(
+            lambda: [LazyBlock.from_raw(block).point for block in blocks],
+            number=1,
+            repeat=repeat,
+        )
+    )
+    timings["lazy header"] = best / len(blocks)
+    frames = [
+        json.dumps(
+            {
+                "methodname": "RequestNext",
+                "result": {"RollForward": {"block": block, "tip": "origin"}},
+            }
+        )
+        for block in blocks
+    ]
+    best = min(
+        timeit.repeat(
+            lambda: [HeaderRollForward.from_message(frame) for frame in frames],
+            number=1,
+            repeat=repeat,
+        )
+    )
+    timings["header only"] = best / len(blocks)
+    block_filter = BlockFilter(addresses={"addr_test1unknown"})
+    best = min(
+        timeit.repeat(
+            lambda: [block_filter.may_match(frame) for frame in frames],
+            number=1,
+            repeat=repeat,
+        )
+    )
+    timings["filter screen"] = best / len(blocks)
+    credential_filter = BlockFilter(stake_credentials={"00" * 28})
+    best = min(
+        timeit.repeat(
+            lambda: [credential_filter.may_match(frame) for frame in frames],
+            number=1,
+            repeat=repeat,
+        )
+    )
+    timings["stake screen"] = best / len(blocks)
+    return timings
+
+
+def main() -> None:
+    """
+    Print the time per block of each union.
+    """
+    blocks = recorded_blocks(sys.argv[1]) if len(sys.argv) > 1 else []
+    blocks = blocks or [synthetic_block()] * 20
+    timings = run(blocks)
+    for name, seconds in timings.items():
+        print(f"{name:>14}: {seconds * 1000:.3f} ms/block")
+    print(f"{'speedup':>14}: {timings['plain union'] / timings['discriminated']:.2f}x")
+    print(
+        f"{'lazy speedup':>14}: {timings['discriminated'] / timings['lazy header']:.0f}x"
+    )
+    print(
+        f"{'header speedup':>14}: {timings['discriminated'] / timings['header only']:.0f}x"
+    )
+
+    print(
+        f"{'filter speedup':>14}: {timings['discriminated'] / timings['filter screen']:.0f}x"
+    )
+    print(
+        f"{'stake speedup':>14}: {timings['discriminated'] / timings['stake screen']:.0f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -23,8 +23,7 @@ async def main():
     interaction_context = await create_interaction_context(
         options=interaction_context_options
     )
-    # await asyncio.sleep(1)
-    # print(interaction_context.socket.sock.connected)
+    # print(interaction_context.socket.connected)
 
     def roll_backward_callback(
         roll_backward: RollBackward, callback: Callable[[], None]
@@ -24,8 +24,7 @@ async def main():
     interaction_context = await create_interaction_context(
         options=interaction_context_options
     )
-    # await asyncio.sleep(1)
-    # print(interaction_context.socket.sock.connected)
+    # print(interaction_context.socket.connected)
 
     tx_monitor_client = await create_tx_monitor_client(interaction_context)
 
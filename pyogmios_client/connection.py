@@ -4,21 +4,25 @@ Create a connection to the server.
 This module contains the classes and default functions to create a connection to the server.
 """
 import logging
-import threading
-from typing import Optional, Callable
-
-import websocket
-from websocket import WebSocketApp, enableTrace
+from typing import Optional, Callable, Awaitable, Coroutine, Any
 
 from pyogmios_client.enums import InteractionType
-from pyogmios_client.exceptions import ServerNotReady, WebSocketClosedError
+from pyogmios_client.exceptions import ServerNotReady
 from pyogmios_client.models.base_model import BaseModel
+from pyogmios_client.multiplexer import Multiplexer
 from pyogmios_client.server_health import (
     get_server_health,
     ConnectionConfig,
     Connection,
     Options as ServerHealthOptions,
 )
+from pyogmios_client.transport import (
+    Transport,
+    TransportFactory,
+    ErrorHandler,
+    CloseHandler,
+    connect_transport,
+)
 
 
 class InteractionContext(BaseModel):
@@ -27,12 +31,17 @@ class InteractionContext(BaseModel):
     """
 
     connection: Connection
-    socket: WebSocketApp
-    after_each: Callable[[WebSocketApp, Callable[[], None]], None]
+    socket: Transport
+    after_each: Callable[[Transport, Callable[[], None]], Optional[Awaitable[None]]]
     log_level: Optional[str] = "DEBUG"
+    multiplexer: Optional[Multiplexer] = None
+    lease: Optional[Callable[[], Coroutine[Any, Any, "InteractionContext"]]] = None
+    reconnect: Optional[Callable[[], Coroutine[Any, Any, None]]] = None
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        if self.multiplexer is None:
+            self.multiplexer = Multiplexer(self.socket)
         logging.basicConfig(format="%(levelname)s - %(message)s")
         logging.getLogger().setLevel(logging.getLevelName(self.log_level.upper()))
 
@@ -45,22 +54,24 @@ class InteractionContextOptions(BaseModel):
     connection_config: Optional[ConnectionConfig] = None
     interaction_type: Optional[InteractionType] = None
     log_level: Optional[str] = "DEBUG"
+    transport_factory: Optional[TransportFactory] = None
+    server_health_max_age: float = 5.0
 
 
-def default_error_handler(_: WebSocketApp, error: Exception):
+def default_error_handler(_: Transport, error: Exception):
     """
     Default error handler.
-    :param _: The websocket app
+    :param _: The transport
     :param error: The exception
     """
     logging.error(error)
     raise error
 
 
-def default_close_handler(_: WebSocketApp, close_status_code: int, close_msg: str):
+def default_close_handler(_: Transport, close_status_code: int, close_msg: str):
     """
     Default close handler.
-    :param _: The websocket app
+    :param _: The transport
     :param close_status_code: The close status code
     :param close_msg: The close message
     """
@@ -99,8 +110,8 @@ def create_connection_object(config: ConnectionConfig = None) -> Connection:
 
 
 async def create_interaction_context(
-    error_handler: Optional[Callable[[WebSocketApp, Exception], None]] = None,
-    close_handler: Optional[Callable[[WebSocketApp, int, str], None]] = None,
+    error_handler: Optional[ErrorHandler] = None,
+    close_handler: Optional[CloseHandler] = None,
     options: Optional[InteractionContextOptions] = None,
 ) -> InteractionContext | None:
     """
@@ -116,7 +127,12 @@ async def create_interaction_context(
 
     connection = create_connection_object(interaction_context_options.connection_config)
 
-    health = await get_server_health(ServerHealthOptions(connection=connection))
+    health = await get_server_health(
+        ServerHealthOptions(
+            connection=connection,
+            max_age=interaction_context_options.server_health_max_age,
+        )
+    )
 
     def close_on_completion() -> bool:
         """
@@ -129,76 +145,51 @@ async def create_interaction_context(
         if health.last_tip_update is None:
             raise ServerNotReady(health)
 
-        # Create an event to signal when the websocket is opened
-        websocket_opened = threading.Event()
-
-        def after_each(ws_app: WebSocketApp, callback: Callable[[], None]):
+        async def after_each(transport: Transport, callback: Callable[[], None]):
             """
             Callback to run after each.
-            :param ws_app: The websocket app
+            :param transport: The transport
             :param callback: The callback
             """
+            callback()
             if close_on_completion():
-                callback()
-                ws_app.close(
-                    status=websocket.STATUS_NORMAL, reason="Closed on completion"
-                )
-            else:
-                callback()
-
-        def on_initial_error(ws_app: WebSocketApp, error: Exception):
-            """
-            On initial error.
-            :param ws_app: The websocket app
-            :param error: The error
-            """
-            logging.error(error)
-            ws_app.close()
-            raise error
+                await transport.close(reason="Closed on completion")
 
-        def on_message_handler(ws_app, message):
-            """
-            On message.
-            :param ws_app: The websocket app
-            :param message: The message
-            """
-            if message == "error":
-                on_initial_error(ws_app, Exception(message))
-            elif message == "close":
-                raise WebSocketClosedError()
+        transport_factory = (
+            interaction_context_options.transport_factory or connect_transport
+        )
 
-        def on_open_handler(_: WebSocketApp):
+        async def open_transport() -> Transport:
             """
-            On open.
-            :param _: The websocket app
+            Open a socket to the server.
+            :return: The transport
             """
-            websocket_opened.set()
-
-        if interaction_context_options.log_level == "INFO":
-            enableTrace(True)
-
-        websocket_app = WebSocketApp(
-            connection.address.webSocket,
-            on_message=on_message_handler,
-            on_open=on_open_handler,
-            on_close=close_handler or default_close_handler,
-            on_error=error_handler or default_error_handler,
-        )
-
-        websocket_thread = threading.Thread(target=websocket_app.run_forever)
-        websocket_thread.daemon = True
-        websocket_thread.start()
-
-        if not websocket_opened.is_set():
-            websocket_opened.wait()
-
-        return InteractionContext(
+            return await transport_factory(
+                connection.address.webSocket,
+                connection.max_payload,
+                error_handler=error_handler or default_error_handler,
+                close_handler=close_handler or default_close_handler,
+                trace=interaction_context_options.log_level == "INFO",
+            )
+
+        interaction_context = InteractionContext(
             connection=connection,
-            socket=websocket_app,
+            socket=await open_transport(),
             after_each=after_each,
             log_level=interaction_context_options.log_level,
         )
 
+        async def reconnect() -> None:
+            """
+            Replace the socket of the context with a new one.
+            """
+            transport = await open_transport()
+            interaction_context.socket = transport
+            interaction_context.multiplexer = Multiplexer(transport)
+
+        interaction_context.reconnect = reconnect
+        return interaction_context
+
     except ServerNotReady as e:
         logging.error(e)
         return None
@@ -0,0 +1,265 @@
+"""
+Connection pool module
+
+This module contains the pool spreading requests over several connections to the same server.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Callable, Dict, List, Optional
+
+from aiohttp import WSCloseCode
+
+from pyogmios_client.connection import (
+    InteractionContext,
+    InteractionContextOptions,
+    create_interaction_context,
+)
+from pyogmios_client.enums import InteractionType
+from pyogmios_client.exceptions import PyOgmiosError, WebSocketClosedError
+from pyogmios_client.models.base_request_response_model import BaseRequestResponse
+from pyogmios_client.multiplexer import Multiplexer, MessageListener
+from pyogmios_client.transport import Transport, ErrorHandler, CloseHandler
+
+
+class LeasedTransport(Transport):
+    """
+    Transport of a connection leased to one client. Closing it closes the connection and ends the lease.
+    """
+
+    def __init__(self, socket: Transport, on_close: Callable[[], None]):
+        self._socket = socket
+        self._on_close = on_close
+
+    @property
+    def connected(self) -> bool:
+        return self._socket.connected
+
+    async def send(self, message: str) -> None:
+        await self._socket.send(message)
+
+    async def receive(self) -> str:
+        return await self._socket.receive()
+
+    async def close(self, code: int = WSCloseCode.OK, reason: str = "") -> None:
+        self._on_close()
+        await self._socket.close(code, reason)
+
+
+class PoolTransport(Transport):
+    """
+    Transport of the pooled interaction context. It is open while any connection of the pool is.
+    """
+
+    def __init__(self, pool: ConnectionPool):
+        self._pool = pool
+
+    @property
+    def connected(self) -> bool:
+        return any(context.socket.connected for context in self._pool.contexts)
+
+    async def send(self, message: str) -> None:
+        raise PyOgmiosError("A pooled context only sends through its multiplexer")
+
+    async def receive(self) -> str:
+        raise PyOgmiosError("A pooled context only receives through its multiplexer")
+
+    async def close(self, code: int = WSCloseCode.OK, reason: str = "") -> None:
+        pass
+
+
+class PoolMultiplexer(Multiplexer):
+    """
+    Multiplexer of the pooled interaction context, sending each request on the least loaded connection.
+    """
+
+    def __init__(self, pool: ConnectionPool):
+        super().__init__(PoolTransport(pool))
+        self._pool = pool
+
+    @property
+    def in_flight(self) -> int:
+        return sum(context.multiplexer.in_flight for context in self._pool.contexts)
+
+    def listen(self, listener: Optional[MessageListener]) -> None:
+        raise PyOgmiosError("Chain sync needs a dedicated interaction context")
+
+    async def request(self, request: BaseRequestResponse) -> str:
+        context = await self._pool.acquire()
+        return await context.multiplexer.request(request)
+
+    async def close(self) -> None:
+        pass
+
+
+class ConnectionPool:
+    """
+    Pool of interaction contexts connected to the same server.
+
+    Stateless requests sent through :attr:`context` go to the connection with the fewest requests
+    in flight. Stateful sessions (acquired ledger states, mempool snapshots) lease a dedicated
+    connection, outside of the pool, so no stateless request is answered from their state. The
+    lease ends when the client closes its socket, e.g. on shutdown. Closed connections are
+    replaced in the background.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        options: InteractionContextOptions,
+        error_handler: Optional[ErrorHandler] = None,
+        close_handler: Optional[CloseHandler] = None,
+    ):
+        if size < 1:
+            raise ValueError("A connection pool needs at least one connection")
+        self.size = size
+        self.contexts: List[InteractionContext] = []
+        self.leases: List[InteractionContext] = []
+        self._options = options
+        self._error_handler = error_handler
+        self._close_handler = close_handler
+        self._replacements: Dict[int, asyncio.Task] = {}
+        self._closed = False
+        self.context: Optional[InteractionContext] = None
+
+    async def open(self) -> ConnectionPool:
+        """
+        Open the connections of the pool.
+        :return: The pool
+        """
+        contexts = await asyncio.gather(
+            *(self._create_context() for _ in range(self.size))
+        )
+        self.contexts = [context for context in contexts if context is not None]
+        if not self.contexts:
+            raise WebSocketClosedError()
+        self.size = len(self.contexts)
+        first = self.contexts[0]
+        self.context = InteractionContext(
+            connection=first.connection,
+            socket=PoolTransport(self),
+            after_each=lambda _, callback: callback(),
+            log_level=first.log_level,
+            multiplexer=PoolMultiplexer(self),
+            lease=self.lease,
+        )
+        return self
+
+    async def acquire(self) -> InteractionContext:
+        """
+        Get the open connection with the fewest requests in flight.
+        :return: The interaction context of the connection
+        """
+        if self._closed:
+            raise WebSocketClosedError()
+        for index, context in enumerate(self.contexts):
+            if not context.socket.connected:
+                self._replace(index)
+        healthy = [context for context in self.contexts if context.socket.connected]
+        if not healthy:
+            await asyncio.gather(*self._replacements.values())
+            healthy = [context for context in self.contexts if context.socket.connected]
+            if not healthy:
+                raise WebSocketClosedError()
+        return min(healthy, key=lambda context: context.multiplexer.in_flight)
+
+    async def lease(self) -> InteractionContext:
+        """
+        Open a connection for a client keeping state on the server, closed with the pool.
+        :return: An interaction context bound to the connection
+        """
+        if self._closed:
+            raise WebSocketClosedError()
+        context = await self._create_context()
+        if context is None:
+            raise WebSocketClosedError()
+        self.leases.append(context)
+        return InteractionContext(
+            connection=context.connection,
+            socket=LeasedTransport(context.socket, lambda: self._end_lease(context)),
+            after_each=lambda _, callback: callback(),
+            log_level=context.log_level,
+            multiplexer=context.multiplexer,
+        )
+
+    async def close(self) -> None:
+        """
+        Close every connection of the pool.
+        """
+        self._closed = True
+        for task in self._replacements.values():
+            task.cancel()
+        leases, self.leases = self.leases, []
+        await asyncio.gather(
+            *(self._close_context(context) for context in self.contexts + leases),
+            return_exceptions=True,
+        )
+
+    @staticmethod
+    async def _close_context(context: InteractionContext) -> None:
+        """
+        Close a connection and stop reading from it.
+        :param context: The interaction context of the connection
+        """
+        await context.socket.close()
+        await context.multiplexer.close()
+
+    def _end_lease(self, context: InteractionContext) -> None:
+        """
+        Forget a leased connection.
+        :param context: The interaction context of the connection
+        """
+        self.leases = [lease for lease in self.leases if lease is not context]
+
+    async def _create_context(self) -> Optional[InteractionContext]:
+        """
+        Open one connection of the pool.
+        :return: The interaction context or None if the server is not ready
+        """
+        return await create_interaction_context(
+            self._error_handler, self._close_handler, self._options
+        )
+
+    def _replace(self, index: int) -> None:
+        """
+        Replace a closed connection in the background.
+        :param index: The index of the connection
+        """
+        if index in self._replacements:
+            return
+
+        async def replace() -> None:
+            """
+            Open a new connection in place of the closed one.
+            """
+            try:
+                context = await self._create_context()
+                if context is not None and not self._closed:
+                    self.contexts[index] = context
+            except Exception as error:
+                logging.error(error)
+            finally:
+                self._replacements.pop(index, None)
+
+        self._replacements[index] = asyncio.ensure_future(replace())
+
+
+async def create_connection_pool(
+    size: int = 4,
+    error_handler: Optional[ErrorHandler] = None,
+    close_handler: Optional[CloseHandler] = None,
+    options: Optional[InteractionContextOptions] = None,
+) -> ConnectionPool:
+    """
+    Create a connection pool. Its connections are long running whatever the interaction type given.
+    :param size: The number of connections
+    :param error_handler: The error handler
+    :param close_handler: The close handler
+    :param options: The :class:`InteractionContextOptions` object
+    :return: The :class:`ConnectionPool` object
+    """
+    pool_options = (options or InteractionContextOptions()).model_copy(
+        update={"interaction_type": InteractionType.LONG_RUNNING}
+    )
+    return await ConnectionPool(size, pool_options, error_handler, close_handler).open()
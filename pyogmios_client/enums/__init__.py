@@ -6,6 +6,12 @@ class AcquireFailureDetails(Enum):
     POINT_NOT_ON_CHAIN = "pointNotOnChain"
 
 
+class CacheScope(Enum):
+    FOREVER = "forever"
+    EPOCH = "epoch"
+    TTL = "ttl"
+
+
 class InputSource(Enum):
     INPUTS = "inputs"
     COLLATERALS = "collaterals"
@@ -45,6 +51,12 @@ class NonceEnum(Enum):
     NEUTRAL = "neutral"
 
 
+class OverflowPolicy(Enum):
+    BLOCK = "block"
+    DROP_OLDEST = "dropOldest"
+    DISCONNECT = "disconnect"
+
+
 # class Origin(Enum):
 #     ORIGIN = 'origin'
 class Origin(Enum):
@@ -69,6 +69,28 @@ class TipIsOriginError(Exception):
         super().__init__(self.message)
 
 
+class RollbackTooDeepError(Exception):
+    """
+    Rollback too deep error exception
+    """
+
+    def __init__(self, point: PointOrOrigin):
+        self.point = point
+        self.message = f"Unable to roll back to {point.model_dump_json()}, it is older than the undo log"
+        super().__init__(self.message)
+
+
+class SubscriberOverflowError(Exception):
+    """
+    Subscriber overflow error exception
+    """
+
+    def __init__(self, buffer_size: int):
+        self.buffer_size = buffer_size
+        self.message = f"Subscriber disconnected, it fell {buffer_size} events behind"
+        super().__init__(self.message)
+
+
 class WebSocketClosedError(Exception):
     """
     WebSocket closed error exception
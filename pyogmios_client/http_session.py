@@ -0,0 +1,82 @@
+"""
+HTTP session module
+
+This module contains the client session shared by the health checks and sockets of the client.
+"""
+import asyncio
+from typing import AsyncGenerator, Dict, Tuple
+
+from aiohttp import ClientSession, TCPConnector
+
+# The session of each event loop, with the async generator closing it when the loop shuts down
+_sessions: Dict[
+    asyncio.AbstractEventLoop, Tuple[ClientSession, AsyncGenerator[None, None]]
+] = {}
+
+
+def get_session() -> ClientSession:
+    """
+    Get the client session of the running event loop, creating it on first use.
+    The session lives as long as the loop, so sequential requests reuse its connections and
+    DNS cache, while its connector drops the connections left idle past their keep alive.
+    It is closed when the loop shuts down its async generators, as ``asyncio.run`` does,
+    or by :func:`close_session`.
+    :return: The client session
+    """
+    loop = asyncio.get_running_loop()
+    _forget_closed_loops()
+    entry = _sessions.get(loop)
+    if entry is None or entry[0].closed:
+        session = ClientSession(connector=TCPConnector(limit=0))
+        keeper = _close_at_shutdown(loop, session)
+        # Run it to its first yield, the loop tracks it from there like any async generator
+        _step(keeper.asend(None))
+        entry = _sessions[loop] = (session, keeper)
+    return entry[0]
+
+
+async def close_session() -> None:
+    """
+    Close the client session of the running event loop, for loops that are closed without
+    shutting down their async generators.
+    """
+    entry = _sessions.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        await entry[1].aclose()
+
+
+async def _close_at_shutdown(
+    loop: asyncio.AbstractEventLoop, session: ClientSession
+) -> AsyncGenerator[None, None]:
+    """
+    Hold the client session of a loop open until the generator is closed.
+    :param loop: The event loop
+    :param session: The client session
+    :return: Nothing, once
+    """
+    try:
+        yield
+    finally:
+        if _sessions.get(loop, (None,))[0] is session:
+            del _sessions[loop]
+        await session.close()
+
+
+def _forget_closed_loops() -> None:
+    """
+    Drop the sessions of the loops closed without closing them.
+    """
+    for loop in [loop for loop in _sessions if loop.is_closed()]:
+        # Finished here, as the closed loop cannot run its finalizer
+        _step(_sessions[loop][1].aclose())
+
+
+def _step(awaitable) -> None:
+    """
+    Run a coroutine that does not suspend to its end.
+    :param awaitable: The coroutine
+    """
+    try:
+        awaitable.send(None)
+    except StopIteration:
+        pass
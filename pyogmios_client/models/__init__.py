@@ -5,7 +5,16 @@ from enum import Enum
 from types import UnionType
 from typing import Optional, Dict, List, Union
 
-from pydantic import conint, Field, constr, confloat, AnyUrl, RootModel
+from pydantic import (
+    conint,
+    Field,
+    constr,
+    confloat,
+    AnyUrl,
+    RootModel,
+    Discriminator,
+    Tag,
+)
 from typing_extensions import Annotated, Literal
 
 from pyogmios_client.enums import (
@@ -775,12 +784,12 @@ class ProtocolParametersShelley(BaseModel):
 
 class Allegra(BaseModel):
     allegra: BlockAllegra
-    block_type: Literal["allegra"]
+    block_type: Literal["allegra"] = "allegra"
 
 
 class Alonzo(BaseModel):
     alonzo: BlockAlonzo
-    block_type: Literal["alonzo"]
+    block_type: Literal["alonzo"] = "alonzo"
 
 
 class AuxiliaryData(BaseModel):
@@ -795,7 +804,7 @@ class AuxiliaryDataBody(BaseModel):
 
 class Babbage(BaseModel):
     babbage: BlockBabbage
-    block_type: Literal["babbage"]
+    block_type: Literal["babbage"] = "babbage"
 
 
 class BlockAllegra(BaseModel):
@@ -841,7 +850,7 @@ class BlockSignature(BaseModel):
 
 class Byron(BaseModel):
     byron: BlockByron
-    block_type: Literal["byron"]
+    block_type: Literal["byron"] = "byron"
 
 
 class EpochBoundaryBlock(BaseModel):
@@ -877,7 +886,7 @@ class Vote(BaseModel):
 
 class Mary(BaseModel):
     mary: BlockMary
-    block_type: Literal["mary"]
+    block_type: Literal["mary"] = "mary"
 
 
 class Point(BaseModel):
@@ -902,7 +911,7 @@ class RollForward(BaseModel):
 
 class Shelley(BaseModel):
     shelley: BlockShelley
-    block_type: Literal["shelley"]
+    block_type: Literal["shelley"] = "shelley"
 
 
 class StandardBlock(BaseModel):
@@ -1150,7 +1159,36 @@ class Witness(BaseModel):
     redeemers: Optional[Dict[str, Redeemer]]
 
 
-Block = Union[Babbage, Alonzo, Mary, Allegra, Shelley, Byron]
+BLOCK_ERAS = ("babbage", "alonzo", "mary", "allegra", "shelley", "byron")
+
+
+def block_era(block: object) -> Optional[str]:
+    """
+    Find the era of a block from the key wrapping it, so it is validated by that era's model only.
+    :param block: The raw block or a block model
+    :return: The era or None if the block has no era key
+    """
+    if isinstance(block, dict):
+        if "block_type" in block:
+            return block["block_type"]
+        for key in block:
+            if key in BLOCK_ERAS:
+                return key
+        return None
+    return getattr(block, "block_type", None)
+
+
+Block = Annotated[
+    Union[
+        Annotated[Babbage, Tag("babbage")],
+        Annotated[Alonzo, Tag("alonzo")],
+        Annotated[Mary, Tag("mary")],
+        Annotated[Allegra, Tag("allegra")],
+        Annotated[Shelley, Tag("shelley")],
+        Annotated[Byron, Tag("byron")],
+    ],
+    Discriminator(block_era),
+]
 
 BlockByron = Union[StandardBlock, EpochBoundaryBlock]
 
@@ -0,0 +1,156 @@
+"""
+Header model module
+
+This module contains the compact block headers decoded by a header only chain sync.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Optional
+
+from pydantic import TypeAdapter
+
+from pyogmios_client.models import BLOCK_ERAS, Point, TipOrOrigin, block_era
+from pyogmios_client.models.base_model import BaseModel
+
+TIP_ADAPTER = TypeAdapter(TipOrOrigin)
+ERA_SEARCH_LENGTH = 256
+WHITESPACE = " \t\n\r"
+
+decoder = json.JSONDecoder()
+
+
+class CompactHeader(BaseModel):
+    """
+    The identifying fields of a block header
+    """
+
+    block_type: str
+    hash: str
+    slot: Optional[int] = None
+    block_no: int
+    issuer_vk: Optional[str] = None
+
+    @property
+    def point(self) -> Optional[Point]:
+        """
+        The point of the block.
+        :return: The point or None for a Byron epoch boundary block
+        """
+        if self.slot is None:
+            return None
+        return Point(slot=self.slot, hash=self.hash)
+
+
+class HeaderRollForward(BaseModel):
+    """
+    Roll forward carrying the compact header of the block only
+    """
+
+    header: CompactHeader
+    tip: TipOrOrigin
+
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any]) -> HeaderRollForward:
+        """
+        Decode a raw roll forward, dropping the block body.
+        :param raw: The raw roll forward
+        :return: The :class:`HeaderRollForward` object
+        """
+        block = raw["block"]
+        era = block_era(block)
+        if era is None:
+            raise ValueError(f"Unknown block era: {list(block)}")
+        era_block = block[era]
+        header_hash = era_block["hash"] if era == "byron" else era_block["headerHash"]
+        return cls.from_header(era, era_block["header"], header_hash, raw["tip"])
+
+    @classmethod
+    def from_message(cls, message: str) -> HeaderRollForward:
+        """
+        Decode the header of a RollForward message without decoding the block body.
+        Ogmios writes the body of Shelley and later blocks before their header, so the header,
+        its hash and the tip are read from the tail of the frame. Other frames are fully decoded.
+        :param message: The raw RequestNext message
+        :return: The :class:`HeaderRollForward` object
+        """
+        era = peek_block_era(message)
+        if era is not None and era != "byron":
+            try:
+                tip_at = message.rindex('"tip"')
+                return cls.from_header(
+                    era,
+                    value_after(message, '"header"', tip_at),
+                    value_after(message, '"headerHash"', tip_at),
+                    value_after(message, '"tip"', len(message)),
+                )
+            except (ValueError, KeyError, TypeError, AttributeError):
+                pass
+        return cls.from_raw(json.loads(message)["result"]["RollForward"])
+
+    @classmethod
+    def from_header(
+        cls, era: str, header: Dict[str, Any], header_hash: str, tip: Any
+    ) -> HeaderRollForward:
+        """
+        Build a roll forward from the raw header of a block.
+        :param era: The era of the block
+        :param header: The raw header
+        :param header_hash: The hash of the header
+        :param tip: The raw tip
+        :return: The :class:`HeaderRollForward` object
+        """
+        return cls(
+            header=CompactHeader(
+                block_type=era,
+                hash=header_hash,
+                slot=header.get("slot"),
+                block_no=header["blockHeight"],
+                issuer_vk=header.get("issuerVk", header.get("genesisKey")),
+            ),
+            tip=TIP_ADAPTER.validate_python(tip),
+        )
+
+
+def is_roll_forward(message: str) -> bool:
+    """
+    Whether a RequestNext message rolls forward, read from the head of the frame.
+    :param message: The raw message
+    :return: True for a RollForward message
+    """
+    return message.find('"RollForward"', 0, ERA_SEARCH_LENGTH) != -1
+
+
+def peek_block_era(message: str) -> Optional[str]:
+    """
+    Read the era of the block of a RollForward message from the head of the frame.
+    :param message: The raw message
+    :return: The era or None if it is not found
+    """
+    index = message.find('"block"', 0, ERA_SEARCH_LENGTH)
+    if index == -1:
+        return None
+    start = message.find('"', message.find("{", index) + 1)
+    end = message.find('"', start + 1)
+    era = message[start + 1 : end]
+    return era if era in BLOCK_ERAS else None
+
+
+def value_after(message: str, key: str, end: int) -> Any:
+    """
+    Decode the value of the last occurrence of a key before a position.
+    :param message: The raw message
+    :param key: The quoted key
+    :param end: The position to search before
+    :return: The decoded value
+    """
+    index = message.rindex(key, 0, end) + len(key)
+    while message[index] in WHITESPACE:
+        index += 1
+    if message[index] != ":":
+        raise ValueError(f"No value for {key}")
+    index += 1
+    while message[index] in WHITESPACE:
+        index += 1
+    value, _ = decoder.raw_decode(message, index)
+    return value
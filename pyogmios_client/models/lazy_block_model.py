@@ -0,0 +1,143 @@
+"""
+Lazy block model module
+
+This module contains the block models decoding headers eagerly and transactions on first access.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Union
+
+from pydantic import PrivateAttr, TypeAdapter
+
+from pyogmios_client.models import (
+    Block,
+    BlockAllegra,
+    BlockAlonzo,
+    BlockBabbage,
+    BlockMary,
+    BlockShelley,
+    DigestBlake2bBlockHeader,
+    EpochBoundaryBlockHeader,
+    Header,
+    Point,
+    StandardBlockBody,
+    StandardBlockHeader,
+    TipOrOrigin,
+    block_era,
+)
+from pyogmios_client.models.base_model import BaseModel
+
+BODY_ADAPTERS = {
+    era: TypeAdapter(model.model_fields["body"].annotation)
+    for era, model in (
+        ("babbage", BlockBabbage),
+        ("alonzo", BlockAlonzo),
+        ("mary", BlockMary),
+        ("allegra", BlockAllegra),
+        ("shelley", BlockShelley),
+    )
+}
+BODY_ADAPTERS["byron"] = TypeAdapter(StandardBlockBody)
+BLOCK_ADAPTER = TypeAdapter(Block)
+
+
+class LazyBlock(BaseModel):
+    """
+    Block whose header is decoded right away and whose body is decoded on first access
+    """
+
+    block_type: str
+    header_hash: DigestBlake2bBlockHeader
+    header: Union[Header, StandardBlockHeader, EpochBoundaryBlockHeader]
+    _raw: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    _body: Any = PrivateAttr(default=None)
+
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any]) -> LazyBlock:
+        """
+        Decode the header of a raw block.
+        :param raw: The raw block, wrapped in its era key
+        :return: The :class:`LazyBlock` object
+        """
+        era = block_era(raw)
+        if era is None:
+            raise ValueError(f"Unknown block era: {list(raw)}")
+        era_block = raw[era]
+        if era == "byron":
+            header_model = (
+                StandardBlockHeader if "body" in era_block else EpochBoundaryBlockHeader
+            )
+            header_hash = era_block["hash"]
+        else:
+            header_model = Header
+            header_hash = era_block["headerHash"]
+        block = cls.model_construct(
+            block_type=era,
+            header_hash=DigestBlake2bBlockHeader.model_validate(header_hash),
+            header=header_model.model_validate(era_block["header"]),
+        )
+        block._raw = raw
+        return block
+
+    @property
+    def slot(self) -> Optional[int]:
+        """
+        The slot of the block.
+        :return: The slot or None for a Byron epoch boundary block
+        """
+        return getattr(self.header, "slot", None)
+
+    @property
+    def point(self) -> Optional[Point]:
+        """
+        The point of the block.
+        :return: The point or None for a Byron epoch boundary block
+        """
+        if self.slot is None:
+            return None
+        return Point(slot=self.slot, hash=self.header_hash)
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """
+        The raw block, wrapped in its era key.
+        :return: The raw block
+        """
+        return self._raw
+
+    @property
+    def body(self) -> Any:
+        """
+        The body of the block, decoded on first access.
+        :return: The transactions, the Byron body or None for a Byron epoch boundary block
+        """
+        if self._body is None:
+            raw_body = self._raw[self.block_type].get("body")
+            if raw_body is not None:
+                self._body = BODY_ADAPTERS[self.block_type].validate_python(raw_body)
+        return self._body
+
+    def decode(self) -> Block:
+        """
+        Decode the whole block.
+        :return: The block
+        """
+        return BLOCK_ADAPTER.validate_python(self._raw)
+
+
+class LazyRollForward(BaseModel):
+    """
+    Roll forward whose block is a :class:`LazyBlock`
+    """
+
+    block: LazyBlock
+    tip: TipOrOrigin
+
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any]) -> LazyRollForward:
+        """
+        Decode a raw roll forward.
+        :param raw: The raw roll forward
+        :return: The :class:`LazyRollForward` object
+        """
+        return cls(block=LazyBlock.from_raw(raw["block"]), tip=raw["tip"])
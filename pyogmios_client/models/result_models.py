@@ -1,6 +1,6 @@
 from typing import List, Union, Optional, Dict
 
-from pydantic import RootModel, Field, model_validator
+from pydantic import RootModel, Field
 
 from pyogmios_client.enums import AcquireFailureDetails
 from pyogmios_client.models import (
@@ -78,7 +78,6 @@ from pyogmios_client.models import (
     SubmitTxErrorInvalidWitnesses,
     SubmitTxErrorEraMismatch,
     EraMismatch,
-    Any,
 )
 from pyogmios_client.models.base_model import BaseModel
 
@@ -126,31 +125,9 @@ class RollBackward(BaseModel):
 
 
 class RollForward(BaseModel):
-    block: Block = Field(discriminator="block_type")
+    block: Block
     tip: TipOrOrigin
 
-    @model_validator(mode="before")
-    @classmethod
-    def block_type_coerce(cls, data: Any) -> Any:
-        if data["tip"] == "origin":
-            return data
-        block_keys = set(data["block"].keys())
-
-        if "babbage" in block_keys:
-            data["block"]["block_type"] = "babbage"
-        elif "alonzo" in block_keys:
-            data["block"]["block_type"] = "alonzo"
-        elif "allegra" in block_keys:
-            data["block"]["block_type"] = "allegra"
-        elif "mary" in block_keys:
-            data["block"]["block_type"] = "mary"
-        elif "shelley" in block_keys:
-            data["block"]["block_type"] = "shelley"
-        elif "byron" in block_keys:
-            data["block"]["block_type"] = "byron"
-
-        return data
-
 
 class RollBackwardResult(BaseModel):
     roll_backward: RollBackward = Field(alias="RollBackward")
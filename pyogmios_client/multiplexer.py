@@ -0,0 +1,224 @@
+"""
+Request multiplexer module
+
+This module contains the multiplexer that lets many requests share one socket.
+"""
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from nanoid import generate
+
+from pyogmios_client.exceptions import PyOgmiosError
+from pyogmios_client.models.base_request_response_model import BaseRequestResponse
+from pyogmios_client.transport import Transport
+
+MessageListener = Callable[[str], Optional[Awaitable[None]]]
+
+METHOD_NAME_SEARCH_LENGTH = 256
+
+
+def with_request_id(mirror: Any) -> Tuple[str, Dict[str, Any]]:
+    """
+    Make sure a mirror carries a request id.
+    :param mirror: The mirror of the request
+    :return: The request id and the mirror carrying it
+    """
+    if isinstance(mirror, dict) and "requestId" in mirror:
+        return str(mirror["requestId"]), mirror
+    request_id = generate(size=5)
+    if mirror is None:
+        return request_id, {"requestId": request_id}
+    if isinstance(mirror, dict):
+        return request_id, {**mirror, "requestId": request_id}
+    return request_id, {"mirror": mirror, "requestId": request_id}
+
+
+def peek_request_id(message: str) -> Optional[str]:
+    """
+    Read the request id mirrored in a message without decoding the whole message.
+    Ogmios writes the reflection last, so only the tail of the frame is parsed.
+    :param message: The raw message
+    :return: The request id or None if the message has no reflection
+    """
+    index = message.rfind('"reflection"')
+    if index == -1:
+        return None
+    try:
+        reflection = json.loads("{" + message[index:].rstrip()[:-1] + "}")["reflection"]
+    except ValueError:
+        try:
+            reflection = json.loads(message).get("reflection")
+        except (ValueError, AttributeError):
+            return None
+    if isinstance(reflection, dict) and "requestId" in reflection:
+        return str(reflection["requestId"])
+    return None
+
+
+def peek_method_name(message: str) -> Optional[str]:
+    """
+    Read the method name of a message without decoding the whole message.
+    Ogmios writes the envelope before the result, so only the head of the frame is searched.
+    :param message: The raw message
+    :return: The method name or None if the message has none
+    """
+    index = message.find('"methodname"', 0, METHOD_NAME_SEARCH_LENGTH)
+    if index != -1:
+        start = message.find('"', message.find(":", index) + 1)
+        end = message.find('"', start + 1)
+        if start != -1 and end != -1:
+            return message[start + 1 : end]
+    try:
+        method_name = json.loads(message).get("methodname")
+    except (ValueError, AttributeError):
+        return None
+    return method_name if isinstance(method_name, str) else None
+
+
+class Multiplexer:
+    """
+    Routes the messages of one socket to the requests waiting for them.
+
+    Every request is sent with a ``requestId`` in its mirror and gets the message reflecting it.
+    Messages without a request id go to the listener, or to the oldest request in flight when
+    nothing listens, since Ogmios replies to a socket in order.
+    """
+
+    def __init__(self, socket: Transport):
+        self._socket = socket
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._listener: Optional[MessageListener] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._closed: Optional[asyncio.Future] = None
+
+    @property
+    def in_flight(self) -> int:
+        """
+        The number of requests waiting for a response.
+        :return: The number of requests
+        """
+        return len(self._pending)
+
+    def listen(self, listener: Optional[MessageListener]) -> None:
+        """
+        Set the listener receiving the messages no request is waiting for.
+        :param listener: The listener, may be a coroutine function
+        """
+        self._listener = listener
+        if listener is not None:
+            self._ensure_reader()
+
+    async def request(self, request: BaseRequestResponse) -> str:
+        """
+        Send a request and wait for its response.
+        :param request: The request, its mirror is given a request id when missing
+        :return: The raw response
+        """
+        request_id, mirror = with_request_id(getattr(request, "mirror", None))
+        if request_id in self._pending:
+            raise PyOgmiosError(f"Request id {request_id} is already in flight")
+        request.mirror = mirror
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            self._ensure_reader()
+            await self._socket.send(request.model_dump_json())
+            return await future
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def wait_closed(self) -> Exception:
+        """
+        Wait until the socket stops delivering messages.
+        :return: The error the socket failed with
+        """
+        return await asyncio.shield(self._closed_future())
+
+    async def close(self) -> None:
+        """
+        Stop reading and fail the requests still in flight.
+        """
+        reader, self._reader = self._reader, None
+        if reader is not None:
+            reader.cancel()
+            # Closed from a listener, the reader is the current task and ends once it returns
+            if reader is not asyncio.current_task():
+                await asyncio.gather(reader, return_exceptions=True)
+        self._fail_pending()
+
+    def _ensure_reader(self) -> None:
+        """
+        Start the reader task if it is not running.
+        """
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.ensure_future(self._read())
+
+    def _route(self, message: str) -> Optional[asyncio.Future]:
+        """
+        Find the request waiting for a message.
+        :param message: The raw message
+        :return: The future of the request or None
+        """
+        request_id = peek_request_id(message)
+        if request_id is not None:
+            return self._pending.pop(request_id, None)
+        if self._listener is None and self._pending:
+            return self._pending.pop(next(iter(self._pending)))
+        return None
+
+    async def _read(self) -> None:
+        """
+        Read messages until the socket closes and route them.
+        """
+        try:
+            while True:
+                message = await self._socket.receive()
+                future = self._route(message)
+                if future is not None:
+                    if not future.done():
+                        future.set_result(message)
+                elif self._listener is not None:
+                    try:
+                        outcome = self._listener(message)
+                        if inspect.isawaitable(outcome):
+                            await outcome
+                    except Exception as error:
+                        logging.error(error)
+                else:
+                    logging.warning("Dropping message no request is waiting for")
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            self._fail_pending(error)
+            closed = self._closed_future()
+            if not closed.done():
+                closed.set_result(error)
+
+    def _closed_future(self) -> asyncio.Future:
+        """
+        Get the future resolved when the socket fails.
+        :return: The future
+        """
+        if self._closed is None:
+            self._closed = asyncio.get_running_loop().create_future()
+        return self._closed
+
+    def _fail_pending(self, error: Optional[Exception] = None) -> None:
+        """
+        Fail every request in flight.
+        :param error: The error to raise in the requests, they are cancelled if omitted
+        """
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if future.done():
+                continue
+            if error is None:
+                future.cancel()
+            else:
+                future.set_exception(error)
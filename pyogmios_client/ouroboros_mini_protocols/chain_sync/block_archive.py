@@ -0,0 +1,392 @@
+"""
+Block archive module
+
+This module contains the on-disk block archive written from chain sync, with memory-mapped indexes by slot and hash.
+"""
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from typing import Iterator, List, Optional, Tuple
+
+from pyogmios_client.models.header_model import HeaderRollForward, is_roll_forward
+from pyogmios_client.models.lazy_block_model import LazyRollForward
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.frame_archive import Recorder
+
+DATA_FILE = "blocks.dat"
+SLOT_INDEX_FILE = "slots.idx"
+HASH_INDEX_FILE = "hashes.idx"
+
+# number of live slot records, at the start of the slot index
+HEADER = struct.Struct("<Q")
+# slot, offset of the frame in the data file, length of the frame, header hash
+RECORD = struct.Struct("<QQI32s")
+BUCKET = struct.Struct("<I")
+EMPTY = 0
+TOMBSTONE = 0xFFFFFFFF
+INITIAL_BUCKETS = 1024
+MAX_LOAD = 0.5
+
+
+def bucket_of(header_hash: bytes, buckets: int) -> int:
+    """
+    Get the first bucket to probe for a header hash. Hashes are uniform, so their last bytes will do.
+    :param header_hash: The header hash
+    :param buckets: The number of buckets, a power of two
+    :return: The bucket
+    """
+    return int.from_bytes(header_hash[-8:], "big") & (buckets - 1)
+
+
+def record_count(index: mmap.mmap | bytes) -> int:
+    """
+    Get the number of live records of a slot index, records past it were rolled back.
+    :param index: The slot index
+    :return: The number of records
+    """
+    if len(index) < HEADER.size:
+        return 0
+    return min(
+        HEADER.unpack_from(index, 0)[0], (len(index) - HEADER.size) // RECORD.size
+    )
+
+
+class MappedFile:
+    """
+    Read only memory map of a file, mapped again when the file grows or is replaced.
+    The files of an archive are never shrunk in place, so a map stays valid while it is read.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.map: Optional[mmap.mmap] = None
+        self._stat: Tuple[int, int] = (-1, -1)
+
+    def refresh(self) -> mmap.mmap | bytes:
+        """
+        Map the file again if it changed.
+        :return: The map, empty bytes while the file is empty or missing
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self.close()
+            return b""
+        if (stat.st_ino, stat.st_size) != self._stat:
+            self.close()
+            if stat.st_size:
+                with open(self.path, "rb") as file:
+                    self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._stat = (stat.st_ino, stat.st_size)
+        return self.map if self.map is not None else b""
+
+    def close(self) -> None:
+        """
+        Unmap the file.
+        """
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        self._stat = (-1, -1)
+
+
+class BlockArchive:
+    """
+    Random access to the blocks of an archive by slot or header hash.
+
+    The indexes and the frames are memory-mapped, so a lookup only pages in the records it reads
+    and decodes a single frame, and processes reading the same archive share the page cache.
+    A lookup racing a roll back of the writer may miss the blocks involved, but always reads
+    mapped pages.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._data = MappedFile(os.path.join(directory, DATA_FILE))
+        self._slots = MappedFile(os.path.join(directory, SLOT_INDEX_FILE))
+        self._hashes = MappedFile(os.path.join(directory, HASH_INDEX_FILE))
+
+    def __len__(self) -> int:
+        return record_count(self._slots.refresh())
+
+    def raw_by_slot(self, slot: int) -> Optional[bytes]:
+        """
+        Read the frame of the block at a slot.
+        :param slot: The slot
+        :return: The raw RequestNext frame or None if no block has this slot
+        """
+        index = self._slots.refresh()
+        count = record_count(index)
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            if RECORD.unpack_from(index, HEADER.size + middle * RECORD.size)[0] < slot:
+                low = middle + 1
+            else:
+                high = middle
+        if low == count:
+            return None
+        record = RECORD.unpack_from(index, HEADER.size + low * RECORD.size)
+        return self._read(record) if record[0] == slot else None
+
+    def raw_by_hash(self, header_hash: str) -> Optional[bytes]:
+        """
+        Read the frame of a block by its header hash.
+        :param header_hash: The header hash, hex encoded
+        :return: The raw RequestNext frame or None if the archive has no such block
+        """
+        key = bytes.fromhex(header_hash)
+        index = self._slots.refresh()
+        table = self._hashes.refresh()
+        count = record_count(index)
+        buckets = len(table) // BUCKET.size
+        if not buckets:
+            return None
+        bucket = bucket_of(key, buckets)
+        for _ in range(buckets):
+            value = BUCKET.unpack_from(table, bucket * BUCKET.size)[0]
+            if value == EMPTY:
+                return None
+            if value != TOMBSTONE and value <= count:
+                record = RECORD.unpack_from(
+                    index, HEADER.size + (value - 1) * RECORD.size
+                )
+                if record[3] == key:
+                    return self._read(record)
+            bucket = (bucket + 1) & (buckets - 1)
+        return None
+
+    def by_slot(self, slot: int) -> Optional[LazyRollForward]:
+        """
+        Get the block at a slot.
+        :param slot: The slot
+        :return: The roll forward, its body decoded on first access, or None
+        """
+        return self._decode(self.raw_by_slot(slot))
+
+    def by_hash(self, header_hash: str) -> Optional[LazyRollForward]:
+        """
+        Get a block by its header hash.
+        :param header_hash: The header hash, hex encoded
+        :return: The roll forward, its body decoded on first access, or None
+        """
+        return self._decode(self.raw_by_hash(header_hash))
+
+    def slots(self) -> Iterator[int]:
+        """
+        Iterate over the slots of the blocks, in chain order.
+        :return: The slots
+        """
+        index = self._slots.refresh()
+        for number in range(record_count(index)):
+            yield RECORD.unpack_from(index, HEADER.size + number * RECORD.size)[0]
+
+    def close(self) -> None:
+        """
+        Unmap the archive.
+        """
+        for mapped in (self._data, self._slots, self._hashes):
+            mapped.close()
+
+    def _read(self, record: Tuple[int, int, int, bytes]) -> Optional[bytes]:
+        """
+        Read the frame of an index record.
+        :param record: The record
+        :return: The raw frame or None if the data file is not mapped that far yet
+        """
+        _, offset, length, _ = record
+        data = self._data.refresh()
+        if offset + length > len(data):
+            return None
+        return data[offset : offset + length]
+
+    @staticmethod
+    def _decode(frame: Optional[bytes]) -> Optional[LazyRollForward]:
+        """
+        Decode the roll forward of a frame.
+        :param frame: The raw frame
+        :return: The roll forward or None
+        """
+        if frame is None:
+            return None
+        return LazyRollForward.from_raw(json.loads(frame)["result"]["RollForward"])
+
+
+class BlockArchiveWriter(Recorder):
+    """
+    Appends the roll forwards of a chain sync to a :class:`BlockArchive` and rolls it back on roll backwards.
+
+    Frames are written before their slot record and slot records before the record count and
+    their hash bucket, so readers in other processes only ever see complete blocks. Roll backs
+    lower the record count in the header of the slot index and leave tombstones in the hash
+    table instead of truncating files that readers may have mapped, and the frames of rolled
+    back blocks stay in the data file. Byron epoch boundary blocks have no slot and are not
+    archived.
+    """
+
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self._data = open(os.path.join(directory, DATA_FILE), "ab")
+        slots_path = os.path.join(directory, SLOT_INDEX_FILE)
+        self._slots = open(slots_path, "r+b" if os.path.exists(slots_path) else "w+b")
+        header = self._slots.read(HEADER.size)
+        if len(header) < HEADER.size:
+            self._slots.write(HEADER.pack(0))
+            self._slots.flush()
+        self._count = HEADER.unpack(header)[0] if len(header) == HEADER.size else 0
+        self._last_slot = self._record(self._count - 1)[0] if self._count else -1
+        self._table: Optional[mmap.mmap] = None
+        self._buckets = 0
+        self._used = 0
+        self._open_table()
+
+    def record(self, message: str) -> None:
+        """
+        Archive the block of a roll forward frame, or roll the archive back.
+        :param message: The raw RequestNext frame
+        """
+        if is_roll_forward(message):
+            header = HeaderRollForward.from_message(message).header
+            if header.slot is not None:
+                self.append(header.slot, header.hash, message.encode())
+        elif '"RollBackward"' in message:
+            point = json.loads(message)["result"]["RollBackward"]["point"]
+            self.roll_back(point["slot"] if isinstance(point, dict) else -1)
+
+    def append(self, slot: int, header_hash: str, frame: bytes) -> None:
+        """
+        Append a block.
+        :param slot: The slot of the block
+        :param header_hash: The header hash of the block, hex encoded
+        :param frame: The raw frame of the block
+        """
+        if slot <= self._last_slot:
+            self.roll_back(slot - 1)
+        key = bytes.fromhex(header_hash)
+        offset = self._data.tell()
+        self._data.write(frame)
+        self._data.flush()
+        self._slots.seek(HEADER.size + self._count * RECORD.size)
+        self._slots.write(RECORD.pack(slot, offset, len(frame), key))
+        self._slots.flush()
+        self._count += 1
+        self._write_count()
+        self._last_slot = slot
+        if self._used + 1 > self._buckets * MAX_LOAD:
+            self._rebuild_table(self._buckets * 2)
+        else:
+            self._insert(key, self._count)
+
+    def roll_back(self, slot: int) -> List[int]:
+        """
+        Remove the blocks after a slot.
+        :param slot: The slot the chain rolled back to, -1 for the origin
+        :return: The slots of the blocks removed, newest first
+        """
+        removed = []
+        while self._count and self._last_slot > slot:
+            record = self._record(self._count - 1)
+            self._remove(record[3], self._count)
+            removed.append(record)
+            self._count -= 1
+            self._last_slot = self._record(self._count - 1)[0] if self._count else -1
+        if removed:
+            self._write_count()
+        return [record[0] for record in removed]
+
+    def close(self) -> None:
+        """
+        Close the files of the archive.
+        """
+        if self._table is not None:
+            self._table.flush()
+            self._table.close()
+            self._table = None
+        self._slots.close()
+        self._data.close()
+
+    def _record(self, index: int) -> Tuple[int, int, int, bytes]:
+        """
+        Read a slot record.
+        :param index: The index of the record
+        :return: The record
+        """
+        self._slots.seek(HEADER.size + index * RECORD.size)
+        return RECORD.unpack(self._slots.read(RECORD.size))
+
+    def _write_count(self) -> None:
+        """
+        Publish the number of live slot records to the readers.
+        """
+        self._slots.seek(0)
+        self._slots.write(HEADER.pack(self._count))
+        self._slots.flush()
+
+    def _open_table(self) -> None:
+        """
+        Map the hash table, building it when missing.
+        """
+        path = os.path.join(self.directory, HASH_INDEX_FILE)
+        if not os.path.exists(path) or not os.path.getsize(path):
+            self._rebuild_table(INITIAL_BUCKETS)
+            return
+        with open(path, "r+b") as file:
+            self._table = mmap.mmap(file.fileno(), 0)
+        self._buckets = len(self._table) // BUCKET.size
+        self._used = sum(1 for value in memoryview(self._table).cast("I") if value)
+
+    def _rebuild_table(self, buckets: int) -> None:
+        """
+        Write a new hash table from the slot index and swap it in.
+        :param buckets: The number of buckets, a power of two
+        """
+        while self._count > buckets * MAX_LOAD:
+            buckets *= 2
+        path = os.path.join(self.directory, HASH_INDEX_FILE)
+        temporary = f"{path}.tmp"
+        with open(temporary, "wb") as file:
+            file.truncate(buckets * BUCKET.size)
+        with open(temporary, "r+b") as file:
+            table = mmap.mmap(file.fileno(), 0)
+        if self._table is not None:
+            self._table.close()
+        self._table, self._buckets, self._used = table, buckets, 0
+        for index in range(self._count):
+            self._insert(self._record(index)[3], index + 1)
+        self._table.flush()
+        os.replace(temporary, path)
+
+    def _insert(self, key: bytes, number: int) -> None:
+        """
+        Point the bucket of a header hash to a slot record.
+        :param key: The header hash
+        :param number: The number of the slot record, starting at one
+        """
+        bucket = bucket_of(key, self._buckets)
+        while True:
+            value = BUCKET.unpack_from(self._table, bucket * BUCKET.size)[0]
+            if value in (EMPTY, TOMBSTONE):
+                break
+            bucket = (bucket + 1) & (self._buckets - 1)
+        if value == EMPTY:
+            self._used += 1
+        BUCKET.pack_into(self._table, bucket * BUCKET.size, number)
+
+    def _remove(self, key: bytes, number: int) -> None:
+        """
+        Leave a tombstone in the bucket of a slot record.
+        :param key: The header hash
+        :param number: The number of the slot record, starting at one
+        """
+        bucket = bucket_of(key, self._buckets)
+        for _ in range(self._buckets):
+            value = BUCKET.unpack_from(self._table, bucket * BUCKET.size)[0]
+            if value == EMPTY:
+                return
+            if value == number:
+                BUCKET.pack_into(self._table, bucket * BUCKET.size, TOMBSTONE)
+                return
+            bucket = (bucket + 1) & (self._buckets - 1)
@@ -0,0 +1,120 @@
+"""
+Block filter module
+
+This module contains the filter screening chain sync frames on their raw JSON text before decoding them.
+"""
+import re
+from typing import FrozenSet, List, Optional, Set
+
+from pydantic import ConfigDict, PrivateAttr, field_validator
+
+from pyogmios_client.models.base_model import BaseModel
+from pyogmios_client.projections.addresses import address_credentials
+
+STRING_PATTERN = re.compile(r'"([^"\\]*(?:\\.[^"\\]*)*)"')
+ADDRESS_PATTERN = re.compile(r'"((?:addr|stake)[a-z_]*1[0-9a-z]+)"')
+CREDENTIAL_PATTERN = re.compile(r"[0-9a-f]{56}")
+POLICY_ID_LENGTH = 56
+SUBSTRING_SEARCH_LIMIT = 16
+
+
+class BlockFilter(BaseModel):
+    """
+    Screens the raw frames of roll forwards for the strings a consumer cares about.
+
+    A frame is only fully decoded when one of its JSON strings, object keys included, is one of
+    the addresses, policy ids (also as the prefix of an asset id) or metadata labels, or holds
+    one of the stake credentials. Stake credentials are given hex encoded or as stake addresses,
+    and match the hex credentials of certificates, the stake addresses of withdrawals and the
+    base addresses of outputs. A few needles are searched for directly in the text, more are
+    looked up in a hash set of the strings of the frame, and stake credentials also decode the
+    addresses of the frame.
+
+    The screen may let through a block that does not match. It only sees what a frame spells
+    out: inputs are output references, so spending from a watched address or credential is not
+    matched, which needs UTxO state such as a :class:`UtxoSet`, and neither are pointer addresses.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    addresses: FrozenSet[str] = frozenset()
+    policies: FrozenSet[str] = frozenset()
+    stake_credentials: FrozenSet[str] = frozenset()
+    metadata_labels: FrozenSet[str] = frozenset()
+    _needles: Set[str] = PrivateAttr(default_factory=set)
+    _credentials: Set[str] = PrivateAttr(default_factory=set)
+    _quoted: List[str] = PrivateAttr(default_factory=list)
+
+    @field_validator("metadata_labels", mode="before")
+    @classmethod
+    def labels_as_strings(cls, labels):
+        """
+        Accept integer labels, Ogmios writes them as object keys.
+        :param labels: The labels
+        :return: The labels as strings
+        """
+        return frozenset(str(label) for label in labels)
+
+    @staticmethod
+    def credential_of(stake_credential: str) -> Optional[str]:
+        """
+        Normalize a stake credential.
+        :param stake_credential: The credential, hex encoded, or a stake address
+        :return: The credential, hex encoded, or None for an address without one
+        """
+        if CREDENTIAL_PATTERN.fullmatch(stake_credential.lower()):
+            return stake_credential.lower()
+        return address_credentials(stake_credential)[1]
+
+    def model_post_init(self, __context) -> None:
+        self._credentials = {
+            self.credential_of(credential) for credential in self.stake_credentials
+        } - {None}
+        self._needles = set(
+            self.addresses
+            | self.policies
+            | self.stake_credentials
+            | self._credentials
+            | self.metadata_labels
+        )
+        self._quoted = [f'"{needle}"' for needle in self._needles - self.policies] + [
+            f'"{policy}' for policy in self.policies
+        ]
+
+    def may_match(self, message: str) -> bool:
+        """
+        Tell whether a raw frame may hold a matching transaction.
+        :param message: The raw frame
+        :return: False only if none of its strings and addresses match, spends are not seen
+        """
+        if self._holds_needle(message):
+            return True
+        if self._credentials:
+            return any(
+                address_credentials(address)[1] in self._credentials
+                for address in set(ADDRESS_PATTERN.findall(message))
+            )
+        return False
+
+    def _holds_needle(self, message: str) -> bool:
+        """
+        Tell whether a raw frame holds one of the needles as a string.
+        :param message: The raw frame
+        :return: Whether it holds one
+        """
+        if len(self._needles) <= SUBSTRING_SEARCH_LIMIT:
+            return any(needle in message for needle in self._quoted)
+        strings = set(
+            STRING_PATTERN.findall(message)
+            if '\\"' in message
+            else message.split('"')[1::2]
+        )
+        if not strings.isdisjoint(self._needles):
+            return True
+        if self.policies:
+            return any(
+                string[:POLICY_ID_LENGTH] in self.policies
+                for string in strings
+                if len(string) > POLICY_ID_LENGTH
+            )
+        return False
@@ -1,144 +1,617 @@
 from __future__ import annotations
 
-from typing import List, Callable, Coroutine
-
-from websocket import WebSocketApp
+import asyncio
+import functools
+import inspect
+import json
+import logging
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Deque,
+    List,
+    Callable,
+    Coroutine,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from pyogmios_client.connection import InteractionContext
 from pyogmios_client.enums import MethodName
-from pyogmios_client.exceptions import UnknownResultError
+from pyogmios_client.exceptions import PyOgmiosError, UnknownResultError
 from pyogmios_client.models import (
-    RollBackward,
-    RollForward,
     PointOrOrigin,
+    Point,
     Any,
 )
 from pyogmios_client.models.base_model import BaseModel
-from pyogmios_client.models.response_model import RequestNextResponse, Response
+from pyogmios_client.models.header_model import HeaderRollForward, is_roll_forward
+from pyogmios_client.models.lazy_block_model import LazyRollForward
+from pyogmios_client.models.response_model import RequestNextResponse
+from pyogmios_client.multiplexer import peek_method_name
 from pyogmios_client.models.result_models import (
     IntersectionFound,
+    RollBackward,
+    RollForward,
     RollForwardResult,
     RollBackwardResult,
 )
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.block_filter import (
+    BlockFilter,
+)
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.cursor_store import (
+    Checkpointer,
+    CursorStore,
+)
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.frame_archive import (
+    Recorder,
+)
 from pyogmios_client.ouroboros_mini_protocols.chain_sync.find_intersect import (
     find_intersect,
+    create_point_from_roll_forward,
     create_point_from_current_tip,
 )
 from pyogmios_client.ouroboros_mini_protocols.chain_sync.request_next import (
     request_next,
 )
-from pyogmios_client.utils.queue import Queue
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.sync_stats import SyncStats
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.volatile_chain import (
+    SECURITY_PARAMETER,
+    VolatileChain,
+)
+from pyogmios_client.utils.ordered_pipeline import OrderedPipeline
 from pyogmios_client.utils.socket_utils import ensure_socket_is_open
 
 
 class Options(BaseModel):
-    sequential: bool
+    sequential: bool = False
+    concurrency: int = 1
+    reconnect: bool = True
+    reconnect_delay: float = 0.1
+    max_reconnect_delay: float = 30.0
+    resume_points: int = 10
+    in_flight: int = 100
+    buffer_size: int = 100
+    lazy_blocks: bool = False
+    headers_only: bool = False
+    decode_workers: int = 0
+    decode_executor: Optional[Executor] = None
+    cursor_store: Optional[CursorStore] = None
+    checkpoint_blocks: int = 100
+    checkpoint_interval: float = 5.0
+    volatile_chain: bool = False
+    volatile_depth: int = SECURITY_PARAMETER
+    block_filter: Optional[BlockFilter] = None
+    batch_size: int = 100
+    batch_interval: float = 0.05
+    recorder: Optional[Recorder] = None
+
+
+ChainSyncEvent = Union[RollForward, LazyRollForward, HeaderRollForward, RollBackward]
+
+
+def decode_request_next(
+    message: str, lazy_blocks: bool = False, headers_only: bool = False
+) -> ChainSyncEvent:
+    """
+    Decode a RequestNext message. Being a module function, it can run in a worker process.
+    :param message: The raw message
+    :param lazy_blocks: Whether to decode blocks as :class:`LazyBlock`
+    :param headers_only: Whether to decode blocks as :class:`HeaderRollForward`
+    :return: The event
+    """
+    if headers_only and is_roll_forward(message):
+        return HeaderRollForward.from_message(message)
+    if lazy_blocks:
+        result = json.loads(message)["result"]
+        if "RollForward" in result:
+            return LazyRollForward.from_raw(result["RollForward"])
+        if "RollBackward" in result:
+            return RollBackward.model_validate(result["RollBackward"])
+        raise UnknownResultError(result)
+    response = RequestNextResponse.model_validate_json(message)
+    if isinstance(response.result, RollBackwardResult):
+        return response.result.roll_backward
+    if isinstance(response.result, RollForwardResult):
+        return response.result.roll_forward
+    raise UnknownResultError(response.result)
 
 
 class ChainSyncMessageHandlers(BaseModel):
     roll_backward: Callable[[RollBackward, Callable[[], None]], None]
-    roll_forward: Callable[[RollForward, Callable[[], None]], None]
+    roll_forward: Optional[Callable[[RollForward, Callable[[], None]], None]] = None
+    roll_forward_batch: Optional[
+        Callable[[List[ChainSyncEvent], Callable[[], None]], None]
+    ] = None
+    commit: Optional[
+        Callable[
+            [Union[ChainSyncEvent, List[ChainSyncEvent]], Any],
+            Optional[Awaitable[None]],
+        ]
+    ] = None
 
 
 class ChainSyncClient(BaseModel):
     context: InteractionContext
     shutdown: Callable[[], Coroutine[Any, Any, None]]
     start_sync: Callable[
-        [List[PointOrOrigin], int], Coroutine[Any, Any, IntersectionFound]
+        [List[PointOrOrigin], Optional[int]], Coroutine[Any, Any, IntersectionFound]
     ]
+    events: Callable[[], AsyncIterator[ChainSyncEvent]]
+    stats: SyncStats
+    volatile: Optional[VolatileChain] = None
 
 
 async def create_chain_sync_client(
     context: InteractionContext,
-    message_handlers: ChainSyncMessageHandlers,
+    message_handlers: Optional[ChainSyncMessageHandlers] = None,
     options: Options = None,
 ) -> ChainSyncClient:
     """
     Create a chain sync client.
     :param context: The interaction context
-    :param message_handlers: The message handlers
+    :param message_handlers: The message handlers, events are buffered for :func:`events` if omitted
     :param options: The options
     :return: The chain sync client
     """
-    websocket_app = context.socket
+    options = options or Options()
+    recent_points: Deque[Point] = deque(maxlen=max(options.resume_points, 1))
+    # The points of the events the consumer of events() is done with, checkpointed instead
+    consumed_points: Deque[Point] = deque(maxlen=max(options.resume_points, 1))
+    start_points: List[PointOrOrigin] = []
+    window = options.in_flight
+    outstanding = 0
+    supervisor: Optional[asyncio.Task] = None
+    stopping = False
+    # The error of the first event that failed, nothing after it is tracked or checkpointed
+    failure: Optional[Exception] = None
+    buffered: asyncio.Queue[Optional[ChainSyncEvent]] = asyncio.Queue()
+    buffer_slots = asyncio.Semaphore(max(options.buffer_size, 1))
+    stats = SyncStats()
+    volatile = VolatileChain(options.volatile_depth) if options.volatile_chain else None
+    pipeline = (
+        OrderedPipeline(options.concurrency)
+        if options.sequential and message_handlers is not None
+        else None
+    )
+    batching = getattr(message_handlers, "roll_forward_batch", None) is not None
+    batch: List[Tuple[ChainSyncEvent, bool]] = []
+    batch_lock = asyncio.Lock()
+    batch_timer: Optional[asyncio.TimerHandle] = None
+    flush_task: Optional[asyncio.Future] = None
+    decode_executor = options.decode_executor
+    if decode_executor is None and options.decode_workers > 0:
+        decode_executor = ProcessPoolExecutor(options.decode_workers)
+    checkpointer = (
+        Checkpointer(
+            options.cursor_store,
+            options.checkpoint_blocks,
+            options.checkpoint_interval,
+        )
+        if options.cursor_store is not None
+        else None
+    )
+    decode_pipeline = (
+        OrderedPipeline(2 * (options.decode_workers or os.cpu_count() or 1))
+        if decode_executor is not None
+        else None
+    )
 
     try:
 
-        def message_handler(response: RequestNextResponse) -> None:
+        def next_block() -> None:
             """
-            Handle the response.
-            :param response: The response
+            Acknowledge a message. The client keeps its window of requests full on its own, so
+            handlers written against the callback API may call it any number of times.
             """
-            if isinstance(response.result, RollBackwardResult):
-                message_handlers.roll_backward(
-                    response.result.roll_backward, lambda: request_next(websocket_app)
-                )
-            elif isinstance(response.result, RollForwardResult):
-                message_handlers.roll_forward(
-                    response.result.roll_forward, lambda: request_next(websocket_app)
+
+        async def fill_window() -> None:
+            """
+            Send requests for the next blocks until the window is full.
+            """
+            nonlocal outstanding
+            while not stopping and outstanding < window:
+                outstanding += 1
+                await request_next(context.socket)
+
+        async def message_handler(event: ChainSyncEvent) -> None:
+            """
+            Handle the event.
+            :param event: The event
+            """
+            if isinstance(event, RollBackward):
+                await flush_batch()
+                if pipeline is not None:
+                    await pipeline.drain()
+                if volatile is not None:
+                    event = volatile.roll_backward(event)
+                await commit(event, await deliver(event))
+            elif batching:
+                await add_to_batch(event, True)
+            elif pipeline is None:
+                await commit(event, await deliver(event))
+            else:
+                await pipeline.submit(deliver(event), functools.partial(commit, event))
+
+        async def skip_block(event: HeaderRollForward) -> None:
+            """
+            Account for a block the filter ruled out, without delivering it.
+            :param event: The roll forward, decoded as a header
+            """
+            if batching:
+                await add_to_batch(event, False)
+            elif pipeline is None:
+                track(event)
+            else:
+                await pipeline.submit(asyncio.sleep(0), lambda _: track(event))
+
+        async def add_to_batch(event: ChainSyncEvent, deliverable: bool) -> None:
+            """
+            Add a roll forward to the batch, flushing it when full or at the tip.
+            :param event: The roll forward
+            :param deliverable: Whether the batch handler gets it, or it is only tracked
+            """
+            nonlocal batch_timer
+            batch.append((event, deliverable))
+            point = create_point_from_roll_forward(event)
+            at_tip = (
+                point is not None and getattr(event.tip, "slot", None) == point.slot
+            )
+            if len(batch) >= options.batch_size or at_tip:
+                await flush_batch()
+            elif batch_timer is None:
+                batch_timer = asyncio.get_running_loop().call_later(
+                    options.batch_interval, flush_later
                 )
+
+        def flush_later() -> None:
+            """
+            Flush the batch once its interval elapsed, its failure stopping the sync.
+            """
+            nonlocal flush_task
+            flush_task = asyncio.ensure_future(flush_batch())
+            flush_task.add_done_callback(flushed)
+
+        def flushed(task: asyncio.Future) -> None:
+            """
+            Stop the sync if a timed flush failed.
+            :param task: The flush task
+            """
+            if not task.cancelled() and task.exception() is not None:
+                fail(task.exception())
+
+        async def flush_batch() -> None:
+            """
+            Deliver the roll forwards of the batch to the batch handler.
+            """
+            nonlocal batch, batch_timer
+            async with batch_lock:
+                if batch_timer is not None:
+                    batch_timer.cancel()
+                    batch_timer = None
+                entries, batch = batch, []
+                if not entries or failure is not None:
+                    return
+                events = [event for event, deliverable in entries if deliverable]
+                try:
+                    if pipeline is None:
+                        await commit_batch(entries, await deliver_batch(events))
+                    else:
+                        await pipeline.submit(
+                            deliver_batch(events),
+                            functools.partial(commit_batch, entries),
+                        )
+                except Exception as error:
+                    # Failed before the lock is released, so no later batch is committed
+                    fail(error)
+                    raise
+
+        async def deliver_batch(events: List[ChainSyncEvent]) -> Any:
+            """
+            Pass roll forwards to the batch handler.
+            :param events: The roll forwards
+            :return: The result of the handler
+            """
+            if not events:
+                return None
+            outcome = message_handlers.roll_forward_batch(events, next_block)
+            if inspect.isawaitable(outcome):
+                return await outcome
+            return outcome
+
+        async def commit_batch(
+            entries: List[Tuple[ChainSyncEvent, bool]], result: Any
+        ) -> None:
+            """
+            Commit a handled batch, in chain order.
+            :param entries: The roll forwards of the batch and whether they were delivered
+            :param result: The result of the batch handler
+            """
+            events = [event for event, deliverable in entries if deliverable]
+            if events and message_handlers.commit is not None:
+                outcome = message_handlers.commit(events, result)
+                if inspect.isawaitable(outcome):
+                    await outcome
+            for event, _ in entries:
+                track(event)
+
+        async def commit(event: ChainSyncEvent, result: Any) -> None:
+            """
+            Commit a handled event, in chain order.
+            :param event: The event
+            :param result: The result of its handler
+            """
+            if message_handlers is not None and message_handlers.commit is not None:
+                outcome = message_handlers.commit(event, result)
+                if inspect.isawaitable(outcome):
+                    await outcome
+            track(event)
+
+        def track(event: ChainSyncEvent) -> None:
+            """
+            Update the stats, the volatile chain and the cursor with an event.
+            :param event: The event
+            """
+            if failure is not None:
+                return
+            if isinstance(event, RollBackward):
+                stats.record_rollback()
+                track_roll_backward(event.point)
+            else:
+                stats.record_block()
+                if volatile is not None:
+                    volatile.append(event)
+                point = create_point_from_roll_forward(event)
+                if point is not None:
+                    recent_points.append(point)
+            if checkpointer is not None and message_handlers is not None:
+                checkpointer.record(list(reversed(recent_points)))
+
+        def acknowledge(event: ChainSyncEvent) -> None:
+            """
+            Checkpoint an event the consumer of :func:`events` is done with.
+            :param event: The event
+            """
+            if isinstance(event, RollBackward):
+                rewind(consumed_points, event.point)
             else:
-                raise UnknownResultError(response.result)
+                point = create_point_from_roll_forward(event)
+                if point is not None:
+                    consumed_points.append(point)
+            if checkpointer is not None:
+                checkpointer.record(list(reversed(consumed_points)))
+
+        def cursor_points() -> List[Point]:
+            """
+            Get the points to checkpoint, those the handlers or the consumer are done with.
+            :return: The points, newest first
+            """
+            points = consumed_points if message_handlers is None else recent_points
+            return list(reversed(points))
 
-        def response_handler(response: RequestNextResponse) -> None:
+        async def deliver(event: ChainSyncEvent) -> Any:
             """
-            Handle the response.
-            :param response:
-            :return:
+            Pass an event to its handler, or buffer it for :func:`events`.
+            Waits while the buffer is full, which stops the reader and so the requests.
+            :param event: The event
+            :return: The result of the handler
             """
-            if options is None:
-                return message_handler(response)
-            return (
-                Queue().promise_push(message_handler(response))
-                if options.sequential is True
-                else message_handler(response)
+            if message_handlers is None:
+                await buffer_slots.acquire()
+                buffered.put_nowait(event)
+                return None
+            handler = (
+                message_handlers.roll_backward
+                if isinstance(event, RollBackward)
+                else message_handlers.roll_forward
             )
+            outcome = handler(event, next_block)
+            if inspect.isawaitable(outcome):
+                return await outcome
+            return outcome
 
-        def on_message(_: WebSocketApp, message: str) -> None:
+        async def events() -> AsyncIterator[ChainSyncEvent]:
+            """
+            Iterate over the events of a client created without message handlers, until shutdown.
+            An event is checkpointed once the next one is requested, so the cursor never gets ahead
+            of the consumer.
+            :return: The roll forward and roll backward events
+            """
+            if message_handlers is not None:
+                raise PyOgmiosError(
+                    "The client delivers its events to message handlers"
+                )
+            while True:
+                event = await buffered.get()
+                if event is None:
+                    return
+                buffer_slots.release()
+                yield event
+                acknowledge(event)
+
+        def track_roll_backward(point: PointOrOrigin) -> None:
+            """
+            Forget the points rolled back.
+            :param point: The point the chain rolled back to
+            """
+            if not isinstance(point, Point):
+                start_points[:] = [point]
+            rewind(recent_points, point)
+
+        def rewind(points: Deque[Point], point: PointOrOrigin) -> None:
+            """
+            Drop the points after the point the chain rolled back to.
+            :param points: The points, oldest first
+            :param point: The point the chain rolled back to
+            """
+            if not isinstance(point, Point):
+                points.clear()
+                return
+            while points and points[-1].slot > point.slot:
+                points.pop()
+            if not points or points[-1] != point:
+                points.append(point)
+
+        async def on_message(message: str) -> None:
             """
             Handle the message.
-            :param _:
             :param message:
             """
-            response = Response.model_validate_json(message)
-            if response.methodname is MethodName.REQUEST_NEXT:
+            nonlocal outstanding
+            if failure is not None:
+                return
+            if peek_method_name(message) == MethodName.REQUEST_NEXT.value:
+                outstanding = max(outstanding - 1, 0)
                 try:
-                    response_handler(RequestNextResponse.model_validate_json(message))
+                    await fill_window()
+                    if options.recorder is not None:
+                        options.recorder.record(message)
+                    if (
+                        options.block_filter is not None
+                        and is_roll_forward(message)
+                        and not options.block_filter.may_match(message)
+                    ):
+                        skipped = HeaderRollForward.from_message(message)
+                        if decode_pipeline is None:
+                            await skip_block(skipped)
+                        else:
+                            await decode_pipeline.submit(
+                                asyncio.sleep(0, skipped), skip_block
+                            )
+                    elif decode_pipeline is None:
+                        await message_handler(
+                            decode_request_next(
+                                message, options.lazy_blocks, options.headers_only
+                            )
+                        )
+                    else:
+                        await decode_pipeline.submit(
+                            asyncio.get_running_loop().run_in_executor(
+                                decode_executor,
+                                decode_request_next,
+                                message,
+                                options.lazy_blocks,
+                                options.headers_only,
+                            ),
+                            message_handler,
+                        )
                 except Exception as err:
-                    print(err)
-            elif response.methodname is MethodName.FIND_INTERSECT:
-                request_next(websocket_app)
+                    fail(err)
 
-        websocket_app.on_message = on_message
+        def fail(error: Exception) -> None:
+            """
+            Stop the sync at the first event that failed, before any later one is checkpointed
+            past it, so a restart resumes from the event before it.
+            :param error: The error of the event
+            """
+            nonlocal failure
+            if failure is not None or stopping:
+                return
+            failure = error
+            logging.error(f"Chain sync stopped: {error}")
+            asyncio.ensure_future(shutdown())
+
+        async def resume() -> None:
+            """
+            Reconnect with backoff and resume from the most recent point processed.
+            """
+            nonlocal outstanding
+            delay = options.reconnect_delay
+            while not stopping:
+                try:
+                    await context.reconnect()
+                    await find_intersect(
+                        context, list(reversed(recent_points)) or start_points
+                    )
+                    context.multiplexer.listen(on_message)
+                    outstanding = 0
+                    await fill_window()
+                    return
+                except Exception as error:
+                    logging.warning(f"Chain sync reconnect failed: {error}")
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, options.max_reconnect_delay)
+
+        async def supervise() -> None:
+            """
+            Resume the sync each time the socket drops.
+            """
+            while not stopping:
+                error = await context.multiplexer.wait_closed()
+                if stopping:
+                    return
+                logging.warning(f"Chain sync connection lost: {error}")
+                await resume()
 
         async def shutdown() -> None:
             """
             Shutdown the chain sync client.
             """
+            nonlocal stopping
+            stopping = True
+            buffered.put_nowait(None)
+            if pipeline is not None:
+                await pipeline.close()
+            if decode_pipeline is not None:
+                await decode_pipeline.close()
+                if options.decode_executor is None:
+                    decode_executor.shutdown(wait=False)
+            if supervisor is not None:
+                supervisor.cancel()
+            if batch_timer is not None:
+                batch_timer.cancel()
+            if (
+                flush_task is not None
+                and not flush_task.done()
+                and flush_task is not asyncio.current_task()
+            ):
+                await asyncio.gather(flush_task, return_exceptions=True)
+            if checkpointer is not None and checkpointer.pending:
+                checkpointer.flush(cursor_points())
             try:
-                await ensure_socket_is_open(websocket_app)
-                websocket_app.close()
+                await ensure_socket_is_open(context.socket)
+                context.multiplexer.listen(None)
+                await context.multiplexer.close()
+                await context.socket.close()
             except Exception as error:
                 print(error)
             else:
                 print("Shutting down Chain Sync Client...")
 
         async def start_sync(
-            points: List[PointOrOrigin], in_flight: int
+            points: List[PointOrOrigin], in_flight: Optional[int] = None
         ) -> IntersectionFound:
             """
-            Start the sync.
+            Start the sync, from the points of the cursor store first when one is set.
             :param points: The points
-            :param in_flight: The in flight
+            :param in_flight: The number of requests kept in flight, ``options.in_flight`` if omitted
             :return: The intersection found
             """
+            nonlocal window, supervisor
             try:
-                intersection = await find_intersect(
-                    context, points or [await create_point_from_current_tip(context)]
+                saved = (
+                    options.cursor_store.load()
+                    if options.cursor_store is not None
+                    else []
+                )
+                recent_points.extend(reversed(saved))
+                consumed_points.extend(reversed(saved))
+                start_points[:] = (
+                    saved + list(points or [])
+                    if saved
+                    else points or [await create_point_from_current_tip(context)]
                 )
-                await ensure_socket_is_open(websocket_app)
-                for _ in range(in_flight or 100):
-                    request_next(websocket_app)
+                intersection = await find_intersect(context, start_points)
+                await ensure_socket_is_open(context.socket)
+                context.multiplexer.listen(on_message)
+                window = max(in_flight or options.in_flight, 1)
+                await fill_window()
+                if options.reconnect and context.reconnect is not None:
+                    supervisor = asyncio.ensure_future(supervise())
             except Exception as error:
                 print(error)
             else:
@@ -148,5 +621,10 @@ async def create_chain_sync_client(
         pass
     else:
         return ChainSyncClient(
-            context=context, shutdown=shutdown, start_sync=start_sync
+            context=context,
+            shutdown=shutdown,
+            start_sync=start_sync,
+            events=events,
+            stats=stats,
+            volatile=volatile,
         )
@@ -0,0 +1,141 @@
+"""
+Cursor store module
+
+This module contains the stores persisting the most recent points of a chain sync, to resume it after a restart.
+"""
+import json
+import os
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from typing import List, Sequence
+
+from pyogmios_client.models import Point
+
+
+class CursorStore(ABC):
+    """
+    Persists the most recent points of a chain sync, newest first
+    """
+
+    @abstractmethod
+    def load(self) -> List[Point]:
+        """
+        Load the points saved last.
+        :return: The points, newest first, empty if none were saved
+        """
+
+    @abstractmethod
+    def save(self, points: Sequence[Point]) -> None:
+        """
+        Replace the saved points.
+        :param points: The points, newest first
+        """
+
+    def close(self) -> None:
+        """
+        Release the resources of the store.
+        """
+
+
+class FileCursorStore(CursorStore):
+    """
+    Saves the points as a JSON file, replaced atomically on each save
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> List[Point]:
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                return [Point.model_validate(point) for point in json.load(file)]
+        except FileNotFoundError:
+            return []
+
+    def save(self, points: Sequence[Point]) -> None:
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump([point.model_dump(mode="json") for point in points], file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, self.path)
+
+
+class SqliteCursorStore(CursorStore):
+    """
+    Saves the points in a SQLite database, replaced in one transaction on each save
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS cursor "
+            "(position INTEGER PRIMARY KEY, slot INTEGER NOT NULL, hash TEXT NOT NULL)"
+        )
+        self._connection.commit()
+
+    def load(self) -> List[Point]:
+        rows = self._connection.execute(
+            "SELECT slot, hash FROM cursor ORDER BY position"
+        ).fetchall()
+        return [Point(slot=slot, hash=header_hash) for slot, header_hash in rows]
+
+    def save(self, points: Sequence[Point]) -> None:
+        with self._connection:
+            self._connection.execute("DELETE FROM cursor")
+            self._connection.executemany(
+                "INSERT INTO cursor (position, slot, hash) VALUES (?, ?, ?)",
+                [
+                    (position, *point.model_dump(mode="json").values())
+                    for position, point in enumerate(points)
+                ],
+            )
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class Checkpointer:
+    """
+    Batches the saves of a cursor store, once every ``blocks`` blocks or ``interval`` seconds
+    """
+
+    def __init__(self, store: CursorStore, blocks: int = 100, interval: float = 5.0):
+        self.store = store
+        self.blocks = max(blocks, 1)
+        self.interval = interval
+        self._pending = 0
+        self._saved = time.monotonic()
+
+    @property
+    def pending(self) -> int:
+        """
+        The number of events processed since the last save.
+        :return: The number of events
+        """
+        return self._pending
+
+    def record(self, points: Sequence[Point]) -> None:
+        """
+        Count an event processed and save the points if a checkpoint is due.
+        :param points: The most recent points, newest first
+        """
+        self._pending += 1
+        if (
+            self._pending >= self.blocks
+            or time.monotonic() - self._saved >= self.interval
+        ):
+            self.flush(points)
+
+    def flush(self, points: Sequence[Point]) -> None:
+        """
+        Save the points now.
+        :param points: The most recent points, newest first
+        """
+        if points:
+            self.store.save(points)
+        self._pending = 0
+        self._saved = time.monotonic()
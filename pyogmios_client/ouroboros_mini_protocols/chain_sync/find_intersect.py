@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional, Union
 
 from pyogmios_client.connection import InteractionContext
 from pyogmios_client.enums import MethodName
@@ -7,9 +7,18 @@ from pyogmios_client.exceptions import (
     IntersectionNotFoundError,
     TipIsOriginError,
 )
-from pyogmios_client.models import Point, PointOrOrigin, Origin
+from pyogmios_client.models import (
+    Block,
+    EpochBoundaryBlock,
+    HeaderHash,
+    Origin,
+    Point,
+    PointOrOrigin,
+)
+from pyogmios_client.models.header_model import HeaderRollForward
+from pyogmios_client.models.lazy_block_model import LazyBlock, LazyRollForward
 from pyogmios_client.models.response_model import FindIntersectResponse
-from pyogmios_client.models.result_models import IntersectionFound
+from pyogmios_client.models.result_models import IntersectionFound, RollForward
 from pyogmios_client.ouroboros_mini_protocols.state_query.query import (
     RequestArgs,
     query,
@@ -54,3 +63,35 @@ async def create_point_from_current_tip(context: InteractionContext) -> Point:
     if tip == origin.__root__:
         raise TipIsOriginError()
     return Point(slot=tip.slot, hash=tip.hash)
+
+
+def create_point_from_block(block: Union[Block, LazyBlock]) -> Optional[Point]:
+    """
+    Create point from block.
+    :param block: The block
+    :return: The point or None for a Byron epoch boundary block, which has no slot
+    """
+    if isinstance(block, LazyBlock):
+        return block.point
+    era_block = getattr(block, block.block_type)
+    if isinstance(era_block, EpochBoundaryBlock):
+        return None
+    if block.block_type == "byron":
+        return Point(slot=era_block.header.slot, hash=era_block.hash)
+    header_hash = era_block.headerHash
+    if isinstance(header_hash, HeaderHash):
+        header_hash = header_hash.root
+    return Point(slot=era_block.header.slot, hash=header_hash)
+
+
+def create_point_from_roll_forward(
+    roll_forward: Union[RollForward, LazyRollForward, HeaderRollForward]
+) -> Optional[Point]:
+    """
+    Create point from roll forward.
+    :param roll_forward: The roll forward, its block may be lazy or a compact header
+    :return: The point or None for a Byron epoch boundary block, which has no slot
+    """
+    if isinstance(roll_forward, HeaderRollForward):
+        return roll_forward.header.point
+    return create_point_from_block(roll_forward.block)
@@ -0,0 +1,302 @@
+"""
+Frame archive module
+
+This module contains the recorder writing raw chain sync frames into compressed segments with a slot index,
+and the transport replaying them to a chain sync client without an Ogmios server.
+"""
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import lzma
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, IO, Iterator, List, Optional, Tuple
+
+from aiohttp import WSCloseCode
+
+from pyogmios_client.connection import InteractionContext, create_connection_object
+from pyogmios_client.enums import MethodName
+from pyogmios_client.exceptions import WebSocketClosedError
+from pyogmios_client.models.header_model import HeaderRollForward, is_roll_forward
+from pyogmios_client.multiplexer import peek_method_name
+from pyogmios_client.transport import Transport
+
+INDEX_FILE = "index.jsonl"
+SEGMENT_PREFIX = "segment-"
+
+COMPRESSIONS: Dict[str, Tuple[str, Callable[[str, str], IO[str]]]] = {
+    "gzip": (".jsonl.gz", lambda path, mode: gzip.open(path, mode, encoding="utf-8")),
+    "lzma": (".jsonl.xz", lambda path, mode: lzma.open(path, mode, encoding="utf-8")),
+}
+try:
+    import zstandard
+
+    COMPRESSIONS["zstd"] = (
+        ".jsonl.zst",
+        lambda path, mode: zstandard.open(path, mode, encoding="utf-8"),
+    )
+except ImportError:
+    pass
+
+
+def open_segment(path: str, mode: str) -> IO[str]:
+    """
+    Open a segment with the compression its extension names.
+    :param path: The path of the segment
+    :param mode: The text mode to open it in
+    :return: The file
+    """
+    for extension, opener in COMPRESSIONS.values():
+        if path.endswith(extension):
+            return opener(path, mode)
+    raise ValueError(f"Unknown segment compression: {path}")
+
+
+class Recorder(ABC):
+    """
+    Receives the raw RequestNext frames of a chain sync client, before they are decoded
+    """
+
+    @abstractmethod
+    def record(self, message: str) -> None:
+        """
+        Record a frame.
+        :param message: The raw RequestNext frame
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Write out what is buffered and release the files.
+        """
+
+
+class FrameRecorder(Recorder):
+    """
+    Appends raw RequestNext frames to compressed segments of ``segment_frames`` frames each.
+
+    Every closed segment gets a line in the index of the directory with its slot range and the
+    last tip seen, so a replay can skip to the segment holding a point.
+    """
+
+    def __init__(
+        self, directory: str, segment_frames: int = 10000, compression: str = "gzip"
+    ):
+        if compression not in COMPRESSIONS:
+            raise ValueError(
+                f"Unknown compression {compression}, use one of {list(COMPRESSIONS)}"
+            )
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.segment_frames = max(segment_frames, 1)
+        self.compression = compression
+        self._segment: Optional[IO[str]] = None
+        self._entry: Dict[str, Any] = {}
+        self._next_segment = len(FrameArchive(directory).segments)
+
+    def record(self, message: str) -> None:
+        """
+        Append a frame to the current segment.
+        :param message: The raw RequestNext frame
+        """
+        if self._segment is None:
+            self._open_segment()
+        self._segment.write(message.replace("\n", " ") + "\n")
+        self._entry["frames"] += 1
+        if is_roll_forward(message):
+            roll_forward = HeaderRollForward.from_message(message)
+            if roll_forward.header.slot is not None:
+                if self._entry["first_slot"] is None:
+                    self._entry["first_slot"] = roll_forward.header.slot
+                self._entry["last_slot"] = roll_forward.header.slot
+            self._entry["tip"] = roll_forward.model_dump(mode="json")["tip"]
+        if self._entry["frames"] >= self.segment_frames:
+            self.close()
+
+    def close(self) -> None:
+        """
+        Close the current segment and add it to the index.
+        """
+        if self._segment is None:
+            return
+        self._segment.close()
+        self._segment = None
+        with open(
+            os.path.join(self.directory, INDEX_FILE), "a", encoding="utf-8"
+        ) as index:
+            index.write(json.dumps(self._entry) + "\n")
+
+    def _open_segment(self) -> None:
+        """
+        Start a new segment.
+        """
+        extension, opener = COMPRESSIONS[self.compression]
+        name = f"{SEGMENT_PREFIX}{self._next_segment:06d}{extension}"
+        self._next_segment += 1
+        self._segment = opener(os.path.join(self.directory, name), "wt")
+        self._entry = {
+            "segment": name,
+            "frames": 0,
+            "first_slot": None,
+            "last_slot": None,
+            "tip": None,
+        }
+
+
+class FrameArchive:
+    """
+    Reads the segments written by a :class:`FrameRecorder`, in recording order.
+    Segments missing from the index, such as one left open by a crash, are read without a slot range.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.segments: List[Dict[str, Any]] = []
+        index_path = os.path.join(directory, INDEX_FILE)
+        if os.path.exists(index_path):
+            with open(index_path, encoding="utf-8") as index:
+                self.segments = [json.loads(line) for line in index if line.strip()]
+        indexed = {entry["segment"] for entry in self.segments}
+        if os.path.isdir(directory):
+            self.segments += [
+                {"segment": name, "first_slot": None, "last_slot": None, "tip": None}
+                for name in sorted(os.listdir(directory))
+                if name.startswith(SEGMENT_PREFIX) and name not in indexed
+            ]
+
+    @property
+    def tip(self) -> Any:
+        """
+        The last tip recorded.
+        :return: The raw tip or origin if the archive holds no block
+        """
+        tips = [entry["tip"] for entry in self.segments if entry["tip"] is not None]
+        return tips[-1] if tips else "origin"
+
+    def frames(self, start: int = 0) -> Iterator[str]:
+        """
+        Iterate over the frames of the segments.
+        :param start: The index of the first segment
+        :return: The raw frames
+        """
+        for entry in self.segments[start:]:
+            with open_segment(
+                os.path.join(self.directory, entry["segment"]), "rt"
+            ) as segment:
+                try:
+                    for line in segment:
+                        if line.strip():
+                            yield line.rstrip("\n")
+                except EOFError:
+                    pass
+
+    def intersect(self, points: List[Any]) -> Tuple[Any, Iterator[str]]:
+        """
+        Find the first point recorded and the frames after it.
+        :param points: The raw points, origin starts from the first frame
+        :return: The point found and the frames after it, or None and no frames
+        """
+        for point in points:
+            if not isinstance(point, dict):
+                return point, self.frames()
+            for start, entry in enumerate(self.segments):
+                if entry["first_slot"] is not None and not (
+                    entry["first_slot"] <= point["slot"] <= entry["last_slot"]
+                ):
+                    continue
+                frames = self.frames(start)
+                for frame in frames:
+                    if not is_roll_forward(frame):
+                        continue
+                    header = HeaderRollForward.from_message(frame).header
+                    if header.slot is None:
+                        continue
+                    if header.slot > point["slot"]:
+                        break
+                    if header.point.model_dump(mode="json") == point:
+                        return point, frames
+        return None, iter(())
+
+
+class ReplayTransport(Transport):
+    """
+    Transport answering FindIntersect and RequestNext from a :class:`FrameArchive`, at disk speed.
+    """
+
+    def __init__(self, archive: FrameArchive):
+        self.archive = archive
+        self._frames: Iterator[str] = iter(())
+        self._outbox: asyncio.Queue[Optional[str]] = asyncio.Queue()
+        self._exhausted = False
+        self._finished = asyncio.Event()
+        self._closed = False
+
+    @property
+    def connected(self) -> bool:
+        return not self._closed
+
+    async def send(self, message: str) -> None:
+        if self._closed:
+            raise WebSocketClosedError()
+        method_name = peek_method_name(message)
+        if method_name == MethodName.FIND_INTERSECT.value:
+            request = json.loads(message)
+            point, self._frames = self.archive.intersect(request["args"]["points"])
+            self._exhausted = False
+            self._finished.clear()
+            result = (
+                {"IntersectionFound": {"point": point, "tip": self.archive.tip}}
+                if point is not None
+                else {"IntersectionNotFound": {"tip": self.archive.tip}}
+            )
+            self._outbox.put_nowait(
+                json.dumps(
+                    {
+                        "type": "jsonwsp/response",
+                        "version": "1.0",
+                        "servicename": "ogmios",
+                        "methodname": method_name,
+                        "result": result,
+                        "reflection": request.get("mirror"),
+                    }
+                )
+            )
+        elif method_name == MethodName.REQUEST_NEXT.value:
+            frame = next(self._frames, None)
+            if frame is None:
+                self._exhausted = True
+            else:
+                self._outbox.put_nowait(frame)
+
+    async def receive(self) -> str:
+        if self._exhausted and self._outbox.empty():
+            self._finished.set()
+        message = await self._outbox.get()
+        if message is None:
+            raise WebSocketClosedError()
+        return message
+
+    async def close(self, code: int = WSCloseCode.OK, reason: str = "") -> None:
+        self._closed = True
+        self._outbox.put_nowait(None)
+
+    async def wait_finished(self) -> None:
+        """
+        Wait until every frame after the intersection was handed to the client.
+        """
+        await self._finished.wait()
+
+
+def create_replay_context(directory: str) -> InteractionContext:
+    """
+    Create an interaction context replaying an archive, for a chain sync client.
+    :param directory: The directory of the archive
+    :return: The :class:`InteractionContext` object, its socket is a :class:`ReplayTransport`
+    """
+    return InteractionContext(
+        connection=create_connection_object(),
+        socket=ReplayTransport(FrameArchive(directory)),
+        after_each=lambda socket, function: function(),
+    )
@@ -1,9 +1,8 @@
 from typing import Optional, TypeVar
 
-from websocket import WebSocketApp
-
 from pyogmios_client.models.base_model import BaseModel
 from pyogmios_client.models.request_model import RequestNext
+from pyogmios_client.transport import Transport
 
 T = TypeVar("T")
 
@@ -12,11 +11,11 @@ class Options(BaseModel):
     mirror: Optional[dict[str, T]]
 
 
-def request_next(socket: WebSocketApp, options: Options = None) -> None:
+async def request_next(socket: Transport, options: Options = None) -> None:
     """
     Request next.
-    :param socket: The websocket
+    :param socket: The transport
     :param options: The options
     """
     request = RequestNext.from_base(mirror=options.mirror if options else None)
-    socket.send(request.model_dump_json())
+    await socket.send(request.model_dump_json())
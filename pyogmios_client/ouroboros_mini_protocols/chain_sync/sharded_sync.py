@@ -0,0 +1,186 @@
+"""
+Sharded sync module
+
+This module contains the coordinator syncing ranges of the chain in parallel, one connection per range.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator, List, Optional
+
+from pyogmios_client.connection import (
+    InteractionContext,
+    InteractionContextOptions,
+    create_interaction_context,
+)
+from pyogmios_client.enums import InteractionType
+from pyogmios_client.exceptions import WebSocketClosedError
+from pyogmios_client.models import Point, PointOrOrigin
+from pyogmios_client.models.base_model import BaseModel
+from pyogmios_client.models.result_models import RollBackward
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.chain_sync_client import (
+    ChainSyncClient,
+    ChainSyncEvent,
+    Options,
+    create_chain_sync_client,
+)
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.find_intersect import (
+    create_point_from_roll_forward,
+)
+from pyogmios_client.transport import CloseHandler, ErrorHandler
+
+
+class SyncRange(BaseModel):
+    """
+    Range of the chain following ``start`` up to and including ``end``, or up to the tip
+    """
+
+    start: PointOrOrigin
+    end: Optional[Point] = None
+
+
+class ShardedSync:
+    """
+    Syncs the ranges between checkpoints in parallel, each on its own connection.
+
+    Each range stops once it reaches the next checkpoint and the last range follows the chain.
+    :meth:`ranges` gives one iterator per range, :meth:`events` merges them in chain order.
+    Ranges buffer at most ``options.buffer_size`` events ahead of their consumer.
+    """
+
+    def __init__(
+        self,
+        checkpoints: List[PointOrOrigin],
+        options: Optional[Options] = None,
+        context_options: Optional[InteractionContextOptions] = None,
+        error_handler: Optional[ErrorHandler] = None,
+        close_handler: Optional[CloseHandler] = None,
+    ):
+        if not checkpoints:
+            raise ValueError("A sharded sync needs at least one checkpoint")
+        points = sorted(
+            checkpoints,
+            key=lambda point: point.slot if isinstance(point, Point) else -1,
+        )
+        self.ranges_to_sync = [
+            SyncRange(start=start, end=end)
+            for start, end in zip(points, points[1:] + [None])
+        ]
+        self._options = options or Options()
+        self._context_options = (
+            context_options or InteractionContextOptions()
+        ).model_copy(update={"interaction_type": InteractionType.LONG_RUNNING})
+        self._error_handler = error_handler
+        self._close_handler = close_handler
+        self.clients: List[ChainSyncClient] = []
+
+    async def start(self) -> ShardedSync:
+        """
+        Open a connection per range and start syncing them.
+        :return: The sharded sync
+        """
+        contexts = await asyncio.gather(
+            *(self._create_context() for _ in self.ranges_to_sync)
+        )
+        if any(context is None for context in contexts):
+            raise WebSocketClosedError()
+        self.clients = [
+            await create_chain_sync_client(context, options=self._options)
+            for context in contexts
+        ]
+        await asyncio.gather(
+            *(
+                client.start_sync([sync_range.start])
+                for client, sync_range in zip(self.clients, self.ranges_to_sync)
+            )
+        )
+        return self
+
+    def ranges(self) -> List[AsyncIterator[ChainSyncEvent]]:
+        """
+        Iterate over each range separately.
+        :return: An iterator per range, in chain order
+        """
+        return [
+            self._range_events(client, sync_range)
+            for client, sync_range in zip(self.clients, self.ranges_to_sync)
+        ]
+
+    async def events(self) -> AsyncIterator[ChainSyncEvent]:
+        """
+        Iterate over every range in chain order. Later ranges keep syncing into their buffers.
+        :return: The events of the ranges
+        """
+        for range_events in self.ranges():
+            async for event in range_events:
+                yield event
+
+    async def close(self) -> None:
+        """
+        Stop syncing every range.
+        """
+        await asyncio.gather(
+            *(client.shutdown() for client in self.clients), return_exceptions=True
+        )
+
+    async def _range_events(
+        self, client: ChainSyncClient, sync_range: SyncRange
+    ) -> AsyncIterator[ChainSyncEvent]:
+        """
+        Iterate over the events of one range until its end.
+        :param client: The client syncing the range
+        :param sync_range: The range
+        :return: The events of the range
+        """
+        started = False
+        events = client.events()
+        try:
+            async for event in events:
+                if isinstance(event, RollBackward):
+                    if not started and event.point == sync_range.start:
+                        continue
+                    yield event
+                    continue
+                started = True
+                point = create_point_from_roll_forward(event)
+                if sync_range.end is None or point is None:
+                    yield event
+                    continue
+                # Blocks buffered past the end belong to the next range
+                if point.slot <= sync_range.end.slot:
+                    yield event
+                if point.slot >= sync_range.end.slot:
+                    await client.shutdown()
+                    return
+        finally:
+            await events.aclose()
+
+    async def _create_context(self) -> Optional[InteractionContext]:
+        """
+        Open the connection of one range.
+        :return: The interaction context or None if the server is not ready
+        """
+        return await create_interaction_context(
+            self._error_handler, self._close_handler, self._context_options
+        )
+
+
+async def create_sharded_sync(
+    checkpoints: List[PointOrOrigin],
+    options: Optional[Options] = None,
+    context_options: Optional[InteractionContextOptions] = None,
+    error_handler: Optional[ErrorHandler] = None,
+    close_handler: Optional[CloseHandler] = None,
+) -> ShardedSync:
+    """
+    Create a sharded sync and start syncing its ranges.
+    :param checkpoints: The points splitting the chain into ranges, e.g. epoch boundaries
+    :param options: The chain sync options of every range
+    :param context_options: The :class:`InteractionContextOptions` object
+    :param error_handler: The error handler
+    :param close_handler: The close handler
+    :return: The :class:`ShardedSync` object
+    """
+    return await ShardedSync(
+        checkpoints, options, context_options, error_handler, close_handler
+    ).start()
@@ -0,0 +1,60 @@
+"""
+Sync stats module
+
+This module contains the counters of a chain sync client.
+"""
+import time
+from collections import deque
+from typing import Deque, List
+
+
+class SyncStats:
+    """
+    Counts the blocks handled by a chain sync client and their rate over a sliding window
+    """
+
+    def __init__(self, window: float = 10.0):
+        self.window = window
+        self.blocks = 0
+        self.rollbacks = 0
+        self.started = time.monotonic()
+        self._seconds: Deque[List[int]] = deque()
+
+    def record_block(self) -> None:
+        """
+        Count a block rolled forward.
+        """
+        self.blocks += 1
+        second = int(time.monotonic())
+        if self._seconds and self._seconds[-1][0] == second:
+            self._seconds[-1][1] += 1
+        else:
+            self._seconds.append([second, 1])
+        self._expire(second)
+
+    def record_rollback(self) -> None:
+        """
+        Count a roll backward.
+        """
+        self.rollbacks += 1
+
+    @property
+    def rate(self) -> float:
+        """
+        The blocks per second over the window, or since the start when it is shorter.
+        :return: The rate
+        """
+        now = time.monotonic()
+        self._expire(int(now))
+        elapsed = min(self.window, now - self.started)
+        if elapsed <= 0:
+            return 0.0
+        return sum(count for _, count in self._seconds) / elapsed
+
+    def _expire(self, second: int) -> None:
+        """
+        Forget the counts older than the window.
+        :param second: The current second
+        """
+        while self._seconds and self._seconds[0][0] <= second - self.window:
+            self._seconds.popleft()
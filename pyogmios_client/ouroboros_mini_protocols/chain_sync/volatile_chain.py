@@ -0,0 +1,122 @@
+"""
+Volatile chain module
+
+This module contains the buffer of the most recent blocks of a chain sync, which may still be rolled back.
+"""
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from pyogmios_client.models import Point, PointOrOrigin
+from pyogmios_client.models.result_models import RollBackward
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.find_intersect import (
+    create_point_from_roll_forward,
+)
+
+SECURITY_PARAMETER = 2160
+
+
+class VolatileRollBackward(RollBackward):
+    """
+    Roll backward carrying the roll forwards it orphaned, newest first
+    """
+
+    orphaned: List[Any] = []
+
+
+class VolatileChain:
+    """
+    Holds the last ``depth`` roll forwards, indexed by slot and header hash.
+
+    Rolling back pops the blocks after the point, so undoing them costs the depth of the rollback.
+    """
+
+    def __init__(self, depth: int = SECURITY_PARAMETER):
+        self.depth = max(depth, 1)
+        self._blocks: Deque[Tuple[Point, Any]] = deque()
+        self._by_hash: Dict[str, Any] = {}
+        self._by_slot: Dict[int, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    @property
+    def tip(self) -> Optional[Point]:
+        """
+        The point of the newest block held.
+        :return: The point or None if the buffer is empty
+        """
+        return self._blocks[-1][0] if self._blocks else None
+
+    def get(self, header_hash: str) -> Optional[Any]:
+        """
+        Find a block by its header hash.
+        :param header_hash: The header hash
+        :return: The roll forward or None if it is not held
+        """
+        return self._by_hash.get(header_hash)
+
+    def at_slot(self, slot: int) -> Optional[Any]:
+        """
+        Find a block by its slot.
+        :param slot: The slot
+        :return: The roll forward or None if it is not held
+        """
+        return self._by_slot.get(slot)
+
+    def append(self, roll_forward: Any) -> None:
+        """
+        Add the block of a roll forward, forgetting the oldest one beyond the depth.
+        :param roll_forward: The roll forward
+        """
+        point = create_point_from_roll_forward(roll_forward)
+        if point is None:
+            return
+        self._blocks.append((point, roll_forward))
+        self._by_hash[self._key(point)] = roll_forward
+        self._by_slot[point.slot] = roll_forward
+        while len(self._blocks) > self.depth:
+            self._forget(*self._blocks.popleft())
+
+    def roll_back(self, point: PointOrOrigin) -> List[Any]:
+        """
+        Remove the blocks after a point.
+        :param point: The point the chain rolled back to
+        :return: The roll forwards orphaned, newest first
+        """
+        slot = point.slot if isinstance(point, Point) else -1
+        orphaned = []
+        while self._blocks and self._blocks[-1][0].slot > slot:
+            orphan_point, roll_forward = self._blocks.pop()
+            self._forget(orphan_point, roll_forward)
+            orphaned.append(roll_forward)
+        return orphaned
+
+    def roll_backward(self, event: RollBackward) -> VolatileRollBackward:
+        """
+        Apply a roll backward.
+        :param event: The roll backward
+        :return: The roll backward with the roll forwards it orphaned
+        """
+        return VolatileRollBackward.model_construct(
+            point=event.point, tip=event.tip, orphaned=self.roll_back(event.point)
+        )
+
+    def _forget(self, point: Point, roll_forward: Any) -> None:
+        """
+        Remove a block from the indexes.
+        :param point: The point of the block
+        :param roll_forward: The roll forward
+        """
+        if self._by_hash.get(self._key(point)) is roll_forward:
+            del self._by_hash[self._key(point)]
+        if self._by_slot.get(point.slot) is roll_forward:
+            del self._by_slot[point.slot]
+
+    @staticmethod
+    def _key(point: Point) -> str:
+        """
+        Get the header hash of a point as a string.
+        :param point: The point
+        :return: The header hash
+        """
+        return point.model_dump(mode="json")["hash"]
@@ -1,14 +1,13 @@
 from typing import Any, Optional, TypeVar, Callable, Dict
 
 from nanoid import generate
-from websocket import WebSocketApp
-
 from pyogmios_client.connection import InteractionContext
 from pyogmios_client.enums import MethodName
 from pyogmios_client.models.base_model import BaseModel
 from pyogmios_client.models.request_model import Request
 from pyogmios_client.models.response_model import Response, QueryResponse
 from pyogmios_client.request import send, send_request
+from pyogmios_client.transport import Transport
 
 T = TypeVar("T")
 
@@ -39,10 +38,10 @@ async def query(
     :return: The query response.
     """
 
-    async def to_send(_: WebSocketApp) -> QueryResponse | None:
+    async def to_send(_: Transport) -> QueryResponse | None:
         """
         Sends the query to the node.
-        :param _: The websocket to use for the query.
+        :param _: The transport to use for the query.
         :return: The query response.
         """
         try:
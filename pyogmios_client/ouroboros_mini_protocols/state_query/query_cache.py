@@ -0,0 +1,171 @@
+"""
+Query cache module
+
+This module contains the cache of state query results, with policies per query.
+"""
+import asyncio
+import json
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from pydantic_core import to_jsonable_python
+
+from pyogmios_client.enums import CacheScope
+from pyogmios_client.models.base_model import BaseModel
+
+CacheKey = Tuple[str, str]
+# The result, the epoch it was queried in for epoch scoped queries, and when it expires
+CacheEntry = Tuple[Any, Optional[int], float]
+
+
+class CachePolicy(BaseModel):
+    """
+    How long the result of a query stays cached.
+    """
+
+    scope: CacheScope
+    ttl: Optional[float] = None
+    """Seconds a result is kept, required for the TTL scope and optional for the others"""
+
+
+DEFAULT_POLICIES: Dict[str, CachePolicy] = {
+    "system_start": CachePolicy(scope=CacheScope.FOREVER),
+    "genesis_config": CachePolicy(scope=CacheScope.FOREVER),
+    "era_start": CachePolicy(scope=CacheScope.EPOCH),
+    "era_summaries": CachePolicy(scope=CacheScope.EPOCH),
+    "current_protocol_parameters": CachePolicy(scope=CacheScope.EPOCH),
+    "stake_distribution": CachePolicy(scope=CacheScope.EPOCH),
+    # Pools register at any time, only their retirement waits for an epoch boundary
+    "pool_ids": CachePolicy(scope=CacheScope.TTL, ttl=60.0),
+}
+
+
+class QueryCache:
+    """
+    Least recently used cache of state query results, bounded to ``max_entries`` results.
+
+    Queries without a policy are never cached. Epoch scoped results are dropped once a new epoch
+    is observed, from the ``current_epoch`` results of the clients using the cache, from
+    :meth:`observe_epoch`, or from a ``current_epoch`` query made when the epoch was not observed
+    for ``epoch_check_interval`` seconds. Concurrent misses of a query share a single request.
+    Cached results are shared by the callers and must not be modified.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        policies: Optional[Dict[str, CachePolicy]] = None,
+        epoch_check_interval: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max(max_entries, 1)
+        self.policies = {**DEFAULT_POLICIES, **(policies or {})}
+        for name, policy in self.policies.items():
+            if policy.scope is CacheScope.TTL and policy.ttl is None:
+                raise ValueError(f"The TTL policy of {name} needs a ttl")
+        self.epoch_check_interval = epoch_check_interval
+        self.epoch: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        self._pending: Dict[CacheKey, asyncio.Future] = {}
+        self._epoch_observed = -math.inf
+        self._epoch_check: Optional[asyncio.Future] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def observe_epoch(self, epoch: Any) -> None:
+        """
+        Record the current epoch, dropping the epoch scoped results of the previous ones.
+        :param epoch: The epoch, an int or :class:`Epoch`
+        """
+        epoch = getattr(epoch, "root", epoch)
+        self._epoch_observed = self._clock()
+        if epoch == self.epoch:
+            return
+        self.epoch = epoch
+        for key in [
+            key for key, entry in self._entries.items() if entry[1] is not None
+        ]:
+            del self._entries[key]
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """
+        Drop cached results.
+        :param name: The query whose results to drop, all of them by default
+        """
+        for key in [key for key in self._entries if name is None or key[0] == name]:
+            del self._entries[key]
+
+    async def get(
+        self,
+        name: str,
+        args: Tuple[Any, ...],
+        run: Callable[[], Awaitable[Any]],
+        current_epoch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Get the result of a query, from the cache when it is fresh.
+        :param name: The name of the query
+        :param args: The arguments of the query
+        :param run: The function sending the query
+        :param current_epoch: The function querying the current epoch, to check epoch scoped results
+        :return: The result
+        """
+        policy = self.policies.get(name)
+        if policy is None:
+            return await run()
+        if (
+            policy.scope is CacheScope.EPOCH
+            and self._clock() - self._epoch_observed >= self.epoch_check_interval
+        ):
+            await self._check_epoch(current_epoch)
+        key = (name, json.dumps(to_jsonable_python(args), sort_keys=True))
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, epoch, expires = entry
+            if self._clock() < expires and (
+                policy.scope is not CacheScope.EPOCH or epoch == self.epoch
+            ):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+        pending = self._pending.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            value = await run()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as error:
+            future.set_exception(error)
+            # Retrieved here, so a miss without concurrent callers logs nothing
+            future.exception()
+            raise
+        finally:
+            del self._pending[key]
+        expires = self._clock() + policy.ttl if policy.ttl is not None else math.inf
+        epoch = self.epoch if policy.scope is CacheScope.EPOCH else None
+        self._entries[key] = (value, epoch, expires)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        future.set_result(value)
+        return value
+
+    async def _check_epoch(self, current_epoch: Callable[[], Awaitable[Any]]) -> None:
+        """
+        Query the current epoch, once for concurrent callers.
+        :param current_epoch: The function querying the current epoch
+        """
+        if self._epoch_check is None or self._epoch_check.done():
+            self._epoch_check = asyncio.ensure_future(current_epoch())
+        self.observe_epoch(await asyncio.shield(self._epoch_check))
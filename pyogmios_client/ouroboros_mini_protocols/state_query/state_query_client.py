@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from typing import Callable, Any, Coroutine, Union, List, Dict
+from typing import Callable, Any, Coroutine, Union, List, Dict, Optional, Awaitable
 
 from nanoid import generate
 
@@ -43,6 +43,9 @@ from pyogmios_client.models.result_models import (
     AcquireSuccessResult,
     AcquireFailureResult,
 )
+from pyogmios_client.ouroboros_mini_protocols.state_query.query_cache import (
+    QueryCache,
+)
 from pyogmios_client.ouroboros_mini_protocols.state_query.queries.block_height import (
     block_height,
 )
@@ -101,7 +104,9 @@ from pyogmios_client.utils.socket_utils import ensure_socket_is_open
 
 
 class Options(BaseModel):
-    point: PointOrOrigin
+    point: Optional[PointOrOrigin] = None
+    cache: Optional[QueryCache] = None
+    """Cache of the query results at the tip, not used by clients acquiring a point"""
 
 
 class StateQueryClient(BaseModel):
@@ -173,7 +178,23 @@ async def create_state_query_client(
     :param options: The options
     :return: A state query client
     """
+    if options and options.point and context.lease:
+        context = await context.lease()
     websocket_app = context.socket
+    # Results and epochs of an acquired point would mix with those of the tip in a shared cache
+    cache = options.cache if options and not options.point else None
+
+    async def cached(name: str, run: Callable[[], Awaitable[Any]], *args: Any) -> Any:
+        """
+        Run a query through the cache of the client, if it has one
+        :param name: The name of the query
+        :param run: The function sending the query
+        :param args: The arguments of the query
+        :return: The result
+        """
+        if cache is None:
+            return await run()
+        return await cache.get(name, args, run, query_current_epoch)
 
     async def acquire(point: PointOrOrigin) -> StateQueryClient:
         """
@@ -190,8 +211,7 @@ async def create_state_query_client(
         request_id = generate(size=5)
         try:
             request = RequestRelease.from_base(mirror={"requestId": str(request_id)})
-            websocket_app.send(request.model_dump_json())
-            result = websocket_app.sock.recv()
+            result = await context.multiplexer.request(request)
             release_response = ReleaseResponse(**json.loads(result))
 
             if release_response.reflection.requestId != request_id:
@@ -207,7 +227,7 @@ async def create_state_query_client(
         """
         try:
             await ensure_socket_is_open(websocket_app)
-            websocket_app.close()
+            await websocket_app.close()
         except Exception as err:
             print(err)
         else:
@@ -232,14 +252,19 @@ async def create_state_query_client(
         Query the current epoch
         """
         await ensure_socket_is_open(websocket_app)
-        return await current_epoch(context)
+        epoch = await current_epoch(context)
+        if cache is not None:
+            cache.observe_epoch(epoch)
+        return epoch
 
     async def query_current_protocol_parameters() -> ProtocolParametersBabbage | ProtocolParametersAlonzo | ProtocolParametersShelley:
         """
         Query the current protocol parameters
         """
         await ensure_socket_is_open(websocket_app)
-        return await current_protocol_parameters(context)
+        return await cached(
+            "current_protocol_parameters", lambda: current_protocol_parameters(context)
+        )
 
     async def query_delegations_and_rewards(
         stake_key_hashes: List[DigestBlake2BCredential],
@@ -248,28 +273,32 @@ async def create_state_query_client(
         Query delegations and rewards
         """
         await ensure_socket_is_open(websocket_app)
-        return await delegations_and_rewards(context, stake_key_hashes)
+        return await cached(
+            "delegations_and_rewards",
+            lambda: delegations_and_rewards(context, stake_key_hashes),
+            stake_key_hashes,
+        )
 
     async def query_era_start() -> Bound:
         """
         Query the era start
         """
         await ensure_socket_is_open(websocket_app)
-        return await era_start(context)
+        return await cached("era_start", lambda: era_start(context))
 
     async def query_era_summaries() -> List[EraSummary]:
         """
         Query the era summaries
         """
         await ensure_socket_is_open(websocket_app)
-        return await era_summaries(context)
+        return await cached("era_summaries", lambda: era_summaries(context))
 
     async def query_genesis_config(era: EraWithGenesis) -> List[EraSummary]:
         """
         Query the genesis config
         """
         await ensure_socket_is_open(websocket_app)
-        return await genesis_config(context, era)
+        return await cached("genesis_config", lambda: genesis_config(context, era), era)
 
     async def query_ledger_tip() -> PointOrOrigin:
         """
@@ -285,28 +314,34 @@ async def create_state_query_client(
         Query non myopic member rewards
         """
         await ensure_socket_is_open(websocket_app)
-        return await non_myopic_member_rewards(context, input_list)
+        return await cached(
+            "non_myopic_member_rewards",
+            lambda: non_myopic_member_rewards(context, input_list),
+            input_list,
+        )
 
     async def query_pool_ids() -> List[PoolId]:
         """
         Query pool ids
         """
         await ensure_socket_is_open(websocket_app)
-        return await pool_ids(context)
+        return await cached("pool_ids", lambda: pool_ids(context))
 
     async def query_pool_parameters(pools: List[PoolId]) -> Dict[str, PoolParameters]:
         """
         Query pool parameters
         """
         await ensure_socket_is_open(websocket_app)
-        return await pool_parameters(context, pools)
+        return await cached(
+            "pool_parameters", lambda: pool_parameters(context, pools), pools
+        )
 
     async def query_pools_ranking() -> PoolsRanking:
         """
         Query pools ranking
         """
         await ensure_socket_is_open(websocket_app)
-        return await pools_ranking(context)
+        return await cached("pools_ranking", lambda: pools_ranking(context))
 
     async def query_proposed_protocol_parameters() -> Dict[
         str, ProtocolParametersShelley
@@ -317,35 +352,40 @@ async def create_state_query_client(
         Query proposed protocol parameters
         """
         await ensure_socket_is_open(websocket_app)
-        return await proposed_protocol_parameters(context)
+        return await cached(
+            "proposed_protocol_parameters",
+            lambda: proposed_protocol_parameters(context),
+        )
 
     async def query_rewards_provenance() -> RewardsProvenance:
         """
         Query rewards provenance
         """
         await ensure_socket_is_open(websocket_app)
-        return await rewards_provenance(context)
+        return await cached("rewards_provenance", lambda: rewards_provenance(context))
 
     async def query_rewards_provenance_new() -> RewardsProvenanceNew:
         """
         Query rewards provenance new
         """
         await ensure_socket_is_open(websocket_app)
-        return await rewards_provenance_new(context)
+        return await cached(
+            "rewards_provenance_new", lambda: rewards_provenance_new(context)
+        )
 
     async def query_stake_distribution() -> PoolDistribution:
         """
         Query stake distribution
         """
         await ensure_socket_is_open(websocket_app)
-        return await stake_distribution(context)
+        return await cached("stake_distribution", lambda: stake_distribution(context))
 
     async def query_system_start() -> UtcTime:
         """
         Query system start
         """
         await ensure_socket_is_open(websocket_app)
-        return await system_start(context)
+        return await cached("system_start", lambda: system_start(context))
 
     try:
 
@@ -386,8 +426,9 @@ async def create_state_query_client(
                 await_acquire_request = RequestAwaitAcquire.from_base(
                     mirror={"requestId": str(await_acquire_request_id)}
                 )
-                websocket_app.send(await_acquire_request.model_dump_json())
-                await_acquire_result = websocket_app.sock.recv()
+                await_acquire_result = await context.multiplexer.request(
+                    await_acquire_request
+                )
                 acquire_response = AcquireResponse(**json.loads(await_acquire_result))
 
                 if acquire_response.reflection.requestId != await_acquire_request_id:
@@ -396,7 +437,7 @@ async def create_state_query_client(
                 if isinstance(acquire_response.result, AcquireSuccessResult):
                     return create_client()
                 elif isinstance(acquire_response.result, AcquireFailureResult):
-                    websocket_app.close()
+                    await websocket_app.close()
                     failure = acquire_response.result.AcquireFailure.failure
                     match failure:
                         case AcquireFailureDetails.POINT_TOO_OLD:
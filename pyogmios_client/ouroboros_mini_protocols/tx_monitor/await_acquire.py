@@ -21,9 +21,7 @@ async def await_acquire(context: InteractionContext, args: dict) -> Slot:
         args=args,
     )
     try:
-        websocket = context.socket
-        websocket.send(request.model_dump_json())
-        result = websocket.sock.recv()
+        result = await context.multiplexer.request(request)
         await_acquire_response = AwaitAcquireResponse(**json.loads(result))
         return handle_await_acquire_response(await_acquire_response)
     except Exception as error:
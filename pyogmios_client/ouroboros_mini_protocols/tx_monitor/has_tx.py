@@ -20,9 +20,7 @@ async def has_tx(context: InteractionContext, tx_id: TxId) -> bool:
         args={"id": tx_id},
     )
     try:
-        websocket = context.socket
-        websocket.send(request.model_dump_json())
-        result = websocket.sock.recv()
+        result = await context.multiplexer.request(request)
         has_tx_response = HasTxResponse(**json.loads(result))
         return handle_has_tx_response(has_tx_response)
     except Exception as error:
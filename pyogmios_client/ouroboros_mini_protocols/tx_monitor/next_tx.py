@@ -23,9 +23,7 @@ async def next_tx(
         args=args,
     )
     try:
-        websocket = context.socket
-        websocket.send(request.model_dump_json())
-        result = websocket.sock.recv()
+        result = await context.multiplexer.request(request)
         next_tx_response = NextTxResponse(**json.loads(result))
         return handle_next_tx_response(next_tx_response)
     except Exception as error:
@@ -20,9 +20,7 @@ async def release(context: InteractionContext, args: Dict) -> str:
         args=args,
     )
     try:
-        websocket = context.socket
-        websocket.send(request.model_dump_json())
-        result = websocket.sock.recv()
+        result = await context.multiplexer.request(request)
         release_response = ReleaseMempoolResponse(**json.loads(result))
         return handle_release_response(release_response)
     except Exception as error:
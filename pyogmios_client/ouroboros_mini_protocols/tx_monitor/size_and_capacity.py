@@ -21,9 +21,7 @@ async def size_and_capacity(context: InteractionContext, args: Dict) -> str:
         args=args,
     )
     try:
-        websocket = context.socket
-        websocket.send(request.model_dump_json())
-        result = websocket.sock.recv()
+        result = await context.multiplexer.request(request)
         release_response = SizeAndCapacityResponse(**json.loads(result))
         return handle_size_and_capacity_response(release_response)
     except Exception as error:
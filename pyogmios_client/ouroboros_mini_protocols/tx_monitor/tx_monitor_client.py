@@ -30,6 +30,8 @@ async def create_tx_monitor_client(context: InteractionContext) -> TxMonitorClie
     :param context: The interaction context
     :return: The tx monitor client
     """
+    if context.lease:
+        context = await context.lease()
     websocket_app = context.socket
 
     async def default_await_acquire(args: dict) -> Slot:
@@ -79,7 +81,7 @@ async def create_tx_monitor_client(context: InteractionContext) -> TxMonitorClie
         """
         try:
             await ensure_socket_is_open(websocket_app)
-            websocket_app.close()
+            await websocket_app.close()
         except Exception as err:
             print(err)
         else:
@@ -92,7 +92,7 @@ async def create_tx_submission_client(
             """
             try:
                 await ensure_socket_is_open(websocket_app)
-                websocket_app.close()
+                await websocket_app.close()
             except (WebSocketClosedError, AttributeError):
                 print("TxSubmission Client already closed.")
             else:
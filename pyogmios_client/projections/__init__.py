@@ -0,0 +1,5 @@
+"""
+Projections
+
+This package contains the local views of the ledger maintained from chain sync events.
+"""
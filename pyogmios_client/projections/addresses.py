@@ -0,0 +1,62 @@
+"""
+Addresses module
+
+This module contains the helpers reading the credentials of Shelley addresses.
+"""
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+BECH32_CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+BECH32_VALUES = {character: value for value, character in enumerate(BECH32_CHARSET)}
+CHECKSUM_LENGTH = 6
+CREDENTIAL_LENGTH = 28
+
+
+def bech32_decode(text: str) -> Tuple[str, bytes]:
+    """
+    Decode a bech32 string, without the length limit, as Cardano addresses exceed it.
+    The checksum is not verified, the addresses are read from the chain.
+    :param text: The bech32 string
+    :return: The human readable part and the data
+    """
+    text = text.lower()
+    separator = text.rfind("1")
+    if separator < 1:
+        raise ValueError(f"Not a bech32 string: {text}")
+    words: List[int] = [BECH32_VALUES[character] for character in text[separator + 1 :]]
+    accumulator = bits = 0
+    data = bytearray()
+    for word in words[:-CHECKSUM_LENGTH]:
+        accumulator = (accumulator << 5) | word
+        bits += 5
+        if bits >= 8:
+            bits -= 8
+            data.append((accumulator >> bits) & 0xFF)
+    return text[:separator], bytes(data)
+
+
+@lru_cache(maxsize=65536)
+def address_credentials(address: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Get the payment and stake credentials of an address.
+    Base addresses have both, pointer and enterprise addresses a payment credential only,
+    reward addresses a stake credential only, and Byron addresses none.
+    :param address: The bech32 address
+    :return: The payment and stake credentials, hex encoded, or None
+    """
+    try:
+        prefix, data = bech32_decode(address)
+    except (KeyError, ValueError):
+        return None, None
+    if not data or not prefix.startswith(("addr", "stake")):
+        return None, None
+    address_type = data[0] >> 4
+    first = data[1 : 1 + CREDENTIAL_LENGTH].hex()
+    if address_type <= 3:
+        second = data[1 + CREDENTIAL_LENGTH : 1 + 2 * CREDENTIAL_LENGTH].hex()
+        return first, second
+    if address_type <= 7:
+        return first, None
+    if address_type in (14, 15):
+        return None, first
+    return None, None
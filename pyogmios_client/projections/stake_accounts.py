@@ -0,0 +1,218 @@
+"""
+Stake accounts module
+
+This module contains the registration and delegation state of stake credentials projected from chain sync events.
+"""
+import sys
+from collections import deque
+from typing import Any, Deque, Dict, List, NamedTuple, Optional, Tuple
+
+from pyogmios_client.exceptions import RollbackTooDeepError
+from pyogmios_client.models import Point, PointOrOrigin
+from pyogmios_client.models.base_model import BaseModel
+from pyogmios_client.models.result_models import RollBackward
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.find_intersect import (
+    create_point_from_roll_forward,
+)
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.volatile_chain import (
+    SECURITY_PARAMETER,
+)
+from pyogmios_client.projections.addresses import address_credentials
+from pyogmios_client.projections.transactions import block_transactions
+
+
+class StakeAccount(NamedTuple):
+    """
+    The state of a registered stake credential.
+    """
+
+    pool: Optional[str]
+    """The pool the credential last delegated to, or None"""
+    withdrawn: int
+    """The lovelace withdrawn from the reward account since it was tracked"""
+
+
+# The previous state of the credentials a block changed, None when unregistered
+UndoEntry = Tuple[int, List[Tuple[str, Optional[StakeAccount]]]]
+
+
+class StakeAccounts:
+    """
+    Registered stake credentials, their delegation and withdrawals, applied from roll forwards.
+
+    Stake key registration, deregistration and delegation certificates and withdrawals are
+    folded in block order, withdrawals of a transaction before its certificates as the ledger
+    does, and transactions failing phase-2 validation are ignored. Each block keeps an undo
+    entry for ``depth`` blocks, so roll backwards are undone exactly. The accounts are complete
+    when synced from the origin or seeded with a ``delegationsAndRewards`` query.
+
+    Reward balances depend on the ledger reward calculation and are not projected, only what
+    was withdrawn.
+    """
+
+    def __init__(self, depth: int = SECURITY_PARAMETER):
+        self.depth = max(depth, 1)
+        self.tip: Optional[Point] = None
+        self._accounts: Dict[str, StakeAccount] = {}
+        self._undo: Deque[UndoEntry] = deque()
+        self._horizon = -1
+
+    def __len__(self) -> int:
+        return len(self._accounts)
+
+    def __contains__(self, credential: str) -> bool:
+        return self._credential(credential) in self._accounts
+
+    def seed(self, accounts: Dict[str, Any]) -> None:
+        """
+        Add registered credentials, e.g. from a ``delegationsAndRewards`` query.
+        :param accounts: The credentials with their :class:`DelegationsAndRewards`, models or raw JSON
+        """
+        for credential, account in accounts.items():
+            if isinstance(account, BaseModel):
+                account = account.model_dump(mode="json")
+            self._accounts[credential] = StakeAccount(
+                self._pool((account or {}).get("delegate")), 0
+            )
+
+    def apply(self, event: Any) -> None:
+        """
+        Apply a chain sync event.
+        :param event: A roll forward, its block decoded or lazy, or a roll backward
+        """
+        if isinstance(event, RollBackward):
+            self.roll_backward(event.point)
+        else:
+            self.roll_forward(event)
+
+    def roll_forward(self, event: Any) -> None:
+        """
+        Apply the certificates and withdrawals of the transactions of a block.
+        Byron epoch boundary blocks hold no transactions and are skipped.
+        :param event: The roll forward, its block decoded or lazy
+        """
+        point = create_point_from_roll_forward(event)
+        if point is None:
+            return
+        changed: List[Tuple[str, Optional[StakeAccount]]] = []
+        for tx in block_transactions(event):
+            if tx.get("inputSource") == "collaterals":
+                continue
+            body = tx.get("body") or {}
+            for account, amount in (body.get("withdrawals") or {}).items():
+                credential = self._credential(account)
+                state = self._accounts.get(credential)
+                if state is not None and amount:
+                    self._set(
+                        credential,
+                        state._replace(withdrawn=state.withdrawn + amount),
+                        changed,
+                    )
+            for certificate in body.get("certificates") or ():
+                self._certify(certificate, changed)
+        self._undo.append((point.slot, changed))
+        while len(self._undo) > self.depth:
+            self._horizon = self._undo.popleft()[0]
+        self.tip = point
+
+    def roll_backward(self, point: PointOrOrigin) -> None:
+        """
+        Revert the blocks after a point.
+        :param point: The point the chain rolled back to
+        """
+        slot = point.slot if isinstance(point, Point) else -1
+        if slot < self._horizon:
+            raise RollbackTooDeepError(point)
+        while self._undo and self._undo[-1][0] > slot:
+            _, changed = self._undo.pop()
+            for credential, state in reversed(changed):
+                if state is None:
+                    self._accounts.pop(credential, None)
+                else:
+                    self._accounts[credential] = state
+        self.tip = point if isinstance(point, Point) else None
+
+    def get(self, credential: str) -> Optional[StakeAccount]:
+        """
+        Find the state of a stake credential.
+        :param credential: The credential, hex encoded, or its reward account address
+        :return: The state or None if the credential is not registered
+        """
+        return self._accounts.get(self._credential(credential))
+
+    def delegate(self, credential: str) -> Optional[str]:
+        """
+        Find the pool a stake credential delegates to.
+        :param credential: The credential, hex encoded, or its reward account address
+        :return: The pool id or None if the credential is not registered or delegated
+        """
+        state = self.get(credential)
+        return state.pool if state is not None else None
+
+    def _certify(
+        self,
+        certificate: Dict[str, Any],
+        changed: List[Tuple[str, Optional[StakeAccount]]],
+    ) -> None:
+        """
+        Apply a certificate.
+        :param certificate: The raw certificate
+        :param changed: The undo entry of the block
+        """
+        if "stakeKeyRegistration" in certificate:
+            credential = certificate["stakeKeyRegistration"]
+            if credential not in self._accounts:
+                self._set(credential, StakeAccount(None, 0), changed)
+        elif "stakeKeyDeregistration" in certificate:
+            credential = certificate["stakeKeyDeregistration"]
+            if credential in self._accounts:
+                self._set(credential, None, changed)
+        elif "stakeDelegation" in certificate:
+            delegation = certificate["stakeDelegation"]
+            credential = delegation["delegator"]
+            state = self._accounts.get(credential, StakeAccount(None, 0))
+            self._set(
+                credential,
+                state._replace(pool=self._pool(delegation["delegatee"])),
+                changed,
+            )
+
+    def _set(
+        self,
+        credential: str,
+        state: Optional[StakeAccount],
+        changed: List[Tuple[str, Optional[StakeAccount]]],
+    ) -> None:
+        """
+        Change the state of a credential, keeping the previous one in the undo entry of the block.
+        :param credential: The credential
+        :param state: The new state, None to unregister the credential
+        :param changed: The undo entry of the block
+        """
+        changed.append((credential, self._accounts.get(credential)))
+        if state is None:
+            del self._accounts[credential]
+        else:
+            self._accounts[credential] = state
+
+    @staticmethod
+    def _pool(pool_id: Optional[str]) -> Optional[str]:
+        """
+        Intern a pool id, shared by the many credentials delegating to the pool.
+        :param pool_id: The pool id
+        :return: The interned pool id
+        """
+        return sys.intern(pool_id) if pool_id else None
+
+    @staticmethod
+    def _credential(account: str) -> str:
+        """
+        Get the credential of a reward account.
+        :param account: The reward account address, or the credential hex encoded
+        :return: The credential, hex encoded
+        """
+        if account.startswith("stake"):
+            _, stake = address_credentials(account)
+            if stake is not None:
+                return stake
+        return account
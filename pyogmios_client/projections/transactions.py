@@ -0,0 +1,64 @@
+"""
+Transactions module
+
+This module contains the helpers reading the transactions of chain sync events as raw JSON.
+"""
+from typing import Any, Dict, List, Tuple
+
+from pyogmios_client.models.header_model import HeaderRollForward
+from pyogmios_client.models.lazy_block_model import LazyRollForward
+from pyogmios_client.models.result_models import RollForward
+
+TxKey = Tuple[str, int]
+
+
+def block_transactions(event: RollForward | LazyRollForward) -> List[Dict[str, Any]]:
+    """
+    Get the transactions of a roll forward as raw JSON, in block order.
+    Lazy blocks are read without decoding their body.
+    :param event: The roll forward
+    :return: The transactions
+    """
+    if isinstance(event, HeaderRollForward):
+        raise ValueError("Projections need the transactions, not a header only sync")
+    era = event.block.block_type
+    if isinstance(event, LazyRollForward):
+        body = event.block.raw[era].get("body")
+        if era == "byron" and body is not None:
+            body = body["txPayload"]
+        return body or []
+    body = getattr(getattr(event.block, era), "body", None)
+    if body is None:
+        return []
+    if era == "byron":
+        body = body.txPayload
+    return [tx.model_dump(mode="json", by_alias=True) for tx in body]
+
+
+def tx_key(tx_in: Dict[str, Any]) -> TxKey:
+    """
+    Get the key of a transaction input.
+    :param tx_in: The raw input
+    :return: The transaction id and output index
+    """
+    return tx_in["txId"], tx_in["index"]
+
+
+def spent_and_created(
+    tx: Dict[str, Any]
+) -> Tuple[List[Dict[str, Any]], List[Tuple[int, Dict[str, Any]]]]:
+    """
+    Get the inputs a transaction spends and the outputs it creates.
+    A transaction failing phase-2 validation (``inputSource`` of ``collaterals``) spends its
+    collaterals and only creates its collateral return, at the index following its outputs.
+    :param tx: The raw transaction
+    :return: The inputs spent and the outputs created with their index
+    """
+    body = tx["body"]
+    if tx.get("inputSource") == "collaterals":
+        collateral_return = body.get("collateralReturn")
+        created = (
+            [(len(body["outputs"]), collateral_return)] if collateral_return else []
+        )
+        return body.get("collaterals", []), created
+    return body["inputs"], list(enumerate(body["outputs"]))
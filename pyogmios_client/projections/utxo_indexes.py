@@ -0,0 +1,116 @@
+"""
+UTxO indexes module
+
+This module contains the secondary indexes of a UTxO set, mapping keys read from outputs to row ids.
+"""
+import sys
+from typing import Any, Callable, Dict, Iterable, Iterator, Set, Union
+
+from pyogmios_client.projections.addresses import address_credentials
+
+KeyFunction = Callable[[Dict[str, Any]], Iterable[str]]
+
+
+def address_keys(tx_out: Dict[str, Any]) -> Iterable[str]:
+    """
+    Get the address of an output.
+    :param tx_out: The raw output
+    :return: The address
+    """
+    return (tx_out["address"],)
+
+
+def payment_credential_keys(tx_out: Dict[str, Any]) -> Iterable[str]:
+    """
+    Get the payment credential of the address of an output.
+    :param tx_out: The raw output
+    :return: The payment credential, hex encoded, if the address has one
+    """
+    payment, _ = address_credentials(tx_out["address"])
+    return (payment,) if payment else ()
+
+
+def stake_credential_keys(tx_out: Dict[str, Any]) -> Iterable[str]:
+    """
+    Get the stake credential of the address of an output.
+    :param tx_out: The raw output
+    :return: The stake credential, hex encoded, if the address has one
+    """
+    _, stake = address_credentials(tx_out["address"])
+    return (stake,) if stake else ()
+
+
+def asset_keys(tx_out: Dict[str, Any]) -> Iterable[str]:
+    """
+    Get the assets of an output.
+    :param tx_out: The raw output
+    :return: The asset ids, ``policyId.assetName`` or ``policyId`` for an empty name
+    """
+    return (tx_out.get("value") or {}).get("assets") or ()
+
+
+INDEX_KEYS: Dict[str, KeyFunction] = {
+    "address": address_keys,
+    "payment_credential": payment_credential_keys,
+    "stake_credential": stake_credential_keys,
+    "asset": asset_keys,
+}
+
+
+class HashIndex:
+    """
+    Maps the keys of outputs to their row ids.
+
+    Keys are interned and a key held by a single row maps to the bare row id, a set is only
+    allocated for keys shared by several rows, which most addresses and assets are not.
+    """
+
+    def __init__(self, keys: KeyFunction):
+        self.keys = keys
+        self._rows: Dict[str, Union[int, Set[int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(self, row: int, tx_out: Dict[str, Any]) -> None:
+        """
+        Index an output.
+        :param row: The row id of the output
+        :param tx_out: The raw output
+        """
+        for key in self.keys(tx_out):
+            rows = self._rows.get(key)
+            if rows is None:
+                self._rows[sys.intern(key)] = row
+            elif isinstance(rows, set):
+                rows.add(row)
+            elif rows != row:
+                self._rows[key] = {rows, row}
+
+    def remove(self, row: int, tx_out: Dict[str, Any]) -> None:
+        """
+        Stop indexing an output.
+        :param row: The row id of the output
+        :param tx_out: The raw output
+        """
+        for key in self.keys(tx_out):
+            rows = self._rows.get(key)
+            if rows == row:
+                del self._rows[key]
+            elif isinstance(rows, set):
+                rows.discard(row)
+                if len(rows) == 1:
+                    self._rows[key] = rows.pop()
+
+    def rows(self, key: str) -> Iterator[int]:
+        """
+        Iterate over the row ids of a key.
+        :param key: The key
+        :return: The row ids
+        """
+        rows = self._rows.get(key)
+        if rows is None:
+            return iter(())
+        if isinstance(rows, set):
+            return iter(list(rows))
+        return iter((rows,))
@@ -0,0 +1,265 @@
+"""
+UTxO set module
+
+This module contains the local UTxO set projected from chain sync events.
+"""
+import json
+import sys
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pyogmios_client.exceptions import RollbackTooDeepError
+from pyogmios_client.models import Point, PointOrOrigin, TxIn, TxOut
+from pyogmios_client.models.base_model import BaseModel
+from pyogmios_client.models.result_models import RollBackward
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.find_intersect import (
+    create_point_from_roll_forward,
+)
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.volatile_chain import (
+    SECURITY_PARAMETER,
+)
+from pyogmios_client.projections.transactions import (
+    TxKey,
+    block_transactions,
+    spent_and_created,
+    tx_key,
+)
+from pyogmios_client.projections.utxo_indexes import INDEX_KEYS, HashIndex
+
+# The outputs a block spent, and the keys of the outputs it created
+UndoEntry = Tuple[int, List[Tuple[TxKey, str]], List[TxKey]]
+# The transaction id, the output index and the output as compact JSON
+Row = Tuple[str, int, str]
+
+
+class UtxoSet:
+    """
+    Unspent outputs applied from roll forwards, indexed by output reference and by the
+    ``indexes`` of :data:`~pyogmios_client.projections.utxo_indexes.INDEX_KEYS`.
+
+    Each block keeps an undo entry for ``depth`` blocks, so a roll backward reverts exactly the
+    outputs its blocks spent and created. The set is complete when synced from the origin or
+    seeded with the result of a ``utxo`` query at the intersection.
+
+    Outputs are stored as compact JSON in rows reused once spent, with interned transaction ids,
+    and the indexes only hold row ids, so a mainnet sized set stays a fraction of its decoded size.
+    """
+
+    def __init__(
+        self,
+        depth: int = SECURITY_PARAMETER,
+        indexes: Sequence[str] = tuple(INDEX_KEYS),
+    ):
+        unknown = set(indexes) - set(INDEX_KEYS)
+        if unknown:
+            raise ValueError(
+                f"Unknown indexes {sorted(unknown)}, use some of {list(INDEX_KEYS)}"
+            )
+        self.depth = max(depth, 1)
+        self.tip: Optional[Point] = None
+        self.indexes: Dict[str, HashIndex] = {
+            name: HashIndex(INDEX_KEYS[name]) for name in indexes
+        }
+        self._rows: List[Optional[Row]] = []
+        self._free: List[int] = []
+        self._row_of: Dict[TxKey, int] = {}
+        self._undo: Deque[UndoEntry] = deque()
+        self._horizon = -1
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    def __contains__(self, tx_in: Any) -> bool:
+        return self._key(tx_in) in self._row_of
+
+    def seed(self, utxos: Iterable[Tuple[Any, Any]]) -> None:
+        """
+        Add outputs known to be unspent, e.g. from a ``utxo`` query.
+        :param utxos: The pairs of :class:`TxIn` and :class:`TxOut`, models or raw JSON
+        """
+        for tx_in, tx_out in utxos:
+            if isinstance(tx_out, BaseModel):
+                tx_out = tx_out.model_dump(mode="json", by_alias=True)
+            self._add(self._key(tx_in), self._dump(tx_out))
+
+    def apply(self, event: Any) -> None:
+        """
+        Apply a chain sync event.
+        :param event: A roll forward, its block decoded or lazy, or a roll backward
+        """
+        if isinstance(event, RollBackward):
+            self.roll_backward(event.point)
+        else:
+            self.roll_forward(event)
+
+    def roll_forward(self, event: Any) -> None:
+        """
+        Spend the inputs and add the outputs of the transactions of a block.
+        Byron epoch boundary blocks hold no transactions and are skipped.
+        :param event: The roll forward, its block decoded or lazy
+        """
+        point = create_point_from_roll_forward(event)
+        if point is None:
+            return
+        spent: List[Tuple[TxKey, str]] = []
+        created: List[TxKey] = []
+        for tx in block_transactions(event):
+            inputs, outputs = spent_and_created(tx)
+            for tx_in in inputs:
+                key = tx_key(tx_in)
+                tx_out = self._remove(key)
+                if tx_out is not None:
+                    spent.append((key, tx_out))
+            for index, tx_out in outputs:
+                key = (tx["id"], index)
+                self._add(key, self._dump(tx_out))
+                created.append(key)
+        self._undo.append((point.slot, spent, created))
+        while len(self._undo) > self.depth:
+            self._horizon = self._undo.popleft()[0]
+        self.tip = point
+
+    def roll_backward(self, point: PointOrOrigin) -> None:
+        """
+        Revert the blocks after a point.
+        :param point: The point the chain rolled back to
+        """
+        slot = point.slot if isinstance(point, Point) else -1
+        if slot < self._horizon:
+            raise RollbackTooDeepError(point)
+        while self._undo and self._undo[-1][0] > slot:
+            _, spent, created = self._undo.pop()
+            # Spent first, an output created and spent within the block is then removed too
+            for key, tx_out in reversed(spent):
+                self._add(key, tx_out)
+            for key in reversed(created):
+                self._remove(key)
+        self.tip = point if isinstance(point, Point) else None
+
+    def get(self, tx_in: Any) -> Optional[TxOut]:
+        """
+        Find an unspent output.
+        :param tx_in: The output reference, a :class:`TxIn` or raw JSON
+        :return: The output or None if it is spent or unknown
+        """
+        row = self._row_of.get(self._key(tx_in))
+        return (
+            TxOut.model_validate_json(self._rows[row][2]) if row is not None else None
+        )
+
+    def by_address(self, address: str) -> List[Tuple[TxIn, TxOut]]:
+        """
+        Find the unspent outputs of an address.
+        :param address: The address
+        :return: The output references and outputs
+        """
+        return self._lookup("address", address)
+
+    def by_payment_credential(self, credential: str) -> List[Tuple[TxIn, TxOut]]:
+        """
+        Find the unspent outputs of the addresses sharing a payment credential.
+        :param credential: The key or script hash, hex encoded
+        :return: The output references and outputs
+        """
+        return self._lookup("payment_credential", credential)
+
+    def by_stake_credential(self, credential: str) -> List[Tuple[TxIn, TxOut]]:
+        """
+        Find the unspent outputs of the base addresses delegating with a stake credential.
+        :param credential: The key or script hash, hex encoded
+        :return: The output references and outputs
+        """
+        return self._lookup("stake_credential", credential)
+
+    def by_asset(
+        self, policy_id: str, asset_name: str = ""
+    ) -> List[Tuple[TxIn, TxOut]]:
+        """
+        Find the unspent outputs holding an asset.
+        :param policy_id: The policy id, hex encoded
+        :param asset_name: The asset name, hex encoded
+        :return: The output references and outputs
+        """
+        return self._lookup(
+            "asset", f"{policy_id}.{asset_name}" if asset_name else policy_id
+        )
+
+    def _lookup(self, index: str, key: str) -> List[Tuple[TxIn, TxOut]]:
+        """
+        Find the unspent outputs of a key of an index.
+        :param index: The name of the index
+        :param key: The key
+        :return: The output references and outputs
+        """
+        if index not in self.indexes:
+            raise ValueError(f"The {index} index is not maintained by this set")
+        result = []
+        for row in self.indexes[index].rows(key):
+            tx_id, output_index, tx_out = self._rows[row]
+            result.append(
+                (
+                    TxIn(txId=tx_id, index=output_index),
+                    TxOut.model_validate_json(tx_out),
+                )
+            )
+        return result
+
+    def _add(self, key: TxKey, tx_out: str) -> None:
+        """
+        Add an output to the set and the indexes.
+        :param key: The output reference
+        :param tx_out: The output as compact JSON
+        """
+        if key in self._row_of:
+            self._remove(key)
+        tx_id, index = key
+        entry = (sys.intern(tx_id), index, tx_out)
+        if self._free:
+            row = self._free.pop()
+            self._rows[row] = entry
+        else:
+            row = len(self._rows)
+            self._rows.append(entry)
+        self._row_of[(entry[0], index)] = row
+        if self.indexes:
+            raw = json.loads(tx_out)
+            for hash_index in self.indexes.values():
+                hash_index.add(row, raw)
+
+    def _remove(self, key: TxKey) -> Optional[str]:
+        """
+        Remove an output from the set and the indexes.
+        :param key: The output reference
+        :return: The output as compact JSON or None if it was not in the set
+        """
+        row = self._row_of.pop(key, None)
+        if row is None:
+            return None
+        tx_out = self._rows[row][2]
+        self._rows[row] = None
+        self._free.append(row)
+        if self.indexes:
+            raw = json.loads(tx_out)
+            for hash_index in self.indexes.values():
+                hash_index.remove(row, raw)
+        return tx_out
+
+    @staticmethod
+    def _dump(tx_out: Dict[str, Any]) -> str:
+        """
+        Serialize an output compactly.
+        :param tx_out: The raw output
+        :return: The output as compact JSON
+        """
+        return json.dumps(tx_out, separators=(",", ":"))
+
+    @staticmethod
+    def _key(tx_in: Any) -> TxKey:
+        """
+        Get the key of an output reference.
+        :param tx_in: The output reference, a :class:`TxIn` or raw JSON
+        :return: The transaction id and output index
+        """
+        if isinstance(tx_in, BaseModel):
+            tx_in = tx_in.model_dump(mode="json")
+        return tx_key(tx_in)
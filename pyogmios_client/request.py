@@ -3,22 +3,22 @@ This module contains the send function.
 
 The send function is used to send requests and call the after each function.
 """
+import inspect
 import json
 import logging
 from typing import Callable, TypeVar
 
-from websocket import WebSocketApp, WebSocketConnectionClosedException
-
 from pyogmios_client.connection import InteractionContext
 from pyogmios_client.enums import Type
 from pyogmios_client.exceptions import JsonwspFaultError
 from pyogmios_client.models.request_model import Request
 from pyogmios_client.models.response_model import Response
+from pyogmios_client.transport import Transport
 
 T = TypeVar("T")
 
 
-async def send(to_send: Callable[[WebSocketApp], T], context: InteractionContext) -> T:
+async def send(to_send: Callable[[Transport], T], context: InteractionContext) -> T:
     """
     Sends a request to the node.
     :param to_send: The function to send the request.
@@ -33,24 +33,22 @@ async def send(to_send: Callable[[WebSocketApp], T], context: InteractionContext
     except Exception as error:
         raise error
     else:
-        after_each(socket, lambda: logging.debug(result))
+        completion = after_each(socket, lambda: logging.debug(result))
+        if inspect.isawaitable(completion):
+            await completion
         return result
 
 
 async def send_request(request: Request, context: InteractionContext) -> Response:
     """
     Sends a request to Ogmios. Raises an exception if the response is a fault or the connection is closed.
+    Requests are multiplexed, so any number of them may be in flight on the same context.
     :param request: The request to send.
     :param context: The interaction context to use for the request.
     :return: The response.
     """
-    try:
-        websocket = context.socket
-        websocket.send(request.model_dump_json())
-        result = websocket.sock.recv()
-        response = Response(**json.loads(result))
-        if response.type is Type.JSONWSP_FAULT:
-            raise JsonwspFaultError(response.fault["code"], response.fault["string"])
-        return response
-    except WebSocketConnectionClosedException as error:
-        raise error
+    result = await context.multiplexer.request(request)
+    response = Response(**json.loads(result))
+    if response.type is Type.JSONWSP_FAULT:
+        raise JsonwspFaultError(response.fault["code"], response.fault["string"])
+    return response
@@ -3,12 +3,14 @@ Server health module
 
 This module contains the functions to check the server health.
 """
-from typing import Optional
+import asyncio
+import time
+from typing import Dict, Optional, Tuple
 
-import aiohttp
 from pyogmios_client.models.base_model import BaseModel
 
 from pyogmios_client.exceptions import RequestError
+from pyogmios_client.http_session import get_session
 from pyogmios_client.models.server_health_model import ServerHealth
 
 
@@ -47,20 +49,52 @@ class Options(BaseModel):
     """
 
     connection: Connection
+    max_age: float = 0
+
+
+_health_cache: Dict[str, Tuple[float, ServerHealth]] = {}
+_health_requests: Dict[str, asyncio.Task] = {}
 
 
 async def get_server_health(options: Options) -> ServerHealth | RequestError:
     """
     Checks the server health.
+    A health fetched less than ``options.max_age`` seconds ago is reused, and concurrent checks
+    of the same server share one request.
     :param options: The options
     :return: The server health or an error
     """
     url = f"{options.connection.address.http}/health"
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url=url) as response:
-            if response.status == 200:
-                server_health = ServerHealth(**await response.json())
-            else:
-                raise RequestError(response=response)
+    if options.max_age <= 0:
+        return await fetch_server_health(url)
+
+    cached = _health_cache.get(url)
+    if cached is not None and time.monotonic() - cached[0] < options.max_age:
+        return cached[1]
+
+    request = _health_requests.get(url)
+    if request is None or request.get_loop() is not asyncio.get_running_loop():
+        request = asyncio.ensure_future(fetch_server_health(url))
+        _health_requests[url] = request
+        request.add_done_callback(
+            lambda done: _health_requests.pop(url, None)
+            if _health_requests.get(url) is done
+            else None
+        )
+    return await asyncio.shield(request)
+
+
+async def fetch_server_health(url: str) -> ServerHealth:
+    """
+    Fetch the server health and cache it.
+    :param url: The health url
+    :return: The server health
+    """
+    async with get_session().get(url=url) as response:
+        if response.status == 200:
+            server_health = ServerHealth(**await response.json())
+        else:
+            raise RequestError(response=response)
 
+    _health_cache[url] = (time.monotonic(), server_health)
     return server_health
@@ -0,0 +1,184 @@
+"""
+Transport module
+
+This module contains the transports used to exchange messages with the server.
+"""
+from __future__ import annotations
+
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Coroutine, Optional
+
+from aiohttp import ClientSession, ClientWebSocketResponse, WSCloseCode, WSMsgType
+
+from pyogmios_client.exceptions import WebSocketClosedError
+from pyogmios_client.http_session import get_session
+
+ErrorHandler = Callable[["Transport", Exception], None]
+CloseHandler = Callable[["Transport", int, str], None]
+TransportFactory = Callable[..., Coroutine[Any, Any, "Transport"]]
+
+
+class Transport(ABC):
+    """
+    Message transport used by an interaction context to talk to the server
+    """
+
+    @property
+    @abstractmethod
+    def connected(self) -> bool:
+        """
+        Whether the transport is open.
+        :return: True if messages can be sent and received
+        """
+
+    @abstractmethod
+    async def send(self, message: str) -> None:
+        """
+        Send a message.
+        :param message: The message
+        """
+
+    @abstractmethod
+    async def receive(self) -> str:
+        """
+        Receive the next message. Raises :class:`WebSocketClosedError` once the transport is closed.
+        :return: The message
+        """
+
+    @abstractmethod
+    async def close(self, code: int = WSCloseCode.OK, reason: str = "") -> None:
+        """
+        Close the transport.
+        :param code: The close status code
+        :param reason: The close reason
+        """
+
+
+class AiohttpTransport(Transport):
+    """
+    Asyncio native websocket transport built on aiohttp
+    """
+
+    def __init__(
+        self,
+        web_socket: ClientWebSocketResponse,
+        session: ClientSession,
+        owns_session: bool = True,
+        error_handler: Optional[ErrorHandler] = None,
+        close_handler: Optional[CloseHandler] = None,
+        trace: bool = False,
+    ):
+        self._web_socket = web_socket
+        self._session = session
+        self._owns_session = owns_session
+        self._error_handler = error_handler
+        self._close_handler = close_handler
+        self._trace = trace
+
+    @staticmethod
+    async def connect(
+        url: str,
+        max_payload: int,
+        session: Optional[ClientSession] = None,
+        error_handler: Optional[ErrorHandler] = None,
+        close_handler: Optional[CloseHandler] = None,
+        trace: bool = False,
+    ) -> AiohttpTransport:
+        """
+        Open a websocket connection.
+        :param url: The websocket url
+        :param max_payload: The maximum message size in bytes
+        :param session: The client session to connect with, a private one is created if omitted
+        :param error_handler: The error handler
+        :param close_handler: The close handler
+        :param trace: Whether to log every frame sent and received
+        :return: The :class:`AiohttpTransport` object
+        """
+        owns_session = session is None
+        session = session or ClientSession()
+        try:
+            web_socket = await session.ws_connect(
+                url, max_msg_size=max_payload, autoping=True
+            )
+        except Exception:
+            if owns_session:
+                await session.close()
+            raise
+        return AiohttpTransport(
+            web_socket,
+            session,
+            owns_session=owns_session,
+            error_handler=error_handler,
+            close_handler=close_handler,
+            trace=trace,
+        )
+
+    @property
+    def connected(self) -> bool:
+        return not self._web_socket.closed
+
+    async def send(self, message: str) -> None:
+        if self._web_socket.closed:
+            raise WebSocketClosedError()
+        if self._trace:
+            logging.info("send: %s", message)
+        await self._web_socket.send_str(message)
+
+    async def receive(self) -> str:
+        message = await self._web_socket.receive()
+        if message.type is WSMsgType.TEXT:
+            if self._trace:
+                logging.info("recv: %s", message.data)
+            return message.data
+        if message.type is WSMsgType.BINARY:
+            return message.data.decode()
+        if message.type is WSMsgType.ERROR:
+            await self._release_session()
+            if self._error_handler:
+                self._error_handler(self, message.data)
+            raise WebSocketClosedError()
+        await self._release_session()
+        if self._close_handler:
+            self._close_handler(self, self._web_socket.close_code, message.extra or "")
+        raise WebSocketClosedError()
+
+    async def close(self, code: int = WSCloseCode.OK, reason: str = "") -> None:
+        if not self._web_socket.closed:
+            await self._web_socket.close(code=code, message=reason.encode())
+            if self._close_handler:
+                self._close_handler(self, code, reason)
+        await self._release_session()
+
+    async def _release_session(self) -> None:
+        """
+        Close the client session if this transport created it.
+        """
+        if self._owns_session and not self._session.closed:
+            await self._session.close()
+
+
+async def connect_transport(
+    url: str,
+    max_payload: int,
+    error_handler: Optional[ErrorHandler] = None,
+    close_handler: Optional[CloseHandler] = None,
+    trace: bool = False,
+) -> Transport:
+    """
+    Default transport factory, connecting through the shared client session.
+    :param url: The websocket url
+    :param max_payload: The maximum message size in bytes
+    :param error_handler: The error handler
+    :param close_handler: The close handler
+    :param trace: Whether to log every frame sent and received
+    :return: The :class:`Transport` object
+    """
+    return await AiohttpTransport.connect(
+        url,
+        max_payload,
+        session=get_session(),
+        error_handler=error_handler,
+        close_handler=close_handler,
+        trace=trace,
+    )
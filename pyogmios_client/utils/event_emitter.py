@@ -1,12 +1,17 @@
 """
-This module contains the EventEmitter class.
+This module contains the EventEmitter and Broadcast classes.
 
-The EventEmitter class can be used to emit events and listen to them.
+The EventEmitter class can be used to emit events and listen to them, the Broadcast class
+fans asynchronous streams out to many subscribers.
 """
-from typing import Dict
+import asyncio
+from collections import deque
+from typing import AsyncIterator, Deque, Dict, Generic, List, Optional, Tuple
 
 from typing import TypeVar, Callable
-from queue import Queue
+
+from pyogmios_client.enums import OverflowPolicy
+from pyogmios_client.exceptions import SubscriberOverflowError
 
 T = TypeVar("T")
 
@@ -17,7 +22,7 @@ class EventEmitter:
     """
 
     def __init__(self):
-        self._callbacks: Dict[str, callable] = {}
+        self._callbacks: Dict[str, List[Callable]] = {}
 
     def on(self, event_name, function):
         """
@@ -26,7 +31,7 @@ class EventEmitter:
         :param function: The function to call when the event is emitted.
         :return: The function that was passed as an argument.
         """
-        self._callbacks[event_name] = self._callbacks.get(event_name, []) + [function]
+        self._callbacks.setdefault(event_name, []).append(function)
         return function
 
     def emit(self, event_name, *args, **kwargs):
@@ -36,7 +41,8 @@ class EventEmitter:
         :param args: The arguments to pass to the listeners.
         :param kwargs: The keyword arguments to pass to the listeners.
         """
-        [function(*args, **kwargs) for function in self._callbacks.get(event_name, [])]
+        for function in self._callbacks.get(event_name, ()):
+            function(*args, **kwargs)
 
     def off(self, event_name, function):
         """
@@ -44,12 +50,18 @@ class EventEmitter:
         :param event_name: The name of the event to remove the listener from.
         :param function: The function to remove.
         """
-        self._callbacks.get(event_name, []).remove(function)
+        if event_name in self._callbacks:
+            # Replaced rather than changed in place, so an emit in progress calls every listener
+            self._callbacks[event_name] = [
+                listener
+                for listener in self._callbacks[event_name]
+                if listener is not function
+            ]
 
 
 def event_emitter_to_generator(
     event_emitter: EventEmitter, event_name: str, match: Callable[[str], T]
-) -> Callable[[], T]:
+) -> Callable[[], AsyncIterator[T]]:
     """
     This function will return a generator that will yield events as they are received.
     :param event_emitter: The event emitter to listen to.
@@ -57,8 +69,7 @@ def event_emitter_to_generator(
     :param match: The function to use to match the received event.
     :return: Yielded events.
     """
-    events = Queue()
-    listeners = Queue()
+    events: asyncio.Queue[T] = asyncio.Queue()
 
     def on_event(e: str) -> None:
         """
@@ -67,23 +78,180 @@ def event_emitter_to_generator(
         """
         matched = match(e)
         if matched is not None:
-            if not listeners.empty():
-                listeners.get()(matched)
-            else:
-                events.put(matched)
+            events.put_nowait(matched)
 
     event_emitter.on(event_name, on_event)
 
     async def generator():
         """
-        This generator will yield events as they are received.
+        This generator will yield events as they are received, it stops listening once closed.
         """
-        while True:
-            if not events.empty():
-                yield events.get()
-            else:
-                listener = Queue()
-                listeners.put(listener)
-                yield await listener.get()
+        try:
+            while True:
+                yield await events.get()
+        finally:
+            event_emitter.off(event_name, on_event)
 
     return generator
+
+
+class Subscription(Generic[T]):
+    """
+    A subscriber of a :class:`Broadcast`, iterated asynchronously.
+    It stops once unsubscribed, or once the broadcast closed and its buffer is drained.
+    """
+
+    def __init__(
+        self, broadcast: "Broadcast[T]", buffer_size: int, overflow: OverflowPolicy
+    ):
+        if buffer_size < 1:
+            raise ValueError("A subscriber needs a buffer size of at least one")
+        self.buffer_size = buffer_size
+        self.overflow = overflow
+        self.dropped = 0
+        self._broadcast = broadcast
+        self._buffer: Deque[T] = deque()
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._closed = False
+        self._error: Optional[Exception] = None
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def __aiter__(self) -> "Subscription[T]":
+        return self
+
+    async def __anext__(self) -> T:
+        while not self._buffer:
+            if self._error is not None:
+                raise self._error
+            if self._closed:
+                raise StopAsyncIteration
+            self._readable.clear()
+            await self._readable.wait()
+        item = self._buffer.popleft()
+        self._writable.set()
+        return item
+
+    def close(self) -> None:
+        """
+        Unsubscribe, dropping the items not read yet.
+        """
+        self._broadcast._unsubscribe(self)
+        self._buffer.clear()
+        self._end()
+
+    def _offer(self, item: T) -> bool:
+        """
+        Add an item to the buffer without waiting.
+        :param item: The item
+        :return: False if the buffer is full and the subscriber blocks the publisher
+        """
+        if self._closed:
+            return True
+        if len(self._buffer) >= self.buffer_size:
+            if self.overflow is OverflowPolicy.BLOCK:
+                return False
+            if self.overflow is OverflowPolicy.DISCONNECT:
+                self.close()
+                self._error = SubscriberOverflowError(self.buffer_size)
+                return True
+            self._buffer.popleft()
+            self.dropped += 1
+        self._buffer.append(item)
+        self._readable.set()
+        return True
+
+    async def _put(self, item: T) -> None:
+        """
+        Wait for room in the buffer, then add an item.
+        :param item: The item
+        """
+        while not self._offer(item):
+            self._writable.clear()
+            await self._writable.wait()
+
+    def _end(self) -> None:
+        """
+        Stop accepting items and wake up the reader and the publisher.
+        """
+        self._closed = True
+        self._readable.set()
+        self._writable.set()
+
+
+class Broadcast(Generic[T]):
+    """
+    Publishes items to every subscriber, each reading through its own bounded buffer.
+
+    Items are shared by the buffers, not copied. A full buffer either blocks the publisher until
+    the subscriber catches up, drops its oldest item, or disconnects the subscriber, whose next
+    read raises :class:`SubscriberOverflowError`.
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = 1024,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+    ):
+        self.buffer_size = buffer_size
+        self.overflow = overflow
+        self._subscribers: Tuple[Subscription[T], ...] = ()
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(
+        self,
+        buffer_size: Optional[int] = None,
+        overflow: Optional[OverflowPolicy] = None,
+    ) -> Subscription[T]:
+        """
+        Add a subscriber, receiving the items published from now on.
+        :param buffer_size: The size of its buffer, the one of the broadcast by default
+        :param overflow: What to do when its buffer is full, the policy of the broadcast by default
+        :return: The subscription, to iterate asynchronously
+        """
+        subscription = Subscription(
+            self, buffer_size or self.buffer_size, overflow or self.overflow
+        )
+        if self._closed:
+            subscription._end()
+        else:
+            self._subscribers += (subscription,)
+        return subscription
+
+    async def publish(self, item: T) -> None:
+        """
+        Hand an item to every subscriber, waiting for those that block while their buffer is full.
+        :param item: The item
+        """
+        for subscriber in self._subscribers:
+            if not subscriber._offer(item):
+                await subscriber._put(item)
+
+    def close(self) -> None:
+        """
+        End the subscriptions once they read the items buffered.
+        """
+        self._closed = True
+        subscribers, self._subscribers = self._subscribers, ()
+        for subscriber in subscribers:
+            subscriber._end()
+
+    def _unsubscribe(self, subscription: Subscription[T]) -> None:
+        """
+        Remove a subscriber.
+        :param subscription: The subscription
+        """
+        self._subscribers = tuple(
+            subscriber
+            for subscriber in self._subscribers
+            if subscriber is not subscription
+        )
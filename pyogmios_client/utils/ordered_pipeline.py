@@ -0,0 +1,117 @@
+"""
+An ordered pipeline of asynchronous tasks.
+
+This module contains the OrderedPipeline class.
+"""
+import asyncio
+import inspect
+import logging
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+
+class OrderedPipeline:
+    """
+    Runs tasks concurrently up to a limit and commits their results in the order they were submitted.
+    A slot is only freed once its task is committed, so a slow task holds back the ones after it.
+
+    The first task or commit failing stops the pipeline: the tasks after it are cancelled without
+    being committed, and :meth:`submit` and :meth:`drain` raise the error from then on.
+    """
+
+    def __init__(self, concurrency: int = 1):
+        if concurrency < 1:
+            raise ValueError("An ordered pipeline needs a concurrency of at least one")
+        self._slots = asyncio.Semaphore(concurrency)
+        self._tasks: asyncio.Queue[
+            Tuple[asyncio.Future, Callable[[Any], Optional[Awaitable[None]]]]
+        ] = asyncio.Queue()
+        self._committer: Optional[asyncio.Task] = None
+        self._committing: Optional[asyncio.Future] = None
+        self.error: Optional[Exception] = None
+
+    async def submit(
+        self,
+        work: Awaitable[Any],
+        commit: Callable[[Any], Optional[Awaitable[None]]],
+    ) -> None:
+        """
+        Start a task once a slot is free.
+        :param work: The awaitable to run
+        :param commit: The function given the result of the task, called in submission order
+        """
+        try:
+            if self.error is None:
+                await self._slots.acquire()
+            if self.error is not None:
+                raise self.error
+        except BaseException:
+            if inspect.iscoroutine(work):
+                work.close()
+            raise
+        self._tasks.put_nowait((asyncio.ensure_future(work), commit))
+        if self._committer is None or self._committer.done():
+            self._committer = asyncio.ensure_future(self._commit())
+
+    async def drain(self) -> None:
+        """
+        Wait until every submitted task is committed.
+        """
+        await self._tasks.join()
+        if self.error is not None:
+            raise self.error
+
+    async def close(self) -> None:
+        """
+        Cancel the tasks not committed yet and wait for them to end.
+        """
+        committer, self._committer = self._committer, None
+        if committer is not None:
+            committer.cancel()
+        tasks = self._cancel_pending()
+        if self._committing is not None:
+            self._committing.cancel()
+            tasks.append(self._committing)
+        if committer is not None:
+            tasks.append(committer)
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _cancel_pending(self) -> List[asyncio.Future]:
+        """
+        Cancel the tasks waiting to be committed and free their slots.
+        :return: The tasks cancelled
+        """
+        tasks = []
+        while not self._tasks.empty():
+            task, _ = self._tasks.get_nowait()
+            task.cancel()
+            tasks.append(task)
+            self._slots.release()
+            self._tasks.task_done()
+        return tasks
+
+    async def _commit(self) -> None:
+        """
+        Commit the results of the tasks in submission order, until none is left to commit.
+        """
+        while not self._tasks.empty():
+            task, commit = self._tasks.get_nowait()
+            self._committing = task
+            try:
+                outcome = commit(await task)
+                if inspect.isawaitable(outcome):
+                    await outcome
+            except asyncio.CancelledError:
+                task.cancel()
+                raise
+            except Exception as error:
+                logging.error(f"Ordered pipeline stopped: {error}")
+                self.error = error
+                return
+            finally:
+                self._committing = None
+                self._slots.release()
+                self._tasks.task_done()
+                if self.error is not None:
+                    await asyncio.gather(
+                        *self._cancel_pending(), return_exceptions=True
+                    )
@@ -3,15 +3,14 @@ Socket utilities.
 
 This module contains utilities for working with sockets.
 """
-from websocket import WebSocketApp
-
 from pyogmios_client.exceptions import WebSocketClosedError
+from pyogmios_client.transport import Transport
 
 
-async def ensure_socket_is_open(websocket_app: WebSocketApp) -> None:
+async def ensure_socket_is_open(socket: Transport) -> None:
     """
     Ensure the socket is open.
-    :param websocket_app: The websocket app
+    :param socket: The transport
     """
-    if not websocket_app.sock.connected:
+    if not socket.connected:
         raise WebSocketClosedError()
@@ -1,9 +1,12 @@
-from unittest.mock import AsyncMock
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from polyfactory.factories.pydantic_factory import ModelFactory
 
 from pyogmios_client.connection import InteractionContext
+from pyogmios_client.exceptions import WebSocketClosedError
 from pyogmios_client.models import (
     ProtocolParametersShelley,
     ProtocolParametersBabbage,
@@ -24,6 +27,129 @@ from pyogmios_client.ouroboros_mini_protocols.state_query.query import (
     ResponseHandlerArgs,
 )
 from pyogmios_client.server_health import ConnectionConfig, Connection, Options, Address
+from pyogmios_client.transport import Transport
+
+
+class QueueTransport(Transport):
+    """
+    In memory transport, sent messages are decoded into ``sent`` and ``inbox`` feeds ``receive``
+    """
+
+    def __init__(self):
+        self.sent = asyncio.Queue()
+        self.inbox = asyncio.Queue()
+        self.closed = False
+
+    @property
+    def connected(self) -> bool:
+        return not self.closed
+
+    async def send(self, message: str) -> None:
+        await self.sent.put(json.loads(message))
+
+    async def receive(self) -> str:
+        message = await self.inbox.get()
+        if isinstance(message, Exception):
+            raise message
+        return message
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        if not self.closed:
+            self.closed = True
+            self.inbox.put_nowait(WebSocketClosedError())
+
+
+def fake_tx_babbage(
+    tx_id,
+    inputs=(),
+    outputs=(),
+    collaterals=(),
+    collateral_return=None,
+    input_source="inputs",
+    certificates=(),
+    withdrawals=None,
+    mint=None,
+    metadata=None,
+):
+    """
+    Build an Ogmios babbage transaction
+    """
+    return {
+        "id": tx_id,
+        "inputSource": input_source,
+        "body": {
+            "inputs": [{"txId": i[0], "index": i[1]} for i in inputs],
+            "references": [],
+            "collaterals": [{"txId": i[0], "index": i[1]} for i in collaterals],
+            "collateralReturn": collateral_return,
+            "totalCollateral": None,
+            "outputs": list(outputs),
+            "certificates": list(certificates),
+            "withdrawals": withdrawals or {},
+            "fee": 170000,
+            "validityInterval": {"invalidBefore": None, "invalidHereafter": None},
+            "update": None,
+            "mint": mint or {"coins": 0, "assets": {}},
+            "network": None,
+            "scriptIntegrityHash": None,
+            "requiredExtraSignatures": [],
+        },
+        "witness": {
+            "signatures": {},
+            "scripts": {},
+            "bootstrap": [],
+            "datums": {},
+            "redeemers": {},
+        },
+        "metadata": metadata,
+        "raw": "84a400",
+    }
+
+
+def fake_block_babbage(slot, header_hash, prev_hash, height=1, transactions=()):
+    """
+    Build an Ogmios babbage block
+    """
+    return {
+        "babbage": {
+            "body": list(transactions),
+            "headerHash": header_hash,
+            "header": {
+                "blockHeight": height,
+                "slot": slot,
+                "prevHash": prev_hash,
+                "issuerVk": "8b0960d234bda67d52432c5d1a26aca2bfb5b9a09f966d9592a7bf0c728a1ecd",
+                "issuerVrf": "8oyOB8fTDPHv2rW5JJJRqEK/Ssr3lfJ01Ma+k4bP6Mw=",
+                "blockSize": 1024,
+                "blockHash": "d0a0ca4a19dc41b2ee5b4b0d3b44b3bbf1fc0ed1c5b5be4b6e7e8f9aabbccdd0",
+                "opCert": {
+                    "count": 1,
+                    "sigma": "c5a0ca",
+                    "kesPeriod": 200,
+                    "hotVk": "vIvzz1nzwdpaDa8yVdOZ3/cnfhFsMbbo+hyAYPXxtXI=",
+                },
+                "protocolVersion": {"major": 8, "minor": 0},
+                "signature": "c7gw",
+                "vrfInput": {"proof": "a0b1", "output": "c2d3"},
+            },
+        }
+    }
+
+
+def fake_request_next_response(result, reflection=None):
+    """
+    Build an Ogmios RequestNext response
+    """
+    response = {
+        "type": "jsonwsp/response",
+        "version": "1.0",
+        "servicename": "ogmios",
+        "methodname": "RequestNext",
+        "result": result,
+    }
+    if reflection is not None:
+        response["reflection"] = reflection
+    return response
 
 
 class ConnectionConfigFactory(ModelFactory):
@@ -115,8 +241,10 @@ def mock_server_health(mocker):
     mocker.patch(
         "pyogmios_client.utils.socket_utils.ensure_socket_is_open", return_value=True
     )
-    mocker.patch("threading.Thread")
-    mocker.patch("threading.Event.is_set", return_value=True)
+    mocker.patch(
+        "pyogmios_client.connection.connect_transport",
+        return_value=MagicMock(spec=Transport),
+    )
     mocker.patch(
         "pyogmios_client.ouroboros_mini_protocols.chain_sync.request_next.request_next"
     )
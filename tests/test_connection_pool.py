@@ -0,0 +1,130 @@
+"""
+Test the connection pool module.
+"""
+import asyncio
+import json
+
+import pytest
+
+from pyogmios_client.connection import InteractionContext
+from pyogmios_client.connection_pool import create_connection_pool
+from pyogmios_client.enums import InteractionType, MethodName
+from pyogmios_client.exceptions import WebSocketClosedError
+from pyogmios_client.models.request_model import Request
+from tests.conftest import ConnectionFactory, QueueTransport
+
+
+def fake_context() -> InteractionContext:
+    return InteractionContext(
+        connection=ConnectionFactory.build(),
+        socket=QueueTransport(),
+        after_each=lambda socket, function: function(),
+    )
+
+
+def query_request() -> Request:
+    return Request.from_base_request(
+        method_name=MethodName.QUERY, args={"query": "chainTip"}
+    )
+
+
+@pytest.fixture
+def fake_contexts(mocker):
+    contexts = []
+
+    async def create(error_handler, close_handler, options):
+        assert options.interaction_type is InteractionType.LONG_RUNNING
+        context = fake_context()
+        contexts.append(context)
+        return context
+
+    mocker.patch(
+        "pyogmios_client.connection_pool.create_interaction_context",
+        side_effect=create,
+    )
+    return contexts
+
+
+@pytest.mark.asyncio
+async def test_pool_dispatches_to_least_loaded_connection(fake_contexts):
+    # Arrange
+    pool = await create_connection_pool(size=2)
+    first = asyncio.ensure_future(pool.context.multiplexer.request(query_request()))
+    await asyncio.sleep(0)
+    busy = next(c for c in fake_contexts if c.multiplexer.in_flight == 1)
+    idle = next(c for c in fake_contexts if c is not busy)
+
+    # Act
+    second = asyncio.ensure_future(pool.context.multiplexer.request(query_request()))
+    await asyncio.sleep(0)
+
+    # Assert
+    assert idle.multiplexer.in_flight == 1
+    assert pool.context.multiplexer.in_flight == 2
+    for context in fake_contexts:
+        sent = await context.socket.sent.get()
+        await context.socket.inbox.put(
+            json.dumps({"result": "ok", "reflection": sent["mirror"]})
+        )
+    assert [json.loads(r)["result"] for r in await asyncio.gather(first, second)] == [
+        "ok",
+        "ok",
+    ]
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_recycles_closed_connections(fake_contexts):
+    # Arrange
+    pool = await create_connection_pool(size=2)
+    broken = fake_contexts[0]
+    await broken.socket.close()
+
+    # Act
+    context = await pool.acquire()
+    await asyncio.sleep(0)
+
+    # Assert
+    assert context is fake_contexts[1]
+    assert len(fake_contexts) == 3
+    assert broken not in pool.contexts
+    assert all(c.socket.connected for c in pool.contexts)
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_lease_opens_dedicated_connection(fake_contexts):
+    # Arrange
+    pool = await create_connection_pool(size=1)
+
+    # Act
+    leased = await pool.lease()
+    dispatched = await pool.acquire()
+    await leased.socket.close()
+
+    # Assert
+    assert leased.multiplexer is fake_contexts[1].multiplexer
+    assert dispatched is fake_contexts[0]
+    assert not fake_contexts[1].socket.connected
+    assert fake_contexts[0].socket.connected
+    assert pool.leases == []
+    await pool.close()
+    assert not pool.context.socket.connected
+    with pytest.raises(WebSocketClosedError):
+        await pool.acquire()
+
+
+@pytest.mark.asyncio
+async def test_pool_close_ends_leases(fake_contexts):
+    # Arrange
+    pool = await create_connection_pool(size=1)
+    first, second = await pool.lease(), await pool.lease()
+
+    # Act
+    await pool.close()
+
+    # Assert
+    assert first.multiplexer is not second.multiplexer
+    assert not first.socket.connected and not second.socket.connected
+    with pytest.raises(WebSocketClosedError):
+        await pool.lease()
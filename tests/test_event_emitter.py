@@ -4,6 +4,14 @@ import logging
 import pytest
 from pyee import AsyncIOEventEmitter
 
+from pyogmios_client.enums import OverflowPolicy
+from pyogmios_client.exceptions import SubscriberOverflowError
+from pyogmios_client.utils.event_emitter import (
+    Broadcast,
+    EventEmitter,
+    event_emitter_to_generator,
+)
+
 LOG = logging.getLogger(__name__)
 
 
@@ -11,7 +19,8 @@ LOG = logging.getLogger(__name__)
 async def test_setup(event_loop):
     """Receive event from emitter and complete future!"""
     LOG.info("1 - start")
-    event_emitter = AsyncIOEventEmitter(asyncio.new_event_loop())
+    emitter_loop = asyncio.new_event_loop()
+    event_emitter = AsyncIOEventEmitter(emitter_loop)
 
     @event_emitter.on("event")
     def async_handler(message):
@@ -23,3 +32,119 @@ async def test_setup(event_loop):
     event_emitter.emit("event", "Hi")
 
     LOG.info(await future_result)
+    emitter_loop.close()
+
+
+@pytest.mark.asyncio
+async def test_event_emitter_to_generator():
+    # Arrange
+    event_emitter = EventEmitter()
+    generator = event_emitter_to_generator(
+        event_emitter, "message", lambda e: e.upper() if e != "skip" else None
+    )()
+
+    # Act
+    for message in ("a", "skip", "b"):
+        event_emitter.emit("message", message)
+
+    # Assert
+    assert [await generator.__anext__(), await generator.__anext__()] == ["A", "B"]
+    await generator.aclose()
+    assert event_emitter._callbacks["message"] == []
+
+
+def test_event_emitter_calls_every_listener_when_one_is_removed():
+    # Arrange
+    event_emitter = EventEmitter()
+    received = []
+
+    def once(message):
+        received.append(("once", message))
+        event_emitter.off("message", once)
+
+    event_emitter.on("message", once)
+    event_emitter.on("message", lambda message: received.append(("always", message)))
+
+    # Act
+    event_emitter.emit("message", 1)
+    event_emitter.emit("message", 2)
+
+    # Assert
+    assert received == [("once", 1), ("always", 1), ("always", 2)]
+
+
+@pytest.mark.asyncio
+async def test_broadcast_fans_out_to_subscribers():
+    # Arrange
+    broadcast = Broadcast(buffer_size=2)
+    first, second = broadcast.subscribe(), broadcast.subscribe()
+    item = {"block": 1}
+
+    async def read(subscription):
+        return [received async for received in subscription]
+
+    readers = [asyncio.ensure_future(read(s)) for s in (first, second)]
+
+    # Act
+    for published in (item, {"block": 2}, {"block": 3}):
+        await broadcast.publish(published)
+    broadcast.close()
+    results = await asyncio.gather(*readers)
+
+    # Assert
+    assert results[0] == results[1] == [{"block": 1}, {"block": 2}, {"block": 3}]
+    assert results[0][0] is item and results[1][0] is item
+
+
+@pytest.mark.asyncio
+async def test_broadcast_blocks_on_full_buffer():
+    # Arrange
+    broadcast = Broadcast(buffer_size=1)
+    subscription = broadcast.subscribe()
+    await broadcast.publish(1)
+
+    # Act
+    publishing = asyncio.ensure_future(broadcast.publish(2))
+    await asyncio.sleep(0)
+    blocked = not publishing.done()
+    first = await subscription.__anext__()
+    await publishing
+
+    # Assert
+    assert blocked
+    assert first == 1
+    assert list(subscription._buffer) == [2]
+
+
+@pytest.mark.asyncio
+async def test_broadcast_drops_oldest_on_full_buffer():
+    # Arrange
+    broadcast = Broadcast(buffer_size=2, overflow=OverflowPolicy.DROP_OLDEST)
+    subscription = broadcast.subscribe()
+
+    # Act
+    for item in range(5):
+        await broadcast.publish(item)
+    broadcast.close()
+
+    # Assert
+    assert [item async for item in subscription] == [3, 4]
+    assert subscription.dropped == 3
+
+
+@pytest.mark.asyncio
+async def test_broadcast_disconnects_slow_subscriber():
+    # Arrange
+    broadcast = Broadcast(buffer_size=1)
+    slow = broadcast.subscribe(overflow=OverflowPolicy.DISCONNECT)
+    fast = broadcast.subscribe(buffer_size=4)
+
+    # Act
+    await broadcast.publish(1)
+    await broadcast.publish(2)
+
+    # Assert
+    assert slow.closed and len(broadcast) == 1
+    with pytest.raises(SubscriberOverflowError):
+        await slow.__anext__()
+    assert len(fast) == 2
@@ -8,6 +8,8 @@ from pyogmios_client.exceptions import (
     IntersectionNotFoundError,
     UnknownResultError,
     TipIsOriginError,
+    RollbackTooDeepError,
+    SubscriberOverflowError,
     WebSocketClosedError,
 )
 from pyogmios_client.models import Origin
@@ -62,6 +64,25 @@ def test_tip_is_origin_error_exception():
         raise TipIsOriginError()
 
 
+def test_rollback_too_deep_error_exception():
+    origin = Origin("origin")
+    message = 'Unable to roll back to "origin", it is older than the undo log'
+
+    with pytest.raises(RollbackTooDeepError, match=message) as excinfo:
+        raise RollbackTooDeepError(origin)
+
+    assert excinfo.value.point == origin
+
+
+def test_subscriber_overflow_error_exception():
+    message = "Subscriber disconnected, it fell 8 events behind"
+
+    with pytest.raises(SubscriberOverflowError, match=message) as excinfo:
+        raise SubscriberOverflowError(8)
+
+    assert excinfo.value.buffer_size == 8
+
+
 def test_websocket_closed_error_exception():
     message = "WebSocket is closed"
 
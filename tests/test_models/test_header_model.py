@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+from pyogmios_client.models import Point, Tip
+from pyogmios_client.models.header_model import (
+    HeaderRollForward,
+    is_roll_forward,
+    peek_block_era,
+)
+from tests.conftest import (
+    fake_block_babbage,
+    fake_request_next_response,
+    fake_tx_babbage,
+)
+
+HEADER_HASH = "ab" * 32
+PREV_HASH = "cd" * 32
+TIP = {"slot": 9, "hash": HEADER_HASH, "blockNo": 4}
+
+
+def roll_forward_message(block, indent=None) -> str:
+    return json.dumps(
+        fake_request_next_response({"RollForward": {"block": block, "tip": TIP}}),
+        indent=indent,
+    )
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_header_roll_forward_reads_header_from_tail(mocker, indent):
+    # Arrange
+    transaction = fake_tx_babbage("ef" * 32, metadata={"hash": "x", "body": {}})
+    block = fake_block_babbage(5, HEADER_HASH, PREV_HASH, 3, [transaction])
+    from_raw = mocker.spy(HeaderRollForward, "from_raw")
+
+    # Act
+    roll_forward = HeaderRollForward.from_message(roll_forward_message(block, indent))
+
+    # Assert
+    assert from_raw.call_count == 0
+    assert roll_forward.header.point == Point(slot=5, hash=HEADER_HASH)
+    assert roll_forward.header.block_no == 3
+    assert roll_forward.header.issuer_vk == block["babbage"]["header"]["issuerVk"]
+    assert roll_forward.tip == Tip.model_validate(TIP)
+
+
+def test_header_roll_forward_falls_back_to_full_decoding(mocker):
+    # Arrange
+    transaction = fake_tx_babbage("ef" * 32, metadata={"header": 1})
+    babbage = fake_block_babbage(5, HEADER_HASH, PREV_HASH, 3, [transaction])["babbage"]
+    block = {"babbage": {"header": babbage["header"], "body": babbage["body"]}}
+    block["babbage"]["headerHash"] = HEADER_HASH
+    from_raw = mocker.spy(HeaderRollForward, "from_raw")
+
+    # Act
+    roll_forward = HeaderRollForward.from_message(roll_forward_message(block))
+
+    # Assert
+    assert from_raw.call_count == 1
+    assert roll_forward.header.point == Point(slot=5, hash=HEADER_HASH)
+
+
+def test_header_roll_forward_byron_epoch_boundary_block():
+    # Arrange
+    block = {
+        "byron": {
+            "hash": HEADER_HASH,
+            "header": {"blockHeight": 0, "epoch": 1, "prevHash": PREV_HASH},
+        }
+    }
+
+    # Act
+    roll_forward = HeaderRollForward.from_message(roll_forward_message(block))
+
+    # Assert
+    assert roll_forward.header.block_type == "byron"
+    assert roll_forward.header.point is None
+
+
+def test_peek_helpers():
+    message = roll_forward_message(fake_block_babbage(5, HEADER_HASH, PREV_HASH))
+    assert is_roll_forward(message)
+    assert peek_block_era(message) == "babbage"
+    assert not is_roll_forward('{"result": {"RollBackward": {}}}')
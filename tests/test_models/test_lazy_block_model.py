@@ -0,0 +1,63 @@
+import pytest
+from pydantic import ValidationError
+
+from pyogmios_client.models import Babbage, Point, TxBabbage
+from pyogmios_client.models.lazy_block_model import LazyBlock, LazyRollForward
+from tests.conftest import fake_block_babbage, fake_tx_babbage
+
+HEADER_HASH = "ab" * 32
+PREV_HASH = "cd" * 32
+
+
+def test_lazy_block_decodes_body_on_access():
+    # Arrange
+    block = fake_block_babbage(
+        7, HEADER_HASH, PREV_HASH, transactions=[fake_tx_babbage("ef" * 32)]
+    )
+
+    # Act
+    roll_forward = LazyRollForward.from_raw({"block": block, "tip": "origin"})
+
+    # Assert
+    assert roll_forward.block.block_type == "babbage"
+    assert roll_forward.block.point == Point(slot=7, hash=HEADER_HASH)
+    assert roll_forward.block._body is None
+    assert isinstance(roll_forward.block.body[0], TxBabbage)
+    assert roll_forward.block.body is roll_forward.block.body
+    assert isinstance(roll_forward.block.decode(), Babbage)
+
+
+def test_lazy_block_defers_body_errors():
+    # Arrange
+    block = fake_block_babbage(7, HEADER_HASH, PREV_HASH, transactions=[{}])
+
+    # Act
+    lazy_block = LazyBlock.from_raw(block)
+
+    # Assert
+    assert lazy_block.slot == 7
+    with pytest.raises(ValidationError):
+        lazy_block.body
+
+
+def test_lazy_block_epoch_boundary_block_has_no_point():
+    # Arrange
+    block = {
+        "byron": {
+            "hash": HEADER_HASH,
+            "header": {"blockHeight": 0, "epoch": 1, "prevHash": PREV_HASH},
+        }
+    }
+
+    # Act
+    lazy_block = LazyBlock.from_raw(block)
+
+    # Assert
+    assert lazy_block.slot is None
+    assert lazy_block.point is None
+    assert lazy_block.body is None
+
+
+def test_lazy_block_unknown_era():
+    with pytest.raises(ValueError):
+        LazyBlock.from_raw({"conway": {}})
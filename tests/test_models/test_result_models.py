@@ -0,0 +1,55 @@
+import pytest
+from pydantic import ValidationError
+
+from pyogmios_client.models import Babbage, block_era
+from pyogmios_client.models.result_models import RollForward
+from tests.conftest import fake_block_babbage
+
+HEADER_HASH = "ab" * 32
+PREV_HASH = "cd" * 32
+
+
+@pytest.mark.parametrize(
+    "block, expected",
+    [
+        ({"babbage": {}}, "babbage"),
+        ({"byron": {}}, "byron"),
+        ({"block_type": "mary", "mary": {}}, "mary"),
+        ({"conway": {}}, None),
+        (Babbage.model_construct(block_type="babbage"), "babbage"),
+    ],
+)
+def test_block_era(block, expected):
+    assert block_era(block) == expected
+
+
+@pytest.mark.parametrize(
+    "tip",
+    ["origin", {"slot": 1, "hash": HEADER_HASH, "blockNo": 1}],
+)
+def test_roll_forward_decodes_block_by_era(tip):
+    # Arrange
+    block = fake_block_babbage(1, HEADER_HASH, PREV_HASH)
+
+    # Act
+    roll_forward = RollForward.model_validate({"block": block, "tip": tip})
+
+    # Assert
+    assert isinstance(roll_forward.block, Babbage)
+    assert roll_forward.block.block_type == "babbage"
+    assert "block_type" not in block
+
+
+def test_roll_forward_reports_only_the_block_era_errors():
+    # Arrange
+    block = fake_block_babbage(1, HEADER_HASH, PREV_HASH)
+    del block["babbage"]["header"]
+
+    # Act
+    with pytest.raises(ValidationError) as exc_info:
+        RollForward.model_validate({"block": block, "tip": "origin"})
+
+    # Assert
+    assert [error["loc"][:2] for error in exc_info.value.errors()] == [
+        ("block", "babbage")
+    ]
@@ -0,0 +1,170 @@
+"""
+Test the multiplexer module.
+"""
+import asyncio
+import json
+
+import pytest
+
+from pyogmios_client.enums import MethodName
+from pyogmios_client.exceptions import WebSocketClosedError
+from pyogmios_client.models.request_model import Request
+from pyogmios_client.multiplexer import (
+    Multiplexer,
+    peek_method_name,
+    peek_request_id,
+    with_request_id,
+)
+from tests.conftest import QueueTransport
+
+
+def reply(request: dict, result) -> str:
+    return json.dumps(
+        {
+            "type": "jsonwsp/response",
+            "methodname": request["methodname"],
+            "result": result,
+            "reflection": request["mirror"],
+        }
+    )
+
+
+def query_request() -> Request:
+    return Request.from_base_request(
+        method_name=MethodName.QUERY, args={"query": "chainTip"}
+    )
+
+
+@pytest.mark.parametrize(
+    "mirror, expected",
+    [
+        (None, {"requestId"}),
+        ({"requestId": "abc"}, {"requestId"}),
+        ({"foo": "bar"}, {"foo", "requestId"}),
+        ("foo", {"mirror", "requestId"}),
+    ],
+)
+def test_with_request_id(mirror, expected):
+    request_id, result = with_request_id(mirror)
+    assert set(result) == expected
+    assert result["requestId"] == request_id
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        ('{"result": 1, "reflection": {"requestId": "abc"}}', "abc"),
+        ('{"reflection": {"requestId": "abc"}, "result": 1}', "abc"),
+        ('{"result": {"reflection": 1}}', None),
+        ('{"result": 1}', None),
+    ],
+)
+def test_peek_request_id(message, expected):
+    assert peek_request_id(message) == expected
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        (
+            '{"type": "jsonwsp/response", "methodname": "RequestNext", "result": 1}',
+            "RequestNext",
+        ),
+        ('{"methodname":"Query","result":{"methodname":"x"}}', "Query"),
+        ('{"result": "%s", "methodname": "Query"}' % ("x" * 300), "Query"),
+        ('{"result": 1}', None),
+        ("not json", None),
+    ],
+)
+def test_peek_method_name(message, expected):
+    assert peek_method_name(message) == expected
+
+
+@pytest.mark.asyncio
+async def test_multiplexer_routes_out_of_order_responses():
+    # Arrange
+    transport = QueueTransport()
+    multiplexer = Multiplexer(transport)
+    requests = [
+        asyncio.ensure_future(multiplexer.request(query_request())) for _ in range(3)
+    ]
+    sent = [await transport.sent.get() for _ in range(3)]
+
+    # Act
+    for index, request in reversed(list(enumerate(sent))):
+        await transport.inbox.put(reply(request, index))
+    results = await asyncio.gather(*requests)
+
+    # Assert
+    assert [json.loads(result)["result"] for result in results] == [0, 1, 2]
+    assert multiplexer.in_flight == 0
+    await multiplexer.close()
+
+
+@pytest.mark.asyncio
+async def test_multiplexer_sends_unmatched_messages_to_listener():
+    # Arrange
+    transport = QueueTransport()
+    multiplexer = Multiplexer(transport)
+    received = asyncio.Queue()
+    multiplexer.listen(received.put)
+    request = asyncio.ensure_future(multiplexer.request(query_request()))
+    sent = await transport.sent.get()
+
+    # Act
+    await transport.inbox.put('{"methodname": "RequestNext", "result": {}}')
+    await transport.inbox.put(reply(sent, "tip"))
+
+    # Assert
+    assert json.loads(await request)["result"] == "tip"
+    assert json.loads(await received.get())["methodname"] == "RequestNext"
+    await multiplexer.close()
+
+
+@pytest.mark.asyncio
+async def test_multiplexer_falls_back_to_oldest_request():
+    # Arrange
+    transport = QueueTransport()
+    multiplexer = Multiplexer(transport)
+    request = asyncio.ensure_future(multiplexer.request(query_request()))
+    await transport.sent.get()
+
+    # Act
+    await transport.inbox.put('{"result": "no reflection"}')
+
+    # Assert
+    assert json.loads(await request)["result"] == "no reflection"
+    await multiplexer.close()
+
+
+@pytest.mark.asyncio
+async def test_multiplexer_fails_pending_requests_on_close():
+    # Arrange
+    transport = QueueTransport()
+    multiplexer = Multiplexer(transport)
+    request = asyncio.ensure_future(multiplexer.request(query_request()))
+    await transport.sent.get()
+
+    # Act
+    await transport.inbox.put(WebSocketClosedError())
+
+    # Assert
+    with pytest.raises(WebSocketClosedError):
+        await request
+
+
+@pytest.mark.asyncio
+async def test_multiplexer_wait_closed():
+    # Arrange
+    transport = QueueTransport()
+    multiplexer = Multiplexer(transport)
+    multiplexer.listen(lambda message: None)
+    closed = asyncio.ensure_future(multiplexer.wait_closed())
+    await asyncio.sleep(0)
+
+    # Act
+    await transport.inbox.put(WebSocketClosedError())
+
+    # Assert
+    assert isinstance(await closed, WebSocketClosedError)
+    await multiplexer.close()
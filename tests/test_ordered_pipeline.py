@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from pyogmios_client.utils.ordered_pipeline import OrderedPipeline
+
+
+@pytest.mark.asyncio
+async def test_ordered_pipeline_commits_in_submission_order():
+    # Arrange
+    pipeline = OrderedPipeline(concurrency=3)
+    running = []
+    peak = []
+    committed = []
+
+    async def work(index: int) -> int:
+        running.append(index)
+        peak.append(len(running))
+        await asyncio.sleep(0.001 * (5 - index))
+        running.remove(index)
+        return index
+
+    # Act
+    for index in range(5):
+        await pipeline.submit(work(index), committed.append)
+    await pipeline.drain()
+
+    # Assert
+    assert committed == [0, 1, 2, 3, 4]
+    assert max(peak) == 3
+
+
+@pytest.mark.asyncio
+async def test_ordered_pipeline_stops_at_failure():
+    # Arrange
+    pipeline = OrderedPipeline(concurrency=2)
+    committed = []
+
+    async def fail():
+        raise ValueError("boom")
+
+    async def succeed():
+        return "ok"
+
+    # Act
+    await pipeline.submit(succeed(), committed.append)
+    await pipeline.submit(fail(), committed.append)
+    await pipeline.submit(succeed(), committed.append)
+    with pytest.raises(ValueError):
+        await pipeline.drain()
+
+    # Assert
+    assert committed == ["ok"]
+    with pytest.raises(ValueError):
+        await pipeline.submit(succeed(), committed.append)
+    await pipeline.close()
+    assert committed == ["ok"]
+
+
+@pytest.mark.asyncio
+async def test_ordered_pipeline_close_cancels_pending_tasks():
+    # Arrange
+    pipeline = OrderedPipeline(concurrency=2)
+    blocked = asyncio.Event()
+    committed = []
+    await pipeline.submit(blocked.wait(), committed.append)
+    await pipeline.submit(blocked.wait(), committed.append)
+
+    # Act
+    await pipeline.close()
+    blocked.set()
+    await asyncio.sleep(0)
+
+    # Assert
+    assert committed == []
+
+
+def test_ordered_pipeline_needs_a_slot():
+    with pytest.raises(ValueError):
+        OrderedPipeline(concurrency=0)
@@ -0,0 +1,119 @@
+import json
+
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.block_archive import (
+    BlockArchive,
+    BlockArchiveWriter,
+)
+from tests.conftest import fake_block_babbage, fake_request_next_response
+
+
+def block_hash(slot: int) -> str:
+    return f"{slot:064x}"
+
+
+def roll_forward(slot: int) -> str:
+    block = fake_block_babbage(slot, block_hash(slot), block_hash(slot - 1))
+    tip = {"slot": slot, "hash": block_hash(slot), "blockNo": slot}
+    return json.dumps(
+        fake_request_next_response({"RollForward": {"block": block, "tip": tip}})
+    )
+
+
+def roll_backward(slot: int) -> str:
+    point = {"slot": slot, "hash": block_hash(slot)}
+    return json.dumps(
+        fake_request_next_response({"RollBackward": {"point": point, "tip": point}})
+    )
+
+
+def test_block_archive_looks_up_by_slot_and_hash(tmp_path):
+    # Arrange
+    writer = BlockArchiveWriter(str(tmp_path))
+    archive = BlockArchive(str(tmp_path))
+
+    # Act
+    for slot in range(2, 8, 2):
+        writer.record(roll_forward(slot))
+
+    # Assert
+    assert len(archive) == 3
+    assert archive.by_slot(4).block.slot == 4
+    assert archive.by_slot(3) is None
+    assert archive.by_slot(9) is None
+    assert archive.by_hash(block_hash(6)).block.slot == 6
+    assert archive.by_hash(block_hash(5)) is None
+    assert archive.raw_by_slot(2) == roll_forward(2).encode()
+    writer.close()
+    archive.close()
+
+
+def test_block_archive_grows_hash_table(tmp_path):
+    # Arrange
+    writer = BlockArchiveWriter(str(tmp_path))
+    archive = BlockArchive(str(tmp_path))
+
+    # Act
+    for slot in range(1, 1201):
+        writer.append(slot, block_hash(slot), str(slot).encode())
+
+    # Assert
+    assert all(
+        archive.raw_by_hash(block_hash(slot)) == str(slot).encode()
+        for slot in range(1, 1201)
+    )
+    writer.close()
+    archive.close()
+
+
+def test_block_archive_rolls_back(tmp_path):
+    # Arrange
+    writer = BlockArchiveWriter(str(tmp_path))
+    for slot in (2, 3, 4, 5):
+        writer.record(roll_forward(slot))
+    archive = BlockArchive(str(tmp_path))
+
+    # Act
+    writer.record(roll_backward(3))
+    writer.record(roll_forward(6))
+    writer.close()
+    reopened = BlockArchiveWriter(str(tmp_path))
+    removed = reopened.roll_back(2)
+
+    # Assert
+    assert removed == [6, 3]
+    assert list(archive.slots()) == [2]
+    assert archive.by_hash(block_hash(4)) is None
+    assert archive.by_hash(block_hash(6)) is None
+    assert archive.by_hash(block_hash(2)).block.slot == 2
+    reopened.close()
+    archive.close()
+
+
+def test_block_archive_roll_back_keeps_mapped_files(tmp_path):
+    # Arrange
+    writer = BlockArchiveWriter(str(tmp_path))
+    for slot in (2, 3, 4):
+        writer.record(roll_forward(slot))
+    archive = BlockArchive(str(tmp_path))
+    assert len(archive) == 3
+    sizes = {
+        name: (tmp_path / name).stat().st_size for name in ("blocks.dat", "slots.idx")
+    }
+
+    # Act
+    writer.record(roll_backward(2))
+    rolled_back = list(archive.slots())
+    writer.record(roll_forward(5))
+    writer.close()
+    reopened = BlockArchiveWriter(str(tmp_path))
+    reopened.record(roll_forward(6))
+
+    # Assert
+    assert rolled_back == [2]
+    assert all((tmp_path / name).stat().st_size >= size for name, size in sizes.items())
+    assert list(archive.slots()) == [2, 5, 6]
+    assert archive.by_slot(3) is None
+    assert archive.by_hash(block_hash(5)).block.slot == 5
+    assert archive.raw_by_slot(6) == roll_forward(6).encode()
+    reopened.close()
+    archive.close()
@@ -0,0 +1,105 @@
+import json
+
+import pytest
+
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.block_filter import (
+    BlockFilter,
+)
+from tests.conftest import (
+    fake_block_babbage,
+    fake_request_next_response,
+    fake_tx_babbage,
+)
+
+ADDRESS = "addr_test1vz09v9yfxguvlp0zsnrpa3tdtm7el8xufp3m5lsm7qxzclgmzkket"
+POLICY = "ab" * 28
+MANY = {f"addr_test1other{index}" for index in range(20)}
+STAKE = "stake_test1uqfu74w3wh4gfzu8m6e7j987h4lq9r3t7ef5gaw497uu85qsqfy27"
+
+
+def frame(transaction) -> str:
+    block = fake_block_babbage(2, "02" * 32, "01" * 32, transactions=[transaction])
+    tip = {"slot": 2, "hash": "02" * 32, "blockNo": 2}
+    return json.dumps(
+        fake_request_next_response({"RollForward": {"block": block, "tip": tip}})
+    )
+
+
+TRANSACTION = fake_tx_babbage(
+    "11" * 32,
+    outputs=[
+        {
+            "address": ADDRESS,
+            "value": {"coins": 2, "assets": {f"{POLICY}.74657374": 1}},
+            "datumHash": None,
+            "datum": None,
+            "script": None,
+        }
+    ],
+    withdrawals={STAKE: 5},
+    metadata={"hash": "22" * 32, "body": {"blob": {"674": {"string": "hi"}}}},
+)
+
+
+@pytest.mark.parametrize(
+    "block_filter, expected",
+    [
+        (BlockFilter(addresses={ADDRESS}), True),
+        (BlockFilter(policies={POLICY}), True),
+        (BlockFilter(stake_credentials={STAKE}), True),
+        (BlockFilter(metadata_labels={674}), True),
+        (BlockFilter(addresses={"addr_test1other"}, policies={"cd" * 28}), False),
+        (BlockFilter(), False),
+        (BlockFilter(addresses=MANY | {ADDRESS}), True),
+        (BlockFilter(addresses=MANY, policies={POLICY}), True),
+        (BlockFilter(addresses=MANY, metadata_labels={674}), True),
+        (BlockFilter(addresses=MANY), False),
+    ],
+)
+def test_block_filter_screens_raw_frames(block_filter, expected):
+    assert block_filter.may_match(frame(TRANSACTION)) is expected
+
+
+CREDENTIAL = "337b62cfff6403a06a3acbc34f8c46003c69fe79a3628cefa9c47251"
+REWARD = "stake1uyehkck0lajq8gr28t9uxnuvgcqrc6070x3k9r8048z8y5gh6ffgw"
+BASE = "addr1qx2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzer3n0d3vllmyqwsx5wktcd8cc3sq835lu7drv2xwl2wywfgse35a3x"
+
+
+def output(address: str) -> dict:
+    return {
+        "address": address,
+        "value": {"coins": 2, "assets": {}},
+        "datumHash": None,
+        "datum": None,
+        "script": None,
+    }
+
+
+@pytest.mark.parametrize("needle", [CREDENTIAL, REWARD])
+@pytest.mark.parametrize(
+    "transaction",
+    [
+        fake_tx_babbage("11" * 32, certificates=[{"stakeKeyRegistration": CREDENTIAL}]),
+        fake_tx_babbage("11" * 32, withdrawals={REWARD: 5}),
+        fake_tx_babbage("11" * 32, outputs=[output(BASE)]),
+    ],
+    ids=["certificate", "withdrawal", "base address output"],
+)
+def test_block_filter_matches_stake_credentials_in_any_form(needle, transaction):
+    # Arrange
+    block_filter = BlockFilter(stake_credentials={needle})
+    many = BlockFilter(stake_credentials={needle} | MANY)
+
+    # Act & Assert
+    assert block_filter.may_match(frame(transaction))
+    assert many.may_match(frame(transaction))
+    assert not BlockFilter(stake_credentials={"11" * 28}).may_match(frame(transaction))
+
+
+def test_block_filter_does_not_see_spends():
+    # Arrange
+    spend = fake_tx_babbage("22" * 32, inputs=[("11" * 32, 0)], outputs=[output(BASE)])
+
+    # Act & Assert
+    # Inputs only reference the outputs they spend, finding spends needs UTxO state
+    assert not BlockFilter(addresses={ADDRESS}).may_match(frame(spend))
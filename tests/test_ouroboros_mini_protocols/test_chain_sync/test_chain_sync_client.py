@@ -1,14 +1,42 @@
-from unittest.mock import MagicMock
+import asyncio
+import json
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from pyogmios_client.connection import (
     create_interaction_context,
+    InteractionContext,
+)
+from pyogmios_client.exceptions import WebSocketClosedError
+from pyogmios_client.models import Point
+from pyogmios_client.models.header_model import HeaderRollForward
+from pyogmios_client.models.lazy_block_model import LazyRollForward
+from pyogmios_client.models.response_model import RequestNextResponse
+from pyogmios_client.multiplexer import Multiplexer
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.block_filter import (
+    BlockFilter,
+)
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.cursor_store import (
+    FileCursorStore,
+)
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.find_intersect import (
+    create_point_from_roll_forward,
 )
 from pyogmios_client.ouroboros_mini_protocols.chain_sync.chain_sync_client import (
     create_chain_sync_client,
     ChainSyncMessageHandlers,
     ChainSyncClient,
+    Options,
+    decode_request_next,
+)
+from tests.conftest import (
+    ConnectionFactory,
+    QueueTransport,
+    fake_block_babbage,
+    fake_request_next_response,
+    fake_tx_babbage,
 )
 
 
@@ -41,3 +69,656 @@ async def test_create_chain_sync_client(mocker):
         interaction_context, chain_sync_message_handlers
     )
     assert isinstance(client, ChainSyncClient)
+
+
+def block_hash(slot: int) -> str:
+    return f"{slot:064x}"
+
+
+def roll_forward(slot: int) -> str:
+    block = fake_block_babbage(slot, block_hash(slot), block_hash(slot - 1))
+    tip = {"slot": slot, "hash": block_hash(slot), "blockNo": slot}
+    return json.dumps(
+        fake_request_next_response({"RollForward": {"block": block, "tip": tip}})
+    )
+
+
+@pytest.fixture
+def reconnecting_context():
+    transports = [QueueTransport()]
+    context = InteractionContext(
+        connection=ConnectionFactory.build(),
+        socket=transports[0],
+        after_each=lambda socket, function: function(),
+    )
+
+    async def reconnect():
+        transports.append(QueueTransport())
+        context.socket = transports[-1]
+        context.multiplexer = Multiplexer(transports[-1])
+
+    context.reconnect = reconnect
+    return context, transports
+
+
+@pytest.mark.asyncio
+async def test_chain_sync_resumes_after_socket_drop(mocker, reconnecting_context):
+    # Arrange
+    context, transports = reconnecting_context
+    find_intersect = mocker.patch(
+        "pyogmios_client.ouroboros_mini_protocols.chain_sync.chain_sync_client.find_intersect",
+        new_callable=AsyncMock,
+    )
+    slots = asyncio.Queue()
+    handlers = ChainSyncMessageHandlers(
+        roll_forward=lambda response, _: slots.put_nowait(
+            response.block.babbage.header.slot
+        ),
+        roll_backward=lambda response, _: None,
+    )
+    client = await create_chain_sync_client(
+        context, handlers, Options(reconnect_delay=0)
+    )
+    start = Point(slot=1, hash=block_hash(1))
+    await client.start_sync([start], 2)
+    for slot in (2, 3):
+        await transports[0].inbox.put(roll_forward(slot))
+        assert await asyncio.wait_for(slots.get(), 1) == slot
+
+    # Act
+    await transports[0].inbox.put(WebSocketClosedError())
+    resumed = [await asyncio.wait_for(_next_sent(transports), 1) for _ in range(2)]
+    await transports[1].inbox.put(roll_forward(4))
+
+    # Assert
+    assert await asyncio.wait_for(slots.get(), 1) == 4
+    assert [r["methodname"] for r in resumed] == ["RequestNext", "RequestNext"]
+    assert find_intersect.await_args_list[0].args[1] == [start]
+    assert find_intersect.await_args_list[1].args[1] == [
+        Point(slot=3, hash=block_hash(3)),
+        Point(slot=2, hash=block_hash(2)),
+    ]
+    await client.shutdown()
+    assert transports[1].closed
+    assert len(transports) == 2
+
+
+async def _next_sent(transports):
+    while len(transports) < 2:
+        await asyncio.sleep(0)
+    return await transports[1].sent.get()
+
+
+@pytest.mark.asyncio
+async def test_chain_sync_keeps_window_full(mocker, reconnecting_context):
+    # Arrange
+    context, transports = reconnecting_context
+    mocker.patch(
+        "pyogmios_client.ouroboros_mini_protocols.chain_sync.chain_sync_client.find_intersect",
+        new_callable=AsyncMock,
+    )
+    slots = asyncio.Queue()
+
+    def roll_forward_handler(response, ack):
+        ack()
+        ack()
+        slots.put_nowait(response.block.babbage.header.slot)
+
+    handlers = ChainSyncMessageHandlers(
+        roll_forward=roll_forward_handler,
+        roll_backward=lambda response, ack: None,
+    )
+    client = await create_chain_sync_client(context, handlers, Options(reconnect=False))
+    decode = mocker.spy(RequestNextResponse, "model_validate_json")
+    await client.start_sync([Point(slot=1, hash=block_hash(1))], 3)
+    assert transports[0].sent.qsize() == 3
+
+    # Act
+    for slot in (2, 3, 4, 5):
+        await transports[0].inbox.put(roll_forward(slot))
+        assert await asyncio.wait_for(slots.get(), 1) == slot
+
+    # Assert
+    assert transports[0].sent.qsize() == 7
+    assert decode.call_count == 4
+    await client.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_chain_sync_events_apply_backpressure(mocker, reconnecting_context):
+    # Arrange
+    context, transports = reconnecting_context
+    mocker.patch(
+        "pyogmios_client.ouroboros_mini_protocols.chain_sync.chain_sync_client.find_intersect",
+        new_callable=AsyncMock,
+    )
+    client = await create_chain_sync_client(
+        context, options=Options(reconnect=False, buffer_size=2)
+    )
+    await client.start_sync([Point(slot=1, hash=block_hash(1))], 2)
+
+    # Act
+    for slot in (2, 3, 4, 5):
+        await transports[0].inbox.put(roll_forward(slot))
+    await asyncio.sleep(0.01)
+    sent_while_lagging = transports[0].sent.qsize()
+    slots = []
+    async for event in client.events():
+        slots.append(event.block.babbage.header.slot)
+        if len(slots) == 4:
+            await client.shutdown()
+
+    # Assert
+    assert sent_while_lagging == 5
+    assert slots == [2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_chain_sync_lazy_blocks(mocker, reconnecting_context):
+    # Arrange
+    context, transports = reconnecting_context
+    find_intersect = mocker.patch(
+        "pyogmios_client.ouroboros_mini_protocols.chain_sync.chain_sync_client.find_intersect",
+        new_callable=AsyncMock,
+    )
+    client = await create_chain_sync_client(
+        context, options=Options(reconnect_delay=0, lazy_blocks=True)
+    )
+    await client.start_sync([Point(slot=1, hash=block_hash(1))], 1)
+    await transports[0].inbox.put(roll_forward(2))
+    events = client.events()
+
+    # Act
+    event = await asyncio.wait_for(events.__anext__(), 1)
+    await transports[0].inbox.put(WebSocketClosedError())
+    await asyncio.wait_for(_next_sent(transports), 1)
+
+    # Assert
+    assert isinstance(event, LazyRollForward)
+    assert event.block.slot == 2
+    assert find_intersect.await_args_list[1].args[1] == [
+        Point(slot=2, hash=block_hash(2))
+    ]
+    await client.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_chain_sync_headers_only(mocker, reconnecting_context):
+    # Arrange
+    context, transports = reconnecting_context
+    mocker.patch(
+        "pyogmios_client.ouroboros_mini_protocols.chain_sync.chain_sync_client.find_intersect",
+        new_callable=AsyncMock,
+    )
+    client = await create_chain_sync_client(
+        context, options=Options(reconnect=False, headers_only=True)
+    )
+    await client.start_sync([Point(slot=1, hash=block_hash(1))], 2)
+
+    # Act
+    for slot in (2, 3):
+        await transports[0].inbox.put(roll_forward(slot))
+    events = client.events()
+    headers = [await asyncio.wait_for(events.__anext__(), 1) for _ in range(2)]
+
+    # Assert
+    assert all(isinstance(header, HeaderRollForward) for header in headers)
+    assert [header.header.slot for header in headers] == [2, 3]
+    assert client.stats.blocks == 2
+    assert client.stats.rate > 0
+    await client.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_chain_sync_sequential_commits_in_chain_order(
+    mocker, reconnecting_context
+):
+    # Arrange
+    context, transports = reconnecting_context
+    mocker.patch(
+        "pyogmios_client.ouroboros_mini_protocols.chain_sync.chain_sync_client.find_intersect",
+        new_callable=AsyncMock,
+    )
+    handled = []
+    committed = asyncio.Queue()
+
+    async def roll_forward_handler(response, ack):
+        slot = response.block.babbage.header.slot
+        await asyncio.sleep(0.001 * (6 - slot))
+        handled.append(slot)
+        return slot
+
+    handlers = ChainSyncMessageHandlers(
+        roll_forward=roll_forward_handler,
+        roll_backward=lambda response, ack: "rollback",
+        commit=lambda event, result: committed.put_nowait(result),
+    )
+    client = await create_chain_sync_client(
+        context, handlers, Options(reconnect=False, sequential=True, concurrency=3)
+    )
+    await client.start_sync([Point(slot=1, hash=block_hash(1))], 5)
+
+    # Act
+    for slot in (2, 3, 4, 5):
+        await transports[0].inbox.put(roll_forward(slot))
+    await transports[0].inbox.put(
+        json.dumps(
+            fake_request_next_response(
+                {"RollBackward": {"point": "origin", "tip": "origin"}}
+            )
+        )
+    )
+    results = [await asyncio.wait_for(committed.get(), 1) for _ in range(5)]
+
+    # Assert
+    assert results == [2, 3, 4, 5, "rollback"]
+    assert handled[:3] != [2, 3, 4]
+    assert client.stats.blocks == 4
+    assert client.stats.rollbacks == 1
+    await client.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_chain_sync_sequential_stops_at_failed_block(
+    mocker, reconnecting_context, tmp_path
+):
+    # Arrange
+    context, transports = reconnecting_context
+    mocker.patch(
+        "pyogmios_client.ouroboros_mini_protocols.chain_sync.chain_sync_client.find_intersect",
+        new_callable=AsyncMock,
+    )
+    committed = []
+
+    async def roll_forward_handler(response, ack):
+        slot = response.block.babbage.header.slot
+        if slot == 3:
+            raise ValueError("write failed")
+        return slot
+
+    handlers = ChainSyncMessageHandlers(
+        roll_forward=roll_forward_handler,
+        roll_backward=lambda response, ack: None,
+        commit=lambda event, result: committed.append(result),
+    )
+    store = FileCursorStore(str(tmp_path / "cursor.json"))
+    client = await create_chain_sync_client(
+        context,
+        handlers,
+        Options(reconnect=False, sequential=True, concurrency=2, cursor_store=store),
+    )
+    await client.start_sync([Point(slot=1, hash=block_hash(1))], 5)
+
+    # Act
+    for slot in (2, 3, 4, 5, 6):
+        await transports[0].inbox.put(roll_forward(slot))
+    for _ in range(100):
+        if not transports[0].connected:
+            break
+        await asyncio.sleep(0.01)
+
+    # Assert
+    assert not transports[0].connected
+    assert committed == [2]
+    assert [point.slot for point in store.load()] == [2]
+
+
+@pytest.mark.asyncio
+async def test_chain_sync_resumes_at_failed_handler(
+    mocker, reconnecting_context, tmp_path
+):
+    # Arrange
+    context, transports = reconnecting_context
+    find_intersect = mocker.patch(
+        "pyogmios_client.ouroboros_mini_protocols.chain_sync.chain_sync_client.find_intersect",
+        new_callable=AsyncMock,
+    )
+    handled = []
+    failures = [ValueError("write failed")]
+
+    def roll_forward_handler(response, ack):
+        slot = response.block.babbage.header.slot
+        if slot == 3 and failures:
+            raise failures.pop()
+        handled.append(slot)
+
+    handlers = ChainSyncMessageHandlers(
+        roll_forward=roll_forward_handler, roll_backward=lambda response, ack: None
+    )
+    store = FileCursorStore(str(tmp_path / "cursor.json"))
+    options = Options(reconnect=False, cursor_store=store, checkpoint_blocks=1)
+    client = await create_chain_sync_client(context, handlers, options)
+    await client.start_sync([Point(slot=1, hash=block_hash(1))], 5)
+    for slot in (2, 3, 4):
+        await transports[0].inbox.put(roll_forward(slot))
+    for _ in range(100):
+        if not transports[0].connected:
+            break
+        await asyncio.sleep(0.01)
+    handled.clear()
+
+    # Act
+    await context.reconnect()
+    restarted = await create_chain_sync_client(context, handlers, options)
+    await restarted.start_sync([], 5)
+    for slot in (3, 4):
+        await transports[1].inbox.put(roll_forward(slot))
+    for _ in range(100):
+        if handled == [3, 4]:
+            break
+        await asyncio.sleep(0.01)
+
+    # Assert
+    assert not transports[0].connected
+    assert find_intersect.call_args.args[1][0] == Point(slot=2, hash=block_hash(2))
+    assert handled == [3, 4]
+    await restarted.shutdown()
+    assert [point.slot for point in store.load()][0] == 4
+
+
+@pytest.mark.parametrize("options", [{}, {"lazy_blocks": True}, {"headers_only": True}])
+def test_decode_request_next_results_can_cross_processes(options):
+    # Arrange
+    message = roll_forward(2)
+
+    # Act
+    with ProcessPoolExecutor(1) as executor:
+        event = executor.submit(decode_request_next, message, **options).result()
+
+    # Assert
+    assert create_point_from_roll_forward(event) == Point(slot=2, hash=block_hash(2))
+
+
+@pytest.mark.asyncio
+async def test_chain_sync_decodes_in_worker_processes(mocker, reconnecting_context):
+    # Arrange
+    context, transports = reconnecting_context
+    mocker.patch(
+        "pyogmios_client.ouroboros_mini_protocols.chain_sync.chain_sync_client.find_intersect",
+        new_callable=AsyncMock,
+    )
+    client = await create_chain_sync_client(
+        context, options=Options(reconnect=False, decode_workers=2)
+    )
+    await client.start_sync([Point(slot=1, hash=block_hash(1))], 8)
+
+    # Act
+    for slot in range(2, 10):
+        await transports[0].inbox.put(roll_forward(slot))
+    events = client.events()
+    slots = [
+        (await asyncio.wait_for(events.__anext__(), 10)).block.babbage.header.slot
+        for _ in range(8)
+    ]
+
+    # Assert
+    assert slots == list(range(2, 10))
+    await client.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_chain_sync_checkpoints_to_cursor_store(
+    mocker, reconnecting_context, tmp_path
+):
+    # Arrange
+    context, transports = reconnecting_context
+    find_intersect = mocker.patch(
+        "pyogmios_client.ouroboros_mini_protocols.chain_sync.chain_sync_client.find_intersect",
+        new_callable=AsyncMock,
+    )
+    store = FileCursorStore(str(tmp_path / "cursor.json"))
+    store.save([Point(slot=1, hash=block_hash(1))])
+    client = await create_chain_sync_client(
+        context,
+        options=Options(
+            reconnect=False, cursor_store=store, resume_points=2, checkpoint_blocks=2
+        ),
+    )
+    await client.start_sync([], 2)
+
+    # Act
+    for slot in (2, 3, 4, 5):
+        await transports[0].inbox.put(roll_forward(slot))
+    events = client.events()
+    for _ in range(4):
+        await asyncio.wait_for(events.__anext__(), 1)
+    checkpointed = store.load()
+    await client.shutdown()
+
+    # Assert
+    assert find_intersect.call_args.args[1] == [Point(slot=1, hash=block_hash(1))]
+    assert [point.slot for point in checkpointed] == [3, 2]
+    # The block at slot 5 was handed out but not done with, as the next one was not requested
+    assert [point.slot for point in store.load()] == [4, 3]
+
+
+@pytest.mark.asyncio
+async def test_chain_sync_volatile_chain_reports_orphaned_blocks(
+    mocker, reconnecting_context
+):
+    # Arrange
+    context, transports = reconnecting_context
+    mocker.patch(
+        "pyogmios_client.ouroboros_mini_protocols.chain_sync.chain_sync_client.find_intersect",
+        new_callable=AsyncMock,
+    )
+    client = await create_chain_sync_client(
+        context, options=Options(reconnect=False, volatile_chain=True)
+    )
+    await client.start_sync([Point(slot=1, hash=block_hash(1))], 2)
+    rollback = fake_request_next_response(
+        {
+            "RollBackward": {
+                "point": {"slot": 2, "hash": block_hash(2)},
+                "tip": {"slot": 4, "hash": block_hash(4), "blockNo": 4},
+            }
+        }
+    )
+
+    # Act
+    for frame in (roll_forward(2), roll_forward(3), roll_forward(4)):
+        await transports[0].inbox.put(frame)
+    await transports[0].inbox.put(json.dumps(rollback))
+    events = client.events()
+    received = [await asyncio.wait_for(events.__anext__(), 1) for _ in range(4)]
+    await asyncio.sleep(0)
+
+    # Assert
+    assert [
+        create_point_from_roll_forward(orphan).slot for orphan in received[-1].orphaned
+    ] == [4, 3]
+    assert client.volatile.tip == Point(slot=2, hash=block_hash(2))
+    await client.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_chain_sync_block_filter_skips_blocks(mocker, reconnecting_context):
+    # Arrange
+    context, transports = reconnecting_context
+    mocker.patch(
+        "pyogmios_client.ouroboros_mini_protocols.chain_sync.chain_sync_client.find_intersect",
+        new_callable=AsyncMock,
+    )
+    address = "addr_test1vz09v9yfxguvlp0zsnrpa3tdtm7el8xufp3m5lsm7qxzclgmzkket"
+    output = {
+        "address": address,
+        "value": {"coins": 2, "assets": {}},
+        "datumHash": None,
+        "datum": None,
+        "script": None,
+    }
+    block = fake_block_babbage(
+        3,
+        block_hash(3),
+        block_hash(2),
+        transactions=[fake_tx_babbage("11" * 32, outputs=[output])],
+    )
+    tip = {"slot": 3, "hash": block_hash(3), "blockNo": 3}
+    matching = fake_request_next_response({"RollForward": {"block": block, "tip": tip}})
+    client = await create_chain_sync_client(
+        context,
+        options=Options(reconnect=False, block_filter=BlockFilter(addresses={address})),
+    )
+    await client.start_sync([Point(slot=1, hash=block_hash(1))], 2)
+
+    # Act
+    for message in (roll_forward(2), json.dumps(matching), roll_forward(4)):
+        await transports[0].inbox.put(message)
+    events = client.events()
+    delivered = await asyncio.wait_for(events.__anext__(), 1)
+    for _ in range(100):
+        if client.stats.blocks == 3:
+            break
+        await asyncio.sleep(0)
+    await client.shutdown()
+
+    # Assert
+    assert create_point_from_roll_forward(delivered).slot == 3
+    assert client.stats.blocks == 3
+    assert [event async for event in events] == []
+
+
+def roll_forward_behind_tip(slot: int) -> str:
+    block = fake_block_babbage(slot, block_hash(slot), block_hash(slot - 1))
+    tip = {"slot": 99, "hash": block_hash(99), "blockNo": 99}
+    return json.dumps(
+        fake_request_next_response({"RollForward": {"block": block, "tip": tip}})
+    )
+
+
+@pytest.mark.asyncio
+async def test_chain_sync_delivers_batches(mocker, reconnecting_context):
+    # Arrange
+    context, transports = reconnecting_context
+    mocker.patch(
+        "pyogmios_client.ouroboros_mini_protocols.chain_sync.chain_sync_client.find_intersect",
+        new_callable=AsyncMock,
+    )
+    delivered = asyncio.Queue()
+    committed = []
+    handlers = ChainSyncMessageHandlers(
+        roll_forward_batch=lambda events, ack: delivered.put_nowait(
+            [event.block.babbage.header.slot for event in events]
+        ),
+        roll_backward=lambda event, ack: delivered.put_nowait(event.point.slot),
+        commit=lambda events, result: committed.append(events),
+    )
+    client = await create_chain_sync_client(
+        context, handlers, Options(reconnect=False, batch_size=2, batch_interval=60)
+    )
+    await client.start_sync([Point(slot=1, hash=block_hash(1))], 2)
+    rollback = fake_request_next_response(
+        {
+            "RollBackward": {
+                "point": {"slot": 3, "hash": block_hash(3)},
+                "tip": {"slot": 99, "hash": block_hash(99), "blockNo": 99},
+            }
+        }
+    )
+
+    # Act
+    for message in (
+        roll_forward_behind_tip(2),
+        roll_forward_behind_tip(3),
+        roll_forward_behind_tip(4),
+        json.dumps(rollback),
+        roll_forward(4),
+    ):
+        await transports[0].inbox.put(message)
+    received = [await asyncio.wait_for(delivered.get(), 1) for _ in range(4)]
+
+    # Assert
+    assert received == [[2, 3], [4], 3, [4]]
+    assert [len(events) for events in committed if isinstance(events, list)] == [
+        2,
+        1,
+        1,
+    ]
+    await client.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_chain_sync_flushes_batches_after_interval(mocker, reconnecting_context):
+    # Arrange
+    context, transports = reconnecting_context
+    mocker.patch(
+        "pyogmios_client.ouroboros_mini_protocols.chain_sync.chain_sync_client.find_intersect",
+        new_callable=AsyncMock,
+    )
+    delivered = asyncio.Queue()
+    handlers = ChainSyncMessageHandlers(
+        roll_forward_batch=lambda events, ack: delivered.put_nowait(len(events)),
+        roll_backward=lambda event, ack: None,
+    )
+    client = await create_chain_sync_client(
+        context, handlers, Options(reconnect=False, batch_interval=0.01)
+    )
+    await client.start_sync([Point(slot=1, hash=block_hash(1))], 2)
+
+    # Act
+    for slot in (2, 3):
+        await transports[0].inbox.put(roll_forward_behind_tip(slot))
+
+    # Assert
+    assert await asyncio.wait_for(delivered.get(), 1) == 2
+    assert client.stats.blocks == 2
+    await client.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_chain_sync_stops_at_failed_timed_batch(
+    mocker, reconnecting_context, tmp_path
+):
+    # Arrange
+    context, transports = reconnecting_context
+    mocker.patch(
+        "pyogmios_client.ouroboros_mini_protocols.chain_sync.chain_sync_client.find_intersect",
+        new_callable=AsyncMock,
+    )
+    delivered = []
+    started, release = asyncio.Event(), asyncio.Event()
+
+    async def roll_forward_batch_handler(events, ack):
+        slots = [event.block.babbage.header.slot for event in events]
+        delivered.append(slots)
+        if 2 in slots:
+            started.set()
+            await release.wait()
+            raise ValueError("write failed")
+
+    handlers = ChainSyncMessageHandlers(
+        roll_forward_batch=roll_forward_batch_handler,
+        roll_backward=lambda event, ack: None,
+    )
+    store = FileCursorStore(str(tmp_path / "cursor.json"))
+    store.save([Point(slot=1, hash=block_hash(1))])
+    client = await create_chain_sync_client(
+        context,
+        handlers,
+        Options(
+            reconnect=False,
+            cursor_store=store,
+            checkpoint_blocks=1,
+            batch_interval=0.01,
+        ),
+    )
+    await client.start_sync([], 5)
+
+    # Act
+    for slot in (2, 3):
+        await transports[0].inbox.put(roll_forward_behind_tip(slot))
+    await asyncio.wait_for(started.wait(), 1)
+    # At the tip, so flushed as soon as the failing batch releases the lock
+    await transports[0].inbox.put(roll_forward(4))
+    await asyncio.sleep(0.01)
+    release.set()
+    for _ in range(100):
+        if not transports[0].connected:
+            break
+        await asyncio.sleep(0.01)
+
+    # Assert
+    assert not transports[0].connected
+    assert delivered == [[2, 3]]
+    assert client.stats.blocks == 0
+    assert [point.slot for point in store.load()] == [1]
@@ -0,0 +1,49 @@
+import pytest
+
+from pyogmios_client.models import Point
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.cursor_store import (
+    Checkpointer,
+    FileCursorStore,
+    SqliteCursorStore,
+)
+
+
+def point(slot: int) -> Point:
+    return Point(slot=slot, hash=f"{slot:064x}")
+
+
+@pytest.fixture(params=[FileCursorStore, SqliteCursorStore])
+def store_path(request, tmp_path):
+    return request.param, str(tmp_path / "cursor")
+
+
+def test_cursor_store_round_trip(store_path):
+    # Arrange
+    store_class, path = store_path
+    store = store_class(path)
+
+    # Act
+    empty = store.load()
+    store.save([point(3), point(2)])
+    store.save([point(5), point(4), point(3)])
+    store.close()
+    reopened = store_class(path)
+
+    # Assert
+    assert empty == []
+    assert reopened.load() == [point(5), point(4), point(3)]
+    reopened.close()
+
+
+def test_checkpointer_batches_saves(mocker):
+    # Arrange
+    store = mocker.MagicMock()
+    checkpointer = Checkpointer(store, blocks=3, interval=60)
+
+    # Act
+    for slot in (1, 2, 3, 4):
+        checkpointer.record([point(slot)])
+
+    # Assert
+    store.save.assert_called_once_with([point(3)])
+    assert checkpointer.pending == 1
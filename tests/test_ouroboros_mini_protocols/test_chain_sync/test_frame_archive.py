@@ -0,0 +1,125 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from pyogmios_client.connection import InteractionContext
+from pyogmios_client.models import Point
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.chain_sync_client import (
+    ChainSyncMessageHandlers,
+    Options,
+    create_chain_sync_client,
+)
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.frame_archive import (
+    FrameArchive,
+    FrameRecorder,
+    create_replay_context,
+)
+from tests.conftest import (
+    ConnectionFactory,
+    QueueTransport,
+    fake_block_babbage,
+    fake_request_next_response,
+)
+
+
+def block_hash(slot: int) -> str:
+    return f"{slot:064x}"
+
+
+def roll_forward(slot: int) -> str:
+    block = fake_block_babbage(slot, block_hash(slot), block_hash(slot - 1))
+    tip = {"slot": 9, "hash": block_hash(9), "blockNo": 9}
+    return json.dumps(
+        fake_request_next_response({"RollForward": {"block": block, "tip": tip}})
+    )
+
+
+@pytest.mark.parametrize("compression", ["gzip", "lzma"])
+def test_recorder_writes_indexed_segments(tmp_path, compression):
+    # Arrange
+    recorder = FrameRecorder(str(tmp_path), segment_frames=2, compression=compression)
+
+    # Act
+    for slot in (2, 3, 4):
+        recorder.record(roll_forward(slot))
+    recorder.close()
+    archive = FrameArchive(str(tmp_path))
+
+    # Assert
+    assert [(s["first_slot"], s["last_slot"]) for s in archive.segments] == [
+        (2, 3),
+        (4, 4),
+    ]
+    assert list(archive.frames()) == [roll_forward(slot) for slot in (2, 3, 4)]
+    assert archive.tip["slot"] == 9
+    point, frames = archive.intersect([{"slot": 3, "hash": block_hash(3)}])
+    assert point["slot"] == 3
+    assert list(frames) == [roll_forward(4)]
+    assert archive.intersect([{"slot": 3, "hash": block_hash(4)}])[0] is None
+
+
+def test_archive_reads_segments_missing_from_index(tmp_path):
+    # Arrange
+    recorder = FrameRecorder(str(tmp_path), segment_frames=2)
+    for slot in (2, 3, 4):
+        recorder.record(roll_forward(slot))
+    recorder._segment.flush()
+
+    # Act
+    archive = FrameArchive(str(tmp_path))
+
+    # Assert
+    assert len(archive.segments) == 2
+    assert archive.segments[1]["first_slot"] is None
+    assert list(archive.frames())[-1] == roll_forward(4)
+
+
+@pytest.mark.asyncio
+async def test_chain_sync_records_and_replays_frames(mocker, tmp_path):
+    # Arrange
+    mocker.patch(
+        "pyogmios_client.ouroboros_mini_protocols.chain_sync.chain_sync_client.find_intersect",
+        new_callable=AsyncMock,
+    )
+    transport = QueueTransport()
+    live = InteractionContext(
+        connection=ConnectionFactory.build(),
+        socket=transport,
+        after_each=lambda socket, function: function(),
+    )
+    recorder = FrameRecorder(str(tmp_path), segment_frames=2)
+    recording = await create_chain_sync_client(
+        live, options=Options(reconnect=False, recorder=recorder)
+    )
+    await recording.start_sync([Point(slot=1, hash=block_hash(1))], 2)
+    for slot in (2, 3, 4, 5):
+        await transport.inbox.put(roll_forward(slot))
+    events = recording.events()
+    for _ in range(4):
+        await asyncio.wait_for(events.__anext__(), 1)
+    await recording.shutdown()
+    recorder.close()
+    mocker.stopall()
+
+    # Act
+    replayed = []
+    context = create_replay_context(str(tmp_path))
+    client = await create_chain_sync_client(
+        context,
+        ChainSyncMessageHandlers(
+            roll_forward=lambda event, ack: replayed.append(
+                event.block.babbage.header.slot
+            ),
+            roll_backward=lambda event, ack: None,
+        ),
+        Options(reconnect=False),
+    )
+    intersection = await client.start_sync([Point(slot=2, hash=block_hash(2))], 2)
+    await asyncio.wait_for(context.socket.wait_finished(), 1)
+    await client.shutdown()
+
+    # Assert
+    assert intersection.point == Point(slot=2, hash=block_hash(2))
+    assert replayed == [3, 4, 5]
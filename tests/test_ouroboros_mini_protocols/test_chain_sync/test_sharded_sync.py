@@ -0,0 +1,114 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from pyogmios_client.connection import InteractionContext
+from pyogmios_client.enums import InteractionType
+from pyogmios_client.models import Point
+from pyogmios_client.models.result_models import RollBackward
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.find_intersect import (
+    create_point_from_roll_forward,
+)
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.sharded_sync import (
+    ShardedSync,
+    create_sharded_sync,
+)
+from tests.conftest import (
+    ConnectionFactory,
+    QueueTransport,
+    fake_block_babbage,
+    fake_request_next_response,
+)
+
+
+def block_hash(slot: int) -> str:
+    return f"{slot:064x}"
+
+
+def tip(slot: int) -> dict:
+    return {"slot": slot, "hash": block_hash(slot), "blockNo": slot}
+
+
+def roll_forward(slot: int) -> str:
+    block = fake_block_babbage(slot, block_hash(slot), block_hash(slot - 1))
+    return json.dumps(
+        fake_request_next_response({"RollForward": {"block": block, "tip": tip(9)}})
+    )
+
+
+def roll_backward(slot: int) -> str:
+    point = {"slot": slot, "hash": block_hash(slot)}
+    return json.dumps(
+        fake_request_next_response({"RollBackward": {"point": point, "tip": tip(9)}})
+    )
+
+
+@pytest.fixture
+def fake_contexts(mocker):
+    contexts = []
+
+    async def create(error_handler, close_handler, options):
+        assert options.interaction_type is InteractionType.LONG_RUNNING
+        context = InteractionContext(
+            connection=ConnectionFactory.build(),
+            socket=QueueTransport(),
+            after_each=lambda socket, function: function(),
+        )
+        contexts.append(context)
+        return context
+
+    mocker.patch(
+        "pyogmios_client.ouroboros_mini_protocols.chain_sync.sharded_sync.create_interaction_context",
+        side_effect=create,
+    )
+    mocker.patch(
+        "pyogmios_client.ouroboros_mini_protocols.chain_sync.chain_sync_client.find_intersect",
+        new_callable=AsyncMock,
+    )
+    return contexts
+
+
+def test_sharded_sync_splits_checkpoints_into_ranges():
+    # Arrange
+    first, second = Point(slot=1, hash=block_hash(1)), Point(slot=4, hash=block_hash(4))
+
+    # Act
+    sharded_sync = ShardedSync([second, first])
+
+    # Assert
+    assert [(r.start, r.end) for r in sharded_sync.ranges_to_sync] == [
+        (first, second),
+        (second, None),
+    ]
+    with pytest.raises(ValueError):
+        ShardedSync([])
+
+
+@pytest.mark.asyncio
+async def test_sharded_sync_merges_ranges_in_order(fake_contexts):
+    # Arrange
+    checkpoints = [Point(slot=1, hash=block_hash(1)), Point(slot=4, hash=block_hash(4))]
+    sharded_sync = await create_sharded_sync(checkpoints)
+    first, second = (context.socket for context in fake_contexts)
+    for frame in (roll_forward(5), roll_forward(6)):
+        await second.inbox.put(frame)
+    for frame in (roll_backward(1), roll_forward(2), roll_backward(1)):
+        await first.inbox.put(frame)
+    for slot in (2, 3, 4, 5):
+        await first.inbox.put(roll_forward(slot))
+
+    # Act
+    events = sharded_sync.events()
+    received = [await asyncio.wait_for(events.__anext__(), 1) for _ in range(7)]
+
+    # Assert
+    assert isinstance(received[1], RollBackward)
+    slots = [create_point_from_roll_forward(event).slot for event in received[2:]]
+    assert slots == [2, 3, 4, 5, 6]
+    assert len(set(slots)) == len(slots)
+    assert not first.connected
+    assert second.connected
+    await sharded_sync.close()
+    assert not second.connected
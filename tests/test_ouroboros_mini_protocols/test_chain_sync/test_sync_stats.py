@@ -0,0 +1,26 @@
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.sync_stats import SyncStats
+
+
+def test_sync_stats_rate(mocker):
+    # Arrange
+    clock = mocker.patch(
+        "pyogmios_client.ouroboros_mini_protocols.chain_sync.sync_stats.time.monotonic",
+        return_value=100.0,
+    )
+    stats = SyncStats(window=10)
+
+    # Act
+    for now in (100.5, 101.5, 101.7, 105.0):
+        clock.return_value = now
+        stats.record_block()
+    stats.record_rollback()
+    clock.return_value = 110.0
+    rate_in_window = stats.rate
+    clock.return_value = 112.0
+    rate_after_expiry = stats.rate
+
+    # Assert
+    assert stats.blocks == 4
+    assert stats.rollbacks == 1
+    assert rate_in_window == 0.3
+    assert rate_after_expiry == 0.1
@@ -0,0 +1,61 @@
+import json
+
+from pyogmios_client.models import Origin, Point
+from pyogmios_client.models.result_models import RollBackward
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.chain_sync_client import (
+    decode_request_next,
+)
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.volatile_chain import (
+    VolatileChain,
+    VolatileRollBackward,
+)
+from tests.conftest import fake_block_babbage, fake_request_next_response
+
+
+def block_hash(slot: int) -> str:
+    return f"{slot:064x}"
+
+
+def roll_forward(slot: int):
+    block = fake_block_babbage(slot, block_hash(slot), block_hash(slot - 1))
+    tip = {"slot": slot, "hash": block_hash(slot), "blockNo": slot}
+    frame = fake_request_next_response({"RollForward": {"block": block, "tip": tip}})
+    return decode_request_next(json.dumps(frame), headers_only=True)
+
+
+def test_volatile_chain_keeps_last_blocks_indexed():
+    # Arrange
+    chain = VolatileChain(depth=3)
+
+    # Act
+    for slot in range(1, 6):
+        chain.append(roll_forward(slot))
+
+    # Assert
+    assert len(chain) == 3
+    assert chain.tip == Point(slot=5, hash=block_hash(5))
+    assert chain.at_slot(2) is None
+    assert chain.at_slot(3).header.slot == 3
+    assert chain.get(block_hash(4)).header.slot == 4
+    assert chain.get(block_hash(1)) is None
+
+
+def test_volatile_chain_rolls_back_orphaned_blocks():
+    # Arrange
+    chain = VolatileChain()
+    for slot in range(1, 6):
+        chain.append(roll_forward(slot))
+    tip = {"slot": 3, "hash": block_hash(3), "blockNo": 3}
+
+    # Act
+    event = chain.roll_backward(
+        RollBackward(point=Point(slot=3, hash=block_hash(3)), tip=tip)
+    )
+
+    # Assert
+    assert isinstance(event, VolatileRollBackward)
+    assert [orphan.header.slot for orphan in event.orphaned] == [5, 4]
+    assert chain.tip == Point(slot=3, hash=block_hash(3))
+    assert chain.get(block_hash(5)) is None
+    assert [orphan.header.slot for orphan in chain.roll_back(Origin())] == [3, 2, 1]
+    assert len(chain) == 0
@@ -0,0 +1,216 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pyogmios_client.connection import InteractionContext, create_connection_object
+from pyogmios_client.enums import CacheScope
+from pyogmios_client.models import Epoch, Point
+from pyogmios_client.ouroboros_mini_protocols.state_query import state_query_client
+from pyogmios_client.ouroboros_mini_protocols.state_query.query_cache import (
+    CachePolicy,
+    QueryCache,
+)
+from pyogmios_client.ouroboros_mini_protocols.state_query.state_query_client import (
+    Options,
+    create_state_query_client,
+)
+from pyogmios_client.transport import Transport
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_query_cache_keeps_results_by_policy():
+    # Arrange
+    clock = Clock()
+    cache = QueryCache(clock=clock)
+    run = AsyncMock(side_effect=["start", "pools", "pools again", "tip", "tip"])
+    epoch = AsyncMock(return_value=Epoch(1))
+
+    # Act
+    results = [
+        await cache.get("system_start", (), run, epoch),
+        await cache.get("pool_ids", (), run, epoch),
+    ]
+    clock.now = 61.0
+    results += [
+        await cache.get("system_start", (), run, epoch),
+        await cache.get("pool_ids", (), run, epoch),
+        await cache.get("chain_tip", (), run, epoch),
+        await cache.get("chain_tip", (), run, epoch),
+    ]
+
+    # Assert
+    assert results == ["start", "pools", "start", "pools again", "tip", "tip"]
+    assert run.await_count == 5
+    assert (cache.hits, cache.misses) == (1, 3)
+    epoch.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_query_cache_drops_epoch_results_on_new_epoch():
+    # Arrange
+    clock = Clock()
+    cache = QueryCache(clock=clock, epoch_check_interval=30.0)
+    run = AsyncMock(side_effect=["params 1", "params 2", "params 3"])
+    epoch = AsyncMock(side_effect=[Epoch(1), Epoch(1), Epoch(2)])
+
+    # Act
+    results = [await cache.get("current_protocol_parameters", (), run, epoch)]
+    clock.now = 10.0
+    results.append(await cache.get("current_protocol_parameters", (), run, epoch))
+    clock.now = 40.0
+    results.append(await cache.get("current_protocol_parameters", (), run, epoch))
+    clock.now = 80.0
+    results.append(await cache.get("current_protocol_parameters", (), run, epoch))
+    cache.observe_epoch(3)
+    results.append(await cache.get("current_protocol_parameters", (), run, epoch))
+
+    # Assert
+    assert results == ["params 1", "params 1", "params 1", "params 2", "params 3"]
+    assert epoch.await_count == 3
+    assert cache.epoch == 3
+
+
+@pytest.mark.asyncio
+async def test_query_cache_evicts_least_recently_used():
+    # Arrange
+    cache = QueryCache(
+        max_entries=2,
+        policies={"pool_parameters": CachePolicy(scope=CacheScope.FOREVER)},
+    )
+    run = AsyncMock(side_effect=lambda: object())
+    epoch = AsyncMock()
+
+    # Act
+    first = await cache.get("pool_parameters", (["a"],), run, epoch)
+    await cache.get("pool_parameters", (["b"],), run, epoch)
+    await cache.get("pool_parameters", (["a"],), run, epoch)
+    await cache.get("pool_parameters", (["c"],), run, epoch)
+    again = await cache.get("pool_parameters", (["a"],), run, epoch)
+    await cache.get("pool_parameters", (["b"],), run, epoch)
+
+    # Assert
+    assert again is first
+    assert len(cache) == 2
+    assert run.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_query_cache_shares_concurrent_misses():
+    # Arrange
+    cache = QueryCache()
+    started = asyncio.Event()
+
+    async def run():
+        started.set()
+        await asyncio.sleep(0.01)
+        return "start"
+
+    query = AsyncMock(side_effect=run)
+
+    # Act
+    results = await asyncio.gather(
+        *(cache.get("system_start", (), query, AsyncMock()) for _ in range(10))
+    )
+
+    # Assert
+    assert results == ["start"] * 10
+    assert query.await_count == 1
+
+
+def test_query_cache_requires_ttl():
+    with pytest.raises(ValueError):
+        QueryCache(policies={"pool_ids": CachePolicy(scope=CacheScope.TTL)})
+
+
+@pytest.mark.asyncio
+async def test_state_query_client_uses_cache(mocker):
+    # Arrange
+    context = InteractionContext(
+        connection=create_connection_object(),
+        socket=MagicMock(spec=Transport, connected=True),
+        after_each=lambda socket, function: function(),
+    )
+    system_start = mocker.patch.object(
+        state_query_client, "system_start", AsyncMock(return_value="start")
+    )
+    current_epoch = mocker.patch.object(
+        state_query_client, "current_epoch", AsyncMock(return_value=Epoch(7))
+    )
+    cache = QueryCache()
+    client = await create_state_query_client(context, Options(cache=cache))
+
+    # Act
+    results = [await client.system_start(), await client.system_start()]
+    epoch = await client.current_epoch()
+
+    # Assert
+    assert results == ["start", "start"]
+    system_start.assert_awaited_once_with(context)
+    assert epoch == Epoch(7)
+    current_epoch.assert_awaited_once_with(context)
+    assert cache.epoch == 7
+
+
+@pytest.mark.asyncio
+async def test_state_query_client_at_point_skips_cache(mocker):
+    # Arrange
+    context = InteractionContext(
+        connection=create_connection_object(),
+        socket=MagicMock(spec=Transport, connected=True),
+        after_each=lambda socket, function: function(),
+    )
+    point = Point(slot=5, hash="00" * 32)
+    mocker.patch.object(state_query_client, "generate", return_value="acquire")
+    mocker.patch.object(
+        context.multiplexer,
+        "request",
+        AsyncMock(
+            return_value=json.dumps(
+                {
+                    "type": "jsonwsp/response",
+                    "version": "1.0",
+                    "servicename": "ogmios",
+                    "methodname": "Acquire",
+                    "result": {"AcquireSuccess": {"point": point.model_dump()}},
+                    "reflection": {"requestId": "acquire"},
+                }
+            )
+        ),
+    )
+    parameters = mocker.patch.object(
+        state_query_client,
+        "current_protocol_parameters",
+        AsyncMock(side_effect=["tip parameters", "past parameters"]),
+    )
+    mocker.patch.object(
+        state_query_client, "current_epoch", AsyncMock(side_effect=[Epoch(7), Epoch(3)])
+    )
+    cache = QueryCache()
+    tip_client = await create_state_query_client(context, Options(cache=cache))
+    past_client = await create_state_query_client(
+        context, Options(point=point, cache=cache)
+    )
+
+    # Act
+    tip_results = [await tip_client.current_protocol_parameters()]
+    past_results = [
+        await past_client.current_protocol_parameters(),
+        await past_client.current_epoch(),
+    ]
+    tip_results.append(await tip_client.current_protocol_parameters())
+
+    # Assert
+    assert tip_results == ["tip parameters", "tip parameters"]
+    assert past_results == ["past parameters", Epoch(3)]
+    assert parameters.await_count == 2
+    assert cache.epoch == 7
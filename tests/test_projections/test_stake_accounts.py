@@ -0,0 +1,111 @@
+import pytest
+
+from pyogmios_client.exceptions import RollbackTooDeepError
+from pyogmios_client.models import DelegationsAndRewards, Origin, Point
+from pyogmios_client.projections.stake_accounts import StakeAccount, StakeAccounts
+from tests.conftest import fake_tx_babbage
+from tests.test_projections.test_utxo_set import block_hash, roll_forward
+
+STAKE = "337b62cfff6403a06a3acbc34f8c46003c69fe79a3628cefa9c47251"
+REWARD = "stake1uyehkck0lajq8gr28t9uxnuvgcqrc6070x3k9r8048z8y5gh6ffgw"
+OTHER = "11" * 28
+POOL_A = "pool1pu5jlj4q9w9jlxeu370a3c9myx47md5j5m2str0naunn2q3lkdy"
+POOL_B = "pool1z22x50lqsrwent6en0llzzs9e577rx7n3mv9kfw7udwa2rf42fa"
+
+
+def registration(credential):
+    return {"stakeKeyRegistration": credential}
+
+
+def deregistration(credential):
+    return {"stakeKeyDeregistration": credential}
+
+
+def delegation(credential, pool):
+    return {"stakeDelegation": {"delegator": credential, "delegatee": pool}}
+
+
+@pytest.fixture
+def blocks():
+    return [
+        (
+            2,
+            [
+                fake_tx_babbage(
+                    "aa" * 32,
+                    certificates=[
+                        registration(STAKE),
+                        delegation(STAKE, POOL_A),
+                        registration(OTHER),
+                    ],
+                )
+            ],
+        ),
+        (
+            3,
+            [
+                fake_tx_babbage(
+                    "bb" * 32,
+                    withdrawals={REWARD: 7},
+                    certificates=[delegation(STAKE, POOL_B), deregistration(OTHER)],
+                ),
+                fake_tx_babbage(
+                    "cc" * 32,
+                    certificates=[deregistration(STAKE)],
+                    input_source="collaterals",
+                ),
+            ],
+        ),
+    ]
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+def test_stake_accounts_apply_certificates_and_withdrawals(blocks, lazy):
+    # Arrange
+    accounts = StakeAccounts()
+
+    # Act
+    for slot, transactions in blocks:
+        accounts.apply(roll_forward(slot, transactions, lazy))
+
+    # Assert
+    assert len(accounts) == 1
+    assert accounts.get(STAKE) == StakeAccount(pool=POOL_B, withdrawn=7)
+    assert accounts.delegate(REWARD) == POOL_B
+    assert OTHER not in accounts
+    assert accounts.delegate(OTHER) is None
+    assert accounts.tip == Point(slot=3, hash=block_hash(3))
+
+
+def test_stake_accounts_roll_back(blocks):
+    # Arrange
+    accounts = StakeAccounts(depth=1)
+    for slot, transactions in blocks:
+        accounts.apply(roll_forward(slot, transactions))
+
+    # Act
+    accounts.roll_backward(Point(slot=2, hash=block_hash(2)))
+
+    # Assert
+    assert accounts.get(STAKE) == StakeAccount(pool=POOL_A, withdrawn=0)
+    assert accounts.get(OTHER) == StakeAccount(pool=None, withdrawn=0)
+    assert accounts.tip == Point(slot=2, hash=block_hash(2))
+    with pytest.raises(RollbackTooDeepError):
+        accounts.roll_backward(Origin())
+
+
+def test_stake_accounts_seed():
+    # Arrange
+    accounts = StakeAccounts()
+
+    # Act
+    accounts.seed(
+        {
+            STAKE: DelegationsAndRewards(delegate=POOL_A, rewards=10),
+            OTHER: {"delegate": POOL_B, "rewards": 0},
+        }
+    )
+
+    # Assert
+    assert accounts.delegate(REWARD) == POOL_A
+    assert accounts.delegate(OTHER) == POOL_B
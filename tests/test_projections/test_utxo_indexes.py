@@ -0,0 +1,117 @@
+import pytest
+
+from pyogmios_client.models import Point
+from pyogmios_client.projections.addresses import address_credentials
+from pyogmios_client.projections.utxo_indexes import HashIndex, address_keys
+from pyogmios_client.projections.utxo_set import UtxoSet
+from tests.conftest import fake_tx_babbage
+from tests.test_projections.test_utxo_set import block_hash, roll_forward
+
+PAYMENT = "9493315cd92eb5d8c4304e67b7e16ae36d61d34502694657811a2c8e"
+STAKE = "337b62cfff6403a06a3acbc34f8c46003c69fe79a3628cefa9c47251"
+BASE = "addr1qx2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzer3n0d3vllmyqwsx5wktcd8cc3sq835lu7drv2xwl2wywfgse35a3x"
+ENTERPRISE = "addr1vx2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzers66hrl8"
+REWARD = "stake1uyehkck0lajq8gr28t9uxnuvgcqrc6070x3k9r8048z8y5gh6ffgw"
+BYRON = "Ae2tdPwUPEZFRbyhz3cpfC2CumGzNkFBN2L42rcUc2yjQpEkxDbkPodpMAi"
+POLICY = "ab" * 28
+TX_A, TX_B = "aa" * 32, "bb" * 32
+
+
+def output(address: str, coins: int, assets=None) -> dict:
+    return {
+        "address": address,
+        "value": {"coins": coins, "assets": assets or {}},
+        "datumHash": None,
+        "datum": None,
+        "script": None,
+    }
+
+
+@pytest.mark.parametrize(
+    "address,credentials",
+    [
+        (BASE, (PAYMENT, STAKE)),
+        (ENTERPRISE, (PAYMENT, None)),
+        (REWARD, (None, STAKE)),
+        (BYRON, (None, None)),
+    ],
+)
+def test_address_credentials(address, credentials):
+    # Act
+    result = address_credentials(address)
+
+    # Assert
+    assert result == credentials
+
+
+def test_hash_index_adds_and_removes_rows():
+    # Arrange
+    index = HashIndex(address_keys)
+
+    # Act
+    index.add(0, output(BASE, 1))
+    index.add(1, output(BASE, 2))
+    index.add(2, output(ENTERPRISE, 3))
+    index.remove(0, output(BASE, 1))
+    index.remove(2, output(ENTERPRISE, 3))
+
+    # Assert
+    assert list(index.rows(BASE)) == [1]
+    assert list(index.rows(ENTERPRISE)) == []
+    assert len(index) == 1
+
+
+def test_utxo_set_indexes_credentials_and_assets():
+    # Arrange
+    utxo_set = UtxoSet()
+    blocks = [
+        (
+            2,
+            [
+                fake_tx_babbage(
+                    TX_A,
+                    outputs=[
+                        output(BASE, 5, {f"{POLICY}.6e6674": 1}),
+                        output(ENTERPRISE, 3, {POLICY: 2}),
+                    ],
+                )
+            ],
+        ),
+        (3, [fake_tx_babbage(TX_B, inputs=[(TX_A, 0)], outputs=[output(BYRON, 4)])]),
+    ]
+
+    # Act
+    for slot, transactions in blocks:
+        utxo_set.apply(roll_forward(slot, transactions))
+    after_spend = (
+        utxo_set.by_payment_credential(PAYMENT),
+        utxo_set.by_stake_credential(STAKE),
+        utxo_set.by_asset(POLICY, "6e6674"),
+    )
+    utxo_set.roll_backward(Point(slot=2, hash=block_hash(2)))
+
+    # Assert
+    assert [tx_in.index.root for tx_in, _ in after_spend[0]] == [1]
+    assert after_spend[1] == [] and after_spend[2] == []
+    assert sorted(
+        tx_in.index.root for tx_in, _ in utxo_set.by_payment_credential(PAYMENT)
+    ) == [0, 1]
+    assert [out.address.root for _, out in utxo_set.by_stake_credential(STAKE)] == [
+        BASE
+    ]
+    assert [out.value.coins.root for _, out in utxo_set.by_asset(POLICY, "6e6674")] == [
+        5
+    ]
+    assert [out.value.coins.root for _, out in utxo_set.by_asset(POLICY)] == [3]
+    assert utxo_set.by_address(BYRON) == []
+
+
+def test_utxo_set_rejects_lookups_without_index():
+    # Arrange
+    utxo_set = UtxoSet(indexes=["address"])
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        utxo_set.by_asset(POLICY)
+    with pytest.raises(ValueError):
+        UtxoSet(indexes=["datum"])
@@ -0,0 +1,134 @@
+import json
+
+import pytest
+
+from pyogmios_client.exceptions import RollbackTooDeepError
+from pyogmios_client.models import Origin, Point, TxIn
+from pyogmios_client.models.lazy_block_model import LazyRollForward
+from pyogmios_client.ouroboros_mini_protocols.chain_sync.chain_sync_client import (
+    decode_request_next,
+)
+from pyogmios_client.projections.utxo_set import UtxoSet
+from tests.conftest import (
+    fake_block_babbage,
+    fake_request_next_response,
+    fake_tx_babbage,
+)
+
+ALICE = "addr_test1vz09v9yfxguvlp0zsnrpa3tdtm7el8xufp3m5lsm7qxzclgmzkket"
+BOB = "addr_test1vqq2lkz8cc5zfsn5qaa5yxtszkws4wyyy2eq9gkyqjshnsc8xa9yv"
+TX_A, TX_B, TX_C = "aa" * 32, "bb" * 32, "cc" * 32
+
+
+def block_hash(slot: int) -> str:
+    return f"{slot:064x}"
+
+
+def output(address: str, coins: int) -> dict:
+    return {
+        "address": address,
+        "value": {"coins": coins, "assets": {}},
+        "datumHash": None,
+        "datum": None,
+        "script": None,
+    }
+
+
+def roll_forward(slot: int, transactions, lazy=True):
+    block = fake_block_babbage(
+        slot, block_hash(slot), block_hash(slot - 1), transactions=transactions
+    )
+    tip = {"slot": slot, "hash": block_hash(slot), "blockNo": slot}
+    if lazy:
+        return LazyRollForward.from_raw({"block": block, "tip": tip})
+    frame = fake_request_next_response({"RollForward": {"block": block, "tip": tip}})
+    return decode_request_next(json.dumps(frame))
+
+
+@pytest.fixture
+def blocks():
+    return [
+        (2, [fake_tx_babbage(TX_A, outputs=[output(ALICE, 5), output(ALICE, 3)])]),
+        (
+            3,
+            [
+                fake_tx_babbage(
+                    TX_B, inputs=[(TX_A, 0)], outputs=[output(BOB, 4), output(ALICE, 1)]
+                ),
+                fake_tx_babbage(
+                    TX_C,
+                    inputs=[(TX_B, 1)],
+                    outputs=[output(BOB, 1)],
+                    collaterals=[(TX_A, 1)],
+                    collateral_return=output(ALICE, 2),
+                    input_source="collaterals",
+                ),
+            ],
+        ),
+    ]
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+def test_utxo_set_applies_transactions(blocks, lazy):
+    # Arrange
+    utxo_set = UtxoSet()
+
+    # Act
+    for slot, transactions in blocks:
+        utxo_set.apply(roll_forward(slot, transactions, lazy))
+
+    # Assert
+    assert len(utxo_set) == 3
+    assert {
+        (tx_in.txId.root, tx_in.index.root) for tx_in, _ in utxo_set.by_address(BOB)
+    } == {(TX_B, 0)}
+    assert utxo_set.get(TxIn(txId=TX_B, index=1)).value.coins.root == 1
+    assert utxo_set.get({"txId": TX_C, "index": 1}).value.coins.root == 2
+    assert {"txId": TX_C, "index": 0} not in utxo_set
+    assert {"txId": TX_A, "index": 1} not in utxo_set
+    assert utxo_set.tip == Point(slot=3, hash=block_hash(3))
+
+
+def test_utxo_set_rolls_back(blocks):
+    # Arrange
+    utxo_set = UtxoSet(depth=1)
+    for slot, transactions in blocks:
+        utxo_set.apply(roll_forward(slot, transactions))
+
+    # Act
+    utxo_set.roll_backward(Point(slot=2, hash=block_hash(2)))
+
+    # Assert
+    assert len(utxo_set) == 2
+    assert sorted(out.value.coins.root for _, out in utxo_set.by_address(ALICE)) == [
+        3,
+        5,
+    ]
+    assert utxo_set.by_address(BOB) == []
+    assert utxo_set.tip == Point(slot=2, hash=block_hash(2))
+    with pytest.raises(RollbackTooDeepError):
+        utxo_set.roll_backward(Origin())
+
+
+def test_utxo_set_rolls_back_outputs_spent_in_their_block():
+    # Arrange
+    utxo_set = UtxoSet()
+    utxo_set.apply(roll_forward(1, [fake_tx_babbage(TX_A, outputs=[output(ALICE, 5)])]))
+    utxo_set.apply(
+        roll_forward(
+            2,
+            [
+                fake_tx_babbage(TX_B, inputs=[(TX_A, 0)], outputs=[output(BOB, 5)]),
+                fake_tx_babbage(TX_C, inputs=[(TX_B, 0)], outputs=[output(ALICE, 5)]),
+            ],
+        )
+    )
+
+    # Act
+    utxo_set.roll_backward(Point(slot=1, hash=block_hash(1)))
+
+    # Assert
+    assert len(utxo_set) == 1
+    assert {"txId": TX_A, "index": 0} in utxo_set
+    assert {"txId": TX_B, "index": 0} not in utxo_set
+    assert utxo_set.by_address(BOB) == []
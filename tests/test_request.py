@@ -3,20 +3,22 @@ Test the request module.
 """
 import json
 from typing import Dict
-from unittest.mock import Mock
-
 import pytest
-from websocket import WebSocketApp
 
 from pyogmios_client.connection import InteractionContext
 from pyogmios_client.connection import (
     create_interaction_context,
 )
 from pyogmios_client.enums import MethodName
-from pyogmios_client.exceptions import JsonwspFaultError, PyOgmiosError
+from pyogmios_client.exceptions import (
+    JsonwspFaultError,
+    PyOgmiosError,
+    WebSocketClosedError,
+)
 from pyogmios_client.models.request_model import Request
 from pyogmios_client.models.response_model import Response
 from pyogmios_client.request import send, send_request
+from pyogmios_client.transport import Transport
 from tests.conftest import ConnectionFactory
 
 
@@ -25,7 +27,7 @@ async def test_send_success():
     context = await create_interaction_context()
     test_result = {"result": "test"}
 
-    async def to_send(_: WebSocketApp) -> Dict:
+    async def to_send(_: Transport) -> Dict:
         """
         Test function to send.
         """
@@ -44,7 +46,7 @@ async def test_send_fail():
     context = await create_interaction_context()
     test_error = "Expected error result"
 
-    async def to_send(_: WebSocketApp) -> Dict:
+    async def to_send(_: Transport) -> Dict:
         """
         Test function to send.
         """
@@ -56,10 +58,26 @@ async def test_send_fail():
     assert str(exc_info.value) == test_error
 
 
-class MockWebSocketApp(WebSocketApp):
+class MockTransport(Transport):
     def __init__(self, recv_data):
-        self.sock = Mock()
-        self.sock.recv.return_value = json.dumps(recv_data)
+        self.sent = []
+        self.recv_data = recv_data
+
+    @property
+    def connected(self) -> bool:
+        return True
+
+    async def send(self, message: str) -> None:
+        self.sent.append(message)
+
+    async def receive(self) -> str:
+        if self.recv_data is None:
+            raise WebSocketClosedError()
+        recv_data, self.recv_data = self.recv_data, None
+        return json.dumps(recv_data)
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        pass
 
 
 @pytest.mark.asyncio
@@ -71,7 +89,7 @@ async def test_send_request_success():
         mirror={"mirror": "test-mirror"},
     )
     context = InteractionContext(
-        socket=MockWebSocketApp(
+        socket=MockTransport(
             {"type": "jsonwsp/response", "version": "1.0", "result": "test-result"}
         ),
         connection=ConnectionFactory.build(),
@@ -95,7 +113,7 @@ async def test_send_request_fault():
         mirror={"mirror": "test-mirror"},
     )
     context = InteractionContext(
-        socket=MockWebSocketApp(
+        socket=MockTransport(
             {
                 "type": "jsonwsp/fault",
                 "version": "1.0",
@@ -1,10 +1,19 @@
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from aiohttp import web
 
 from pyogmios_client.exceptions import RequestError
+from pyogmios_client import http_session
+from pyogmios_client.http_session import close_session, get_session
 from pyogmios_client.models.server_health_model import ServerHealth
-from pyogmios_client.server_health import get_server_health
+from pyogmios_client.server_health import (
+    Address,
+    Connection,
+    Options,
+    get_server_health,
+)
 
 
 @pytest.mark.asyncio
@@ -37,3 +46,105 @@ async def test_get_server_health_error_cases(mock_server_health_options):
         with pytest.raises(RequestError) as exc_info:
             await get_server_health(mock_server_health_options)
         assert str(exc_info.value) == f"Request error: {status_code}"
+
+
+@pytest.mark.asyncio
+async def test_get_server_health_reuses_fresh_health(
+    fake_server_health, mock_server_health_options
+):
+    # Arrange
+    options = mock_server_health_options.model_copy(update={"max_age": 60})
+    mock_get = AsyncMock()
+    mock_get.__aenter__.return_value.status = 200
+    mock_get.__aenter__.return_value.json.return_value = fake_server_health
+    with patch.dict("pyogmios_client.server_health._health_cache", clear=True), patch(
+        "aiohttp.ClientSession.get", return_value=mock_get
+    ) as get:
+        # Act
+        first, second = await asyncio.gather(
+            get_server_health(options), get_server_health(options)
+        )
+        third = await get_server_health(options)
+
+        # Assert
+        assert first == second == third
+        assert get.call_count == 1
+        await get_server_health(mock_server_health_options)
+        assert get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_session_is_shared_per_loop():
+    # Act
+    session = get_session()
+
+    # Assert
+    assert get_session() is session
+    await close_session()
+    assert session.closed
+    assert get_session() is not session
+    await close_session()
+    assert asyncio.get_running_loop() not in http_session._sessions
+
+
+def test_session_is_closed_with_each_event_loop():
+    # Arrange
+    sessions = []
+
+    async def check():
+        sessions.append(get_session())
+
+    # Act
+    for shutdown in (True, True, False):
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(check())
+        if shutdown:
+            # As asyncio.run does before closing its loop
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            assert sessions[-1].closed
+        loop.close()
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(check())
+    loop.run_until_complete(close_session())
+    loop.close()
+
+    # Assert
+    assert len(set(map(id, sessions))) == 4
+    assert all(session.closed for session in sessions)
+    assert not http_session._sessions
+
+
+@pytest.mark.asyncio
+async def test_sequential_health_checks_reuse_connection(fake_server_health):
+    # Arrange
+    peers = []
+
+    async def health(request):
+        peers.append(request.transport.get_extra_info("peername"))
+        return web.json_response(fake_server_health)
+
+    app = web.Application()
+    app.router.add_get("/health", health)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    address = Address(
+        http=f"http://127.0.0.1:{port}", webSocket=f"ws://127.0.0.1:{port}"
+    )
+    options = Options(
+        connection=Connection(
+            host="127.0.0.1", port=port, tls=False, max_payload=1000, address=address
+        )
+    )
+
+    # Act
+    for _ in range(5):
+        await get_server_health(options)
+
+    # Assert
+    assert len(peers) == 5
+    assert len(set(peers)) == 1
+    await close_session()
+    await runner.cleanup()
@@ -0,0 +1,88 @@
+"""
+Test the transport module.
+"""
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import web, WSMsgType
+
+from pyogmios_client.exceptions import WebSocketClosedError
+from pyogmios_client.transport import AiohttpTransport
+
+
+async def echo_handler(request):
+    web_socket = web.WebSocketResponse()
+    await web_socket.prepare(request)
+    async for message in web_socket:
+        if message.type is WSMsgType.TEXT:
+            if message.data == "close":
+                await web_socket.close(message=b"bye")
+            else:
+                await web_socket.send_str(message.data)
+    return web_socket
+
+
+@pytest_asyncio.fixture
+async def echo_server():
+    app = web.Application()
+    app.router.add_get("/", echo_handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"ws://127.0.0.1:{port}/"
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_transport_send_receive(echo_server):
+    # Arrange
+    transport = await AiohttpTransport.connect(echo_server, 1024 * 1024)
+
+    # Act
+    await transport.send("ping")
+    message = await transport.receive()
+
+    # Assert
+    assert message == "ping"
+    assert transport.connected
+    await transport.close()
+    assert not transport.connected
+
+
+@pytest.mark.asyncio
+async def test_transport_receive_does_not_block_loop(echo_server):
+    # Arrange
+    transport = await AiohttpTransport.connect(echo_server, 1024 * 1024)
+    receiving = asyncio.ensure_future(transport.receive())
+
+    # Act
+    await asyncio.sleep(0.01)
+    ticked = not receiving.done()
+    await transport.send("pong")
+
+    # Assert
+    assert ticked
+    assert await receiving == "pong"
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_transport_server_close(echo_server):
+    # Arrange
+    closes = []
+    transport = await AiohttpTransport.connect(
+        echo_server,
+        1024 * 1024,
+        close_handler=lambda _, code, reason: closes.append((code, reason)),
+    )
+
+    # Act & Assert
+    await transport.send("close")
+    with pytest.raises(WebSocketClosedError):
+        await transport.receive()
+    assert closes == [(1000, "bye")]
+    with pytest.raises(WebSocketClosedError):
+        await transport.send("ping")